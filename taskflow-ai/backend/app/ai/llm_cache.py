@@ -0,0 +1,315 @@
+"""
+TaskFlow AI - LLM Response Cache
+
+Following Backend Template Epic 4: Advanced Business Logic
+- Cache keyed on model, normalized prompt and request parameters
+- In-process LRU tier in front of a persistent tier (SQLite or Redis)
+- Per-endpoint TTLs and hit-rate metrics
+"""
+
+import asyncio
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict, defaultdict
+from typing import Any, Dict, List, Optional
+
+import structlog
+
+from app.core.config import settings
+
+logger = structlog.get_logger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_prompt(text: str) -> str:
+    """
+    Canonical form of prompt text for cache keys
+
+    Unicode-normalizes and collapses whitespace, so prompts that differ
+    only in spacing share an entry. Case is kept: answers echo titles,
+    names and acronyms ("US" vs "us"), and entries are shared across users.
+    Anything that changes the answer (reference date, timezone, ...) must
+    be part of the prompt or the parameters, never dropped here.
+    """
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFKC", text)).strip()
+
+
+def llm_cache_key(model: str, messages: List[Dict[str, str]], params: Dict[str, Any]) -> str:
+    """Stable key for a chat completion request"""
+    canonical = json.dumps(
+        {
+            "model": model,
+            "messages": [[m["role"], normalize_prompt(m["content"])] for m in messages],
+            "params": params,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class MemoryCacheTier:
+    """Per-process LRU of responses with per-entry expiry"""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: str, value: str, expires_at: float) -> None:
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCacheTier:
+    """
+    Persistent responses in a local SQLite file shared by the workers on a host
+
+    Calls run in a thread so file I/O never blocks the event loop. Entries
+    beyond max_entries are evicted least recently used first.
+    """
+
+    # Evict at most once per this many writes
+    EVICT_EVERY = 100
+
+    def __init__(self, path: str, max_entries: int):
+        self.path = path
+        self.max_entries = max_entries
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._writes = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, check_same_thread=False, timeout=5)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache ("
+                " key TEXT PRIMARY KEY,"
+                " value TEXT NOT NULL,"
+                " expires_at REAL NOT NULL,"
+                " accessed_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS ix_llm_cache_accessed_at ON llm_cache (accessed_at)")
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def _get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT value FROM llm_cache WHERE key = ? AND expires_at > ?", (key, now)
+            ).fetchone()
+            if row is not None:
+                conn.execute("UPDATE llm_cache SET accessed_at = ? WHERE key = ?", (now, key))
+                conn.commit()
+        return row[0] if row else None
+
+    def _put(self, key: str, value: str, expires_at: float) -> None:
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, value, expires_at, now),
+            )
+            self._writes += 1
+            if self._writes % self.EVICT_EVERY == 0:
+                conn.execute("DELETE FROM llm_cache WHERE expires_at <= ?", (now,))
+                conn.execute(
+                    "DELETE FROM llm_cache WHERE key IN ("
+                    " SELECT key FROM llm_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                )
+            conn.commit()
+
+    async def get(self, key: str) -> Optional[str]:
+        return await asyncio.to_thread(self._get, key)
+
+    async def put(self, key: str, value: str, expires_at: float) -> None:
+        await asyncio.to_thread(self._put, key, value, expires_at)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class RedisCacheTier:
+    """
+    Persistent responses in Redis, shared by all workers
+
+    Expiry uses Redis TTLs; the size bound is Redis' maxmemory policy
+    (use allkeys-lru or volatile-lru). The client is imported lazily.
+    """
+
+    def __init__(self, url: str, key_prefix: str = "llm:"):
+        self.url = url
+        self.key_prefix = key_prefix
+        self._client = None
+
+    def _get_client(self):
+        if self._client is None:
+            import redis.asyncio as redis
+
+            self._client = redis.from_url(self.url)
+        return self._client
+
+    async def get(self, key: str) -> Optional[str]:
+        value = await self._get_client().get(self.key_prefix + key)
+        return value.decode("utf-8") if value is not None else None
+
+    async def put(self, key: str, value: str, expires_at: float) -> None:
+        ttl = max(1, int(expires_at - time.time()))
+        await self._get_client().set(self.key_prefix + key, value, ex=ttl)
+
+    def close(self) -> None:
+        pass
+
+
+class LLMResponseCache:
+    """
+    Two-tier cache of LLM responses
+
+    Lookups try the in-process tier, then the persistent tier (promoting
+    hits into memory). A failing persistent tier is logged and treated as
+    a miss so the LLM call still goes through.
+    """
+
+    def __init__(
+        self,
+        memory: MemoryCacheTier,
+        persistent=None,
+        ttls: Optional[Dict[str, int]] = None,
+        default_ttl: int = 3600,
+    ):
+        self.memory = memory
+        self.persistent = persistent
+        self.ttls = ttls or {}
+        self.default_ttl = default_ttl
+        self._stats: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: {"memory_hits": 0, "persistent_hits": 0, "misses": 0, "errors": 0}
+        )
+
+    def ttl_for(self, endpoint: str) -> int:
+        """TTL in seconds for responses of an endpoint"""
+        return self.ttls.get(endpoint, self.default_ttl)
+
+    async def get(self, endpoint: str, key: str) -> Optional[str]:
+        """Return a cached response, or None"""
+        stats = self._stats[endpoint]
+
+        value = self.memory.get(key)
+        if value is not None:
+            stats["memory_hits"] += 1
+            return value
+
+        if self.persistent is not None:
+            try:
+                value = await self.persistent.get(key)
+            except Exception as e:
+                stats["errors"] += 1
+                logger.warning("llm_cache_read_failed", endpoint=endpoint, error=str(e))
+                value = None
+            if value is not None:
+                stats["persistent_hits"] += 1
+                # Promote with a short memory lifetime; the persistent tier owns expiry
+                self.memory.put(key, value, time.time() + min(self.ttl_for(endpoint), 60))
+                return value
+
+        stats["misses"] += 1
+        return None
+
+    async def put(self, endpoint: str, key: str, value: str) -> None:
+        """Store a response for the endpoint's TTL"""
+        ttl = self.ttl_for(endpoint)
+        if ttl <= 0:
+            return
+
+        expires_at = time.time() + ttl
+        self.memory.put(key, value, expires_at)
+
+        if self.persistent is not None:
+            try:
+                await self.persistent.put(key, value, expires_at)
+            except Exception as e:
+                self._stats[endpoint]["errors"] += 1
+                logger.warning("llm_cache_write_failed", endpoint=endpoint, error=str(e))
+
+    def metrics(self) -> Dict[str, Any]:
+        """Snapshot of cache metrics for monitoring"""
+        endpoints = {}
+        for endpoint, stats in self._stats.items():
+            hits = stats["memory_hits"] + stats["persistent_hits"]
+            lookups = hits + stats["misses"]
+            endpoints[endpoint] = {
+                **stats,
+                "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            }
+        return {
+            "memory_size": len(self.memory),
+            "memory_max_size": self.memory.max_size,
+            "persistent_backend": type(self.persistent).__name__ if self.persistent else None,
+            "endpoints": endpoints,
+        }
+
+    def close(self) -> None:
+        """Release the persistent tier"""
+        if self.persistent is not None:
+            self.persistent.close()
+
+
+def create_llm_cache() -> LLMResponseCache:
+    """Build the configured LLM response cache"""
+    backend = settings.LLM_CACHE_BACKEND.lower()
+    if backend == "redis":
+        persistent = RedisCacheTier(settings.REDIS_URL)
+    elif backend == "sqlite":
+        persistent = SQLiteCacheTier(settings.LLM_CACHE_SQLITE_PATH, settings.LLM_CACHE_MAX_ENTRIES)
+    else:
+        persistent = None
+
+    return LLMResponseCache(
+        memory=MemoryCacheTier(settings.LLM_CACHE_MEMORY_MAX_SIZE),
+        persistent=persistent,
+        ttls=settings.LLM_CACHE_TTLS,
+        default_ttl=settings.LLM_CACHE_DEFAULT_TTL_SECONDS,
+    )
+
+
+# Global LLM response cache instance
+llm_cache = create_llm_cache()
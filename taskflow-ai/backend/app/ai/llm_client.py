@@ -0,0 +1,226 @@
+"""
+TaskFlow AI - LLM Client
+
+Following Backend Template Epic 4: Advanced Business Logic
+- Chat completions against settings.OPENAI_MODEL
+- Response cache in front of every call
+- Outbound calls governed by the LLM dispatcher (concurrency, coalescing, batching)
+- Prompts trimmed to the context window; per-user token usage recorded
+- Local stand-in backend for development and tests (no network, no API key)
+"""
+
+import asyncio
+import hashlib
+import json
+import re
+from typing import Any, Dict, List, Optional
+
+import structlog
+
+from app.ai.llm_cache import LLMResponseCache, llm_cache, llm_cache_key
+from app.ai.llm_dispatcher import LLMDispatcher
+from app.ai.token_budget import TokenCounter, token_counter
+from app.core.config import settings
+from app.services.token_usage import TokenUsageRecorder, token_usage_recorder
+
+logger = structlog.get_logger(__name__)
+
+_NUMBERED_ITEM = re.compile(r"^\d+\. ", re.MULTILINE)
+
+
+class OpenAIBackend:
+    """Chat completions via the OpenAI API (client imported lazily)"""
+
+    def __init__(self, api_key: str):
+        self.api_key = api_key
+        self._client = None
+
+    def _get_client(self):
+        if self._client is None:
+            from openai import AsyncOpenAI
+
+            self._client = AsyncOpenAI(api_key=self.api_key)
+        return self._client
+
+    async def complete(self, model: str, messages: List[Dict[str, str]], **params: Any) -> str:
+        response = await self._get_client().chat.completions.create(
+            model=model,
+            messages=messages,
+            **params,
+        )
+        return response.choices[0].message.content or ""
+
+
+class LocalLLMBackend:
+    """
+    Deterministic stand-in for the OpenAI API
+
+    Returns a JSON document derived from the request, so callers, caching
+    and tests run without network access or an API key. Counts calls and
+    peak concurrency, and can simulate provider latency, so cache and
+    dispatcher behaviour can be observed.
+    """
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.calls = 0
+        self.active = 0
+        self.peak_active = 0
+
+    async def complete(self, model: str, messages: List[Dict[str, str]], **params: Any) -> str:
+        self.calls += 1
+        self.active += 1
+        self.peak_active = max(self.peak_active, self.active)
+        try:
+            if self.latency:
+                await asyncio.sleep(self.latency)
+        finally:
+            self.active -= 1
+
+        prompt = messages[-1]["content"] if messages else ""
+        if messages and '"results"' in messages[0]["content"]:
+            # Batched prompt: one answer per numbered item
+            items = _NUMBERED_ITEM.split(prompt)[1:]
+            return json.dumps({"results": [f"[local {model}] {item.strip()[:40]}" for item in items]})
+
+        digest = hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:12]
+        return json.dumps({
+            "items": [f"[local {model} {digest}] {prompt[:80]}"],
+            "model": model,
+        })
+
+
+class LLMClient:
+    """
+    Cached chat completions for the AI endpoints
+
+    Requests are keyed on model, normalized messages and parameters; each
+    endpoint caches for its own TTL (LLM_CACHE_TTLS). Prompts are trimmed
+    so prompt plus completion fit the context window. Cache misses go
+    through the dispatcher, which bounds concurrency globally and per user,
+    and their token usage is recorded for the requesting user.
+
+    Following Epic 4 - AI integration
+    """
+
+    def __init__(
+        self,
+        dispatcher: LLMDispatcher,
+        cache: Optional[LLMResponseCache],
+        model: str,
+        max_tokens: int,
+        context_window: int,
+        counter: TokenCounter,
+        usage: Optional[TokenUsageRecorder] = None,
+    ):
+        self.dispatcher = dispatcher
+        self.cache = cache
+        self.model = model
+        self.max_tokens = max_tokens
+        self.context_window = context_window
+        self.counter = counter
+        self.usage = usage
+
+    @property
+    def backend(self):
+        return self.dispatcher.backend
+
+    async def complete(
+        self,
+        endpoint: str,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.0,
+        max_tokens: Optional[int] = None,
+        use_cache: bool = True,
+        user_id: Any = None,
+    ) -> str:
+        """Return the completion text for messages, from cache when possible"""
+        params = {"temperature": temperature, "max_tokens": max_tokens or self.max_tokens}
+        messages = self.counter.fit_messages(messages, self.context_window - params["max_tokens"])
+        key = llm_cache_key(self.model, messages, params) if self.cache and use_cache else None
+
+        if key is not None:
+            cached = await self.cache.get(endpoint, key)
+            if cached is not None:
+                return cached
+
+        content = await self.dispatcher.complete(self.model, messages, user_id=user_id, **params)
+
+        if key is not None:
+            await self.cache.put(endpoint, key, content)
+        if self.usage is not None and user_id is not None:
+            self.usage.record(
+                user_id, endpoint, self.counter.count_messages(messages), self.counter.count(content),
+            )
+
+        return content
+
+    async def classify(
+        self,
+        endpoint: str,
+        instruction: str,
+        text: str,
+        max_tokens: Optional[int] = None,
+        use_cache: bool = True,
+        user_id: Any = None,
+    ) -> str:
+        """
+        Answer a short classification prompt, micro-batched with concurrent ones
+
+        Cached per item under the same key a single (instruction, text)
+        completion would use, so batched and unbatched answers are shared.
+        A batched call holds a concurrency slot for each of its users, and
+        each item is charged an equal share of its tokens.
+        """
+        params = {"temperature": 0.0, "max_tokens": max_tokens or self.max_tokens}
+        messages = LLMDispatcher._single_messages(instruction, text)
+        key = llm_cache_key(self.model, messages, params) if self.cache and use_cache else None
+
+        if key is not None:
+            cached = await self.cache.get(endpoint, key)
+            if cached is not None:
+                return cached
+
+        result = await self.dispatcher.classify(self.model, instruction, text, user_id=user_id, **params)
+        content = result.answer
+
+        if key is not None:
+            await self.cache.put(endpoint, key, content)
+        if self.usage is not None and user_id is not None:
+            self.usage.record(
+                user_id,
+                endpoint,
+                round(sum(self.counter.count_messages(call.messages) / call.items for call in result.calls)),
+                round(sum(self.counter.count(call.content) / call.items for call in result.calls)),
+            )
+
+        return content
+
+
+def create_llm_backend():
+    """OpenAI when configured, otherwise the local stand-in"""
+    if settings.LLM_PROVIDER.lower() == "openai" and settings.OPENAI_API_KEY:
+        return OpenAIBackend(settings.OPENAI_API_KEY)
+
+    if settings.LLM_PROVIDER.lower() == "openai":
+        logger.warning("openai_api_key_missing_using_local_llm")
+    return LocalLLMBackend()
+
+
+# Global LLM client instance
+llm_client = LLMClient(
+    dispatcher=LLMDispatcher(
+        backend=create_llm_backend(),
+        max_concurrency=settings.LLM_MAX_CONCURRENCY,
+        per_user_concurrency=settings.LLM_PER_USER_CONCURRENCY,
+        queue_timeout=settings.LLM_QUEUE_TIMEOUT_SECONDS,
+        batch_window=settings.LLM_BATCH_WINDOW_MS / 1000,
+        max_batch_size=settings.LLM_BATCH_MAX_SIZE,
+    ),
+    cache=llm_cache if settings.LLM_CACHE_ENABLED else None,
+    model=settings.OPENAI_MODEL,
+    max_tokens=settings.OPENAI_MAX_TOKENS,
+    context_window=settings.LLM_CONTEXT_WINDOW,
+    counter=token_counter,
+    usage=token_usage_recorder,
+)
@@ -0,0 +1,367 @@
+"""
+TaskFlow AI - LLM Request Dispatcher
+
+Following Backend Template Epic 4: Advanced Business Logic
+- Global and per-user concurrency limits for outbound LLM calls
+- Coalescing of identical in-flight requests
+- Micro-batching of small classification prompts into one call
+- Queueing metrics for monitoring
+"""
+
+import asyncio
+import json
+import re
+import statistics
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+import structlog
+
+from app.ai.llm_cache import llm_cache_key
+
+logger = structlog.get_logger(__name__)
+
+BATCH_INSTRUCTIONS = (
+    "\n\nYou will receive several numbered items. Apply the instructions to each "
+    'item separately and reply with JSON only: {"results": [<answer for item 1>, ...]} '
+    "with exactly one answer per item, in order, each in the format asked for above."
+)
+
+_NEWLINES = re.compile(r"\s*\n\s*")
+
+
+class LLMQueueTimeout(Exception):
+    """A request waited longer than the queue timeout for a slot"""
+    pass
+
+
+@dataclass
+class SharedCall:
+    """An outbound call made for classify() items and how many items shared it"""
+    messages: List[Dict[str, str]]
+    content: str
+    items: int
+
+
+@dataclass
+class Classification:
+    """A classify() answer and the calls that produced it, for usage accounting"""
+    answer: str
+    calls: List[SharedCall]
+
+
+class LLMDispatcher:
+    """
+    Governs outbound calls to an LLM backend
+
+    Every call takes a slot for each user it serves (one, or every user
+    with an item in a batch) and then a global slot, so one user cannot occupy the whole provider budget and
+    the total stays under the provider's concurrency limit. Requests that
+    wait longer than queue_timeout fail fast with LLMQueueTimeout.
+
+    Identical requests already in flight share one call. Classification
+    prompts sent through classify() are collected for batch_window seconds
+    (or until max_batch_size) and answered with a single call.
+    """
+
+    def __init__(
+        self,
+        backend,
+        max_concurrency: int,
+        per_user_concurrency: int,
+        queue_timeout: float,
+        batch_window: float,
+        max_batch_size: int,
+    ):
+        self.backend = backend
+        self.max_concurrency = max_concurrency
+        self.per_user_concurrency = per_user_concurrency
+        self.queue_timeout = queue_timeout
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+
+        self._global = asyncio.Semaphore(max_concurrency)
+        self._users: Dict[Any, List] = {}  # user_id -> [semaphore, holders]
+        self._inflight: Dict[str, Tuple[asyncio.Task, List[float]]] = {}  # key -> (call, [start time])
+        self._batches: Dict[Tuple[str, str, str], List[Tuple[str, Any, float, asyncio.Future]]] = {}
+        self._batch_timers: Dict[Tuple[str, str, str], asyncio.TimerHandle] = {}
+        self._batch_tasks: Set[asyncio.Task] = set()
+
+        self._waits_ms: Deque[float] = deque(maxlen=1000)
+        self.queued = 0
+        self.active = 0
+        self.peak_active = 0
+        self.calls = 0
+        self.coalesced = 0
+        self.rejected = 0
+        self.batches = 0
+        self.batched_items = 0
+        self.batch_fallbacks = 0
+
+    async def complete(
+        self,
+        model: str,
+        messages: List[Dict[str, str]],
+        user_id: Any = None,
+        **params: Any,
+    ) -> str:
+        """Completion text for messages; identical in-flight requests share one call"""
+        return await self._call(model, messages, [user_id], params)
+
+    async def _call(
+        self,
+        model: str,
+        messages: List[Dict[str, str]],
+        user_ids: List[Any],
+        params: Dict[str, Any],
+        enqueued: Optional[List[float]] = None,
+    ) -> str:
+        """
+        One outbound call, shared with identical calls in flight
+
+        enqueued holds when each caller served by this call asked for it
+        (now, when not given); every one of them adds a queue wait sample
+        once the call has started, or once it was rejected for want of a
+        slot (about queue_timeout).
+        """
+        if enqueued is None:
+            enqueued = [time.perf_counter()]
+        key = llm_cache_key(model, messages, params)
+
+        entry = self._inflight.get(key)
+        if entry is None:
+            started: List[float] = []
+            task = asyncio.ensure_future(
+                self._run(user_ids, lambda: self.backend.complete(model, messages, **params), started)
+            )
+            entry = self._inflight[key] = (task, started)
+            task.add_done_callback(lambda t: self._finish_inflight(key, t))
+        else:
+            self.coalesced += 1
+
+        task, started = entry
+        try:
+            # Shielded so a cancelled caller does not cancel the call others wait on
+            return await asyncio.shield(task)
+        finally:
+            if started:
+                # Joining a call that is already under way is no wait at all
+                self._waits_ms.extend(max(0.0, started[0] - t) * 1000 for t in enqueued)
+            elif task.done() and not task.cancelled() and isinstance(task.exception(), LLMQueueTimeout):
+                rejected_at = time.perf_counter()
+                self._waits_ms.extend((rejected_at - t) * 1000 for t in enqueued)
+
+    async def classify(
+        self, model: str, instruction: str, text: str, user_id: Any = None, **params: Any
+    ) -> Classification:
+        """
+        Answer instruction for one short text, batched with concurrent calls
+
+        Items sharing model, instruction and parameters within the batch
+        window go out as one numbered prompt, which holds a slot for every
+        user with an item in it. If the reply cannot be split into one
+        answer per item, each item is retried on its own. The answer comes
+        with the calls spent on it, so usage can be charged per item.
+        """
+        loop = asyncio.get_running_loop()
+        key = (model, instruction, json.dumps(params, sort_keys=True, default=str))
+        future = loop.create_future()
+
+        batch = self._batches.setdefault(key, [])
+        batch.append((text, user_id, time.perf_counter(), future))
+        if len(batch) >= self.max_batch_size:
+            self._flush_batch(key)
+        elif len(batch) == 1:
+            self._batch_timers[key] = loop.call_later(self.batch_window, self._flush_batch, key)
+
+        return await future
+
+    def _finish_inflight(self, key: str, task: asyncio.Task) -> None:
+        entry = self._inflight.get(key)
+        if entry is not None and entry[0] is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # mark retrieved; waiters re-raise it themselves
+
+    def _user_slot(self, user_id: Any) -> Optional[asyncio.Semaphore]:
+        if user_id is None or self.per_user_concurrency <= 0:
+            return None
+        entry = self._users.get(user_id)
+        if entry is None:
+            entry = self._users[user_id] = [asyncio.Semaphore(self.per_user_concurrency), 0]
+        entry[1] += 1
+        return entry[0]
+
+    def _release_user(self, user_id: Any) -> None:
+        entry = self._users.get(user_id)
+        if entry is not None:
+            entry[1] -= 1
+            if entry[1] <= 0:
+                del self._users[user_id]
+
+    async def _acquire(self, user_slots: List[asyncio.Semaphore]) -> None:
+        """Take the user slots, then a global slot; releases what it holds if cancelled"""
+        held = []
+        try:
+            for slot in user_slots:
+                await slot.acquire()
+                held.append(slot)
+            await self._global.acquire()
+        except BaseException:
+            for slot in held:
+                slot.release()
+            raise
+
+    def _release_users(self, users: List[Any]) -> None:
+        for user_id in users:
+            self._release_user(user_id)
+
+    async def _run(self, user_ids: List[Any], call: Callable[[], Awaitable[str]], started: List[float]) -> str:
+        # Always taken in the same order, so two batches cannot each hold a slot the other needs
+        users = sorted({u for u in user_ids if u is not None}, key=str)
+        user_slots = [slot for slot in map(self._user_slot, users) if slot is not None]
+        users = users if user_slots else []
+        self.queued += 1
+        try:
+            await asyncio.wait_for(self._acquire(user_slots), timeout=self.queue_timeout)
+        except BaseException as e:
+            self._release_users(users)
+            if not isinstance(e, asyncio.TimeoutError):
+                raise
+            self.rejected += 1
+            logger.warning("llm_queue_timeout", queued=self.queued, active=self.active)
+            raise LLMQueueTimeout(f"No LLM slot within {self.queue_timeout}s") from None
+        finally:
+            self.queued -= 1
+
+        started.append(time.perf_counter())
+        self.calls += 1
+        self.active += 1
+        self.peak_active = max(self.peak_active, self.active)
+        try:
+            return await call()
+        finally:
+            self.active -= 1
+            self._global.release()
+            for slot in user_slots:
+                slot.release()
+            self._release_users(users)
+
+    def _flush_batch(self, key: Tuple[str, str, str]) -> None:
+        timer = self._batch_timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._batches.pop(key, None)
+        if batch:
+            task = asyncio.ensure_future(self._send_batch(key, batch))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+
+    async def _send_batch(
+        self, key: Tuple[str, str, str], batch: List[Tuple[str, Any, float, asyncio.Future]]
+    ) -> None:
+        model, instruction, params_json = key
+        params = json.loads(params_json)
+
+        if len(batch) == 1:
+            text, user_id, enqueued, future = batch[0]
+            await self._settle(future, self._classify_one(model, instruction, text, user_id, params, [enqueued], []))
+            return
+
+        self.batches += 1
+        self.batched_items += len(batch)
+        numbered = "\n".join(f"{i + 1}. {_NEWLINES.sub(' ', text)}" for i, (text, *_) in enumerate(batch))
+        messages = [
+            {"role": "system", "content": instruction + BATCH_INSTRUCTIONS},
+            {"role": "user", "content": numbered},
+        ]
+
+        try:
+            content = await self._call(
+                model, messages, [item[1] for item in batch], params, [item[2] for item in batch],
+            )
+        except Exception as e:
+            for *_, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        shared = SharedCall(messages, content, len(batch))
+        results = self._split_results(content, len(batch))
+        if results is not None:
+            for (*_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(Classification(result, [shared]))
+            return
+
+        # Unusable batch reply: answer each item on its own (their waits were recorded above)
+        self.batch_fallbacks += 1
+        logger.warning("llm_batch_reply_unusable", items=len(batch))
+        await asyncio.gather(*(
+            self._settle(future, self._classify_one(model, instruction, text, user_id, params, [], [shared]))
+            for text, user_id, _, future in batch
+        ))
+
+    async def _classify_one(
+        self,
+        model: str,
+        instruction: str,
+        text: str,
+        user_id: Any,
+        params: Dict[str, Any],
+        enqueued: List[float],
+        earlier: List[SharedCall],
+    ) -> Classification:
+        """Answer one item with its own call; earlier are calls already spent on it"""
+        messages = self._single_messages(instruction, text)
+        content = await self._call(model, messages, [user_id], params, enqueued)
+        return Classification(content, earlier + [SharedCall(messages, content, 1)])
+
+    @staticmethod
+    def _single_messages(instruction: str, text: str) -> List[Dict[str, str]]:
+        return [
+            {"role": "system", "content": instruction},
+            {"role": "user", "content": text},
+        ]
+
+    @staticmethod
+    def _split_results(content: str, expected: int) -> Optional[List[str]]:
+        try:
+            results = json.loads(content).get("results")
+        except (ValueError, AttributeError):
+            return None
+        if not isinstance(results, list) or len(results) != expected:
+            return None
+        return [r if isinstance(r, str) else json.dumps(r) for r in results]
+
+    @staticmethod
+    async def _settle(future: asyncio.Future, call: Awaitable[Any]) -> None:
+        try:
+            result = await call
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+        else:
+            if not future.done():
+                future.set_result(result)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Snapshot of dispatcher metrics for monitoring"""
+        waits = list(self._waits_ms)
+        return {
+            "max_concurrency": self.max_concurrency,
+            "per_user_concurrency": self.per_user_concurrency,
+            "queued": self.queued,
+            "active": self.active,
+            "peak_active": self.peak_active,
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "rejected": self.rejected,
+            "batches": self.batches,
+            "batched_items": self.batched_items,
+            "batch_fallbacks": self.batch_fallbacks,
+            "wait_ms_p50": round(statistics.median(waits), 3) if waits else 0.0,
+            "wait_ms_p95": round(statistics.quantiles(waits, n=20)[18], 3) if len(waits) >= 2 else None,
+        }
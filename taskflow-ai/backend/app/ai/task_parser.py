@@ -0,0 +1,447 @@
+"""
+TaskFlow AI - Natural Language Task Parser
+
+Following Backend Template Epic 4: Advanced Business Logic
+- Deterministic parsing of quick-add text ("review PR friday 3pm #backend !high")
+- Dates, times, recurrence, tags, priority and project references
+- Confidence score deciding whether the LLM is needed at all
+"""
+
+import json
+import re
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta, timezone
+from typing import List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+WEEKDAYS = {
+    "mon": 0, "monday": 0,
+    "tue": 1, "tues": 1, "tuesday": 1,
+    "wed": 2, "wednesday": 2,
+    "thu": 3, "thur": 3, "thurs": 3, "thursday": 3,
+    "fri": 4, "friday": 4,
+    "sat": 5, "saturday": 5,
+    "sun": 6, "sunday": 6,
+}
+RRULE_DAYS = ("MO", "TU", "WE", "TH", "FR", "SA", "SU")
+
+MONTHS = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "sept": 9, "oct": 10, "nov": 11, "dec": 12,
+}
+
+NUMBER_WORDS = {
+    "a": 1, "an": 1, "one": 1, "two": 2, "three": 3, "four": 4, "five": 5,
+    "six": 6, "seven": 7, "eight": 8, "nine": 9, "ten": 10,
+}
+
+PRIORITY_WORDS = {
+    "high": 1, "h": 1, "1": 1, "urgent": 1, "asap": 1,
+    "medium": 2, "med": 2, "m": 2, "2": 2,
+    "low": 3, "l": 3, "3": 3,
+}
+
+PART_OF_DAY = {"morning": 9, "noon": 12, "afternoon": 14, "evening": 18, "tonight": 20, "night": 20}
+
+_WEEKDAY = r"(?:mon(?:day)?|tue(?:s(?:day)?)?|wed(?:nesday)?|thu(?:r(?:s(?:day)?)?)?|fri(?:day)?|sat(?:urday)?|sun(?:day)?)"
+_MONTH = (r"(?:jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?"
+          r"|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)\.?")
+_NUMBER = r"(?:\d+|an?|one|two|three|four|five|six|seven|eight|nine|ten)"
+_DUE = r"(?:(?:due|by|on|before)\s+)?"
+
+# One master pattern; each alternative is a named token kind. Alternatives are
+# tried left to right at every position, so longer phrases come first.
+_TOKEN_PATTERNS: List[Tuple[str, str]] = [
+    ("RECURRENCE", rf"(?:every|each)\s+(?:other\s+|{_NUMBER}\s+)?"
+                   rf"(?:days?|weekdays?|weeks?|months?|years?|{_WEEKDAY})"
+                   r"|daily|weekly|monthly|yearly|annually|weekdays"),
+    ("RELATIVE", rf"{_DUE}in\s+{_NUMBER}\s+(?:min(?:ute)?s?|h(?:ou)?rs?|days?|weeks?|months?)"),
+    ("DAY_WORD", rf"{_DUE}(?:the\s+)?day\s+after\s+tomorrow|{_DUE}(?:today|tonight|tomorrow|tmrw|tmr)"),
+    ("PERIOD", rf"{_DUE}(?:next\s+(?:week|month|year)|end\s+of\s+(?:the\s+)?(?:day|week|month)|eod|eow|eom"
+               r"|(?:this\s+|next\s+)?weekend)"),
+    ("WEEKDAY", rf"{_DUE}(?:(?:this|next)\s+)?{_WEEKDAY}"),
+    ("ISO_DATE", rf"{_DUE}\d{{4}}-\d{{2}}-\d{{2}}"),
+    ("MONTH_DAY", rf"{_DUE}{_MONTH}\s+\d{{1,2}}(?:st|nd|rd|th)?(?:,?\s+\d{{4}})?"),
+    ("DAY_MONTH", rf"{_DUE}(?:the\s+)?\d{{1,2}}(?:st|nd|rd|th)?\s+(?:of\s+)?{_MONTH}(?:\s+\d{{4}})?"),
+    ("NUMERIC_DATE", rf"{_DUE}\d{{1,2}}/\d{{1,2}}(?:/\d{{2}}(?:\d{{2}})?)?"),
+    ("TIME", r"(?:at\s+|@\s*)?\d{1,2}(?::\d{2})?\s*(?:am|pm)"
+             r"|(?:at\s+|@\s*)?(?:[01]?\d|2[0-3]):[0-5]\d"
+             r"|(?:at\s+)?(?:noon|midnight)"
+             r"|(?:in\s+the\s+|this\s+)?(?:morning|afternoon|evening)"),
+    ("BARE_TIME", r"at\s+\d{1,2}"),
+    ("PRIORITY", r"!(?:high|medium|med|low|[hml123])|!{1,3}|p[123]|urgent|asap"),
+    ("TAG", r"#[\w-]+"),
+    ("PROJECT", r"@[\w-]+|\+[\w-]+|project:[\w-]+"),
+    ("VAGUE", r"soon|later|sometime|someday|eventually|whenever"
+              r"|(?:after|until|once|when)\s+(?:the\s+|my\s+|i\s+)?\w+"),
+]
+
+_TOKENIZER = re.compile(
+    "|".join(rf"(?P<{kind}>(?<![\w#@+!/:-])(?:{pattern})(?![\w/-]))" for kind, pattern in _TOKEN_PATTERNS),
+    re.IGNORECASE,
+)
+
+_LEADING_FILLER = re.compile(r"^\s*(?:remind\s+me\s+to|i\s+(?:need|have)\s+to|don'?t\s+forget\s+to|todo:?)\s+", re.IGNORECASE)
+_DANGLING_CONNECTOR = re.compile(r"(?:\s+(?:due|by|on|at|before|from|for|and|,|-))+\s*$", re.IGNORECASE)
+# Date-looking words the tokenizer could not place ("may" and "march" are too often verbs)
+_LEFTOVER_DATE_HINT = re.compile(
+    r"\b(?:\d{1,2}(?:st|nd|rd|th)|jan(?:uary)?|feb(?:ruary)?|apr(?:il)?|june?|july?|aug(?:ust)?"
+    r"|sept?(?:ember)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?|(?:by|before|in|until)\s+(?:march|may))\b",
+    re.IGNORECASE,
+)
+_WHITESPACE = re.compile(r"\s+")
+_DIGITS = re.compile(r"\d+")
+
+
+@dataclass
+class ParsedTask:
+    """Structured fields extracted from quick-add text"""
+    title: str
+    due_date: Optional[datetime] = None  # UTC
+    priority: Optional[int] = None       # 1=High, 2=Medium, 3=Low
+    tags: List[str] = field(default_factory=list)
+    project: Optional[str] = None        # project name as referenced
+    recurrence: Optional[str] = None     # RFC 5545 RRULE, e.g. "FREQ=WEEKLY;BYDAY=FR"
+    confidence: float = 1.0
+    source: str = "local"
+
+
+class TaskParser:
+    """
+    Tokenizer-based parser for quick-add task text
+
+    A single precompiled pattern splits the text into typed tokens (dates,
+    times, recurrence, tags, priority, project references); whatever is
+    left becomes the title. Each ambiguity found along the way (vague
+    phrasing, conflicting dates, day/month order, a bare "at 5") lowers
+    the confidence so callers can escalate only the inputs that need it.
+
+    Following Epic 4 - Natural language task parsing
+    """
+
+    # Hour used when a date is given without a time
+    DEFAULT_DUE_HOUR = 17
+
+    # Confidence deducted per ambiguity
+    PENALTIES = {
+        "vague": 0.4,
+        "conflict": 0.35,
+        "leftover_date": 0.35,
+        "day_month_order": 0.35,
+        "bare_time": 0.15,
+        "next_weekday": 0.1,
+        "weekend": 0.1,
+    }
+
+    def parse(self, text: str, now: Optional[datetime] = None, tz: str = "UTC") -> ParsedTask:
+        """Parse text relative to now (defaults to the current time) in timezone tz"""
+        zone = ZoneInfo(tz)
+        now = (now or datetime.now(timezone.utc)).astimezone(zone).replace(microsecond=0)
+
+        day: Optional[date] = None
+        at: Optional[time] = None
+        default_at: Optional[time] = None
+        exact: Optional[datetime] = None
+        priority: Optional[int] = None
+        project: Optional[str] = None
+        recurrence: Optional[str] = None
+        recurrence_day: Optional[int] = None
+        tags: List[str] = []
+        penalties: List[str] = []
+        kept: List[str] = []
+        position = 0
+
+        for match in _TOKENIZER.finditer(text):
+            kind = match.lastgroup
+            value = match.group(kind)
+            lowered = _WHITESPACE.sub(" ", value.lower())
+
+            if kind == "VAGUE":
+                # Vague phrases stay in the title; they only lower confidence
+                penalties.append("vague")
+                continue
+
+            kept.append(text[position:match.start()])
+            position = match.end()
+
+            if kind == "TAG":
+                tag = value[1:].lower()
+                if tag not in tags:
+                    tags.append(tag)
+            elif kind == "PROJECT":
+                if project is not None:
+                    penalties.append("conflict")
+                project = value.split(":", 1)[1] if value.lower().startswith("project:") else value[1:]
+            elif kind == "PRIORITY":
+                if priority is not None:
+                    penalties.append("conflict")
+                priority = self._priority(lowered)
+            elif kind == "RECURRENCE":
+                if recurrence is not None:
+                    penalties.append("conflict")
+                recurrence, recurrence_day = self._recurrence(lowered)
+            elif kind in ("TIME", "BARE_TIME"):
+                if at is not None or exact is not None:
+                    penalties.append("conflict")
+                at = self._time(lowered, penalties)
+            else:
+                if day is not None or exact is not None:
+                    penalties.append("conflict")
+                resolved = self._date(kind, lowered, now, penalties)
+                if isinstance(resolved, datetime):
+                    exact = resolved
+                else:
+                    day = resolved
+                    if lowered.endswith("tonight"):
+                        default_at = time(PART_OF_DAY["tonight"])
+
+        kept.append(text[position:])
+
+        title = _WHITESPACE.sub(" ", " ".join(kept)).strip(" ,;-")
+        title = _LEADING_FILLER.sub("", title)
+        title = _DANGLING_CONNECTOR.sub("", title).strip(" ,;-")
+        if _LEFTOVER_DATE_HINT.search(title):
+            penalties.append("leftover_date")
+
+        if recurrence_day is not None:
+            if day is None and exact is None:
+                day = self._next_weekday(now.date(), recurrence_day)
+            elif day is not None and day.weekday() != recurrence_day:
+                penalties.append("conflict")  # e.g. "every tue and thu"
+
+        due_date = exact
+        if due_date is None and (day is not None or at is not None):
+            if day is None:
+                # Time alone: the next time that clock time comes round
+                day = now.date() if at > now.time().replace(tzinfo=None) else now.date() + timedelta(days=1)
+            due_date = datetime.combine(day, at or default_at or time(self.DEFAULT_DUE_HOUR), tzinfo=zone)
+
+        confidence = 0.0 if not title else 1.0 - sum(self.PENALTIES[p] for p in penalties)
+
+        return ParsedTask(
+            title=title[:255],
+            due_date=due_date.astimezone(timezone.utc) if due_date else None,
+            priority=priority,
+            tags=tags,
+            project=project,
+            recurrence=recurrence,
+            confidence=round(min(max(confidence, 0.0), 1.0), 2),
+        )
+
+    @staticmethod
+    def _strip_due(value: str) -> str:
+        for prefix in ("due ", "by ", "on ", "before "):
+            if value.startswith(prefix):
+                return value[len(prefix):]
+        return value
+
+    @staticmethod
+    def _number(word: str) -> int:
+        return int(word) if word.isdigit() else NUMBER_WORDS[word]
+
+    @staticmethod
+    def _next_weekday(today: date, weekday: int) -> date:
+        return today + timedelta(days=(weekday - today.weekday()) % 7)
+
+    @staticmethod
+    def _upcoming(today: date, month: int, day: int, year: Optional[int]) -> date:
+        """The given month/day, rolled into next year when already past"""
+        resolved = date(year or today.year, month, day)
+        if year is None and resolved < today:
+            resolved = date(today.year + 1, month, day)
+        return resolved
+
+    def _priority(self, value: str) -> int:
+        if value.startswith("p") and value[1:].isdigit():
+            return int(value[1:])
+        if set(value) == {"!"}:
+            return 4 - len(value)  # !!! high, !! medium, ! low
+        return PRIORITY_WORDS[value.lstrip("!")]
+
+    def _recurrence(self, value: str) -> Tuple[str, Optional[int]]:
+        words = value.split()
+        if len(words) == 1:
+            return {
+                "daily": "FREQ=DAILY",
+                "weekly": "FREQ=WEEKLY",
+                "monthly": "FREQ=MONTHLY",
+                "yearly": "FREQ=YEARLY",
+                "annually": "FREQ=YEARLY",
+                "weekdays": "FREQ=WEEKLY;BYDAY=MO,TU,WE,TH,FR",
+            }[value], None
+
+        interval = 1
+        unit = words[-1]
+        if words[1] == "other":
+            interval = 2
+        elif len(words) == 3:
+            interval = self._number(words[1])
+
+        suffix = f";INTERVAL={interval}" if interval > 1 else ""
+        if unit in WEEKDAYS:
+            weekday = WEEKDAYS[unit]
+            return f"FREQ=WEEKLY{suffix};BYDAY={RRULE_DAYS[weekday]}", weekday
+        if unit.startswith("weekday"):
+            return "FREQ=WEEKLY;BYDAY=MO,TU,WE,TH,FR", None
+
+        freq = {"day": "DAILY", "week": "WEEKLY", "month": "MONTHLY", "year": "YEARLY"}[unit.rstrip("s")]
+        return f"FREQ={freq}{suffix}", None
+
+    def _time(self, value: str, penalties: List[str]) -> time:
+        value = value.replace("@", " ").replace("at ", " ").strip()
+        if value in ("noon", "midnight"):
+            return time(12) if value == "noon" else time(0)
+        for part, hour in PART_OF_DAY.items():
+            if value.endswith(part):
+                return time(hour)
+
+        hour, minute = (int(n) for n in (_DIGITS.findall(value) + ["0"])[:2])
+        if value.endswith("pm") and hour < 12:
+            hour += 12
+        elif value.endswith("am") and hour == 12:
+            hour = 0
+        elif not value.endswith(("am", "pm")) and ":" not in value:
+            # "at 5": assume working hours, but it could be either
+            penalties.append("bare_time")
+            if 1 <= hour <= 7:
+                hour += 12
+        if hour > 23 or minute > 59:
+            penalties.append("conflict")
+            return time(self.DEFAULT_DUE_HOUR)
+        return time(hour, minute)
+
+    def _date(self, kind: str, value: str, now: datetime, penalties: List[str]):
+        """Resolve a date token to a date, or a datetime for sub-day offsets"""
+        today = now.date()
+        value = self._strip_due(value)
+
+        if kind == "DAY_WORD":
+            if value.endswith("after tomorrow"):
+                return today + timedelta(days=2)
+            return today + timedelta(days=0 if value in ("today", "tonight") else 1)
+
+        if kind == "RELATIVE":
+            _, amount, unit = value.split()
+            amount = self._number(amount)
+            if unit.startswith("m") and not unit.startswith("mo"):
+                return now + timedelta(minutes=amount)
+            if unit.startswith("h"):
+                return now + timedelta(hours=amount)
+            if unit.startswith("mo"):
+                month_index = today.month - 1 + amount
+                year, month = today.year + month_index // 12, month_index % 12 + 1
+                return self._clamped(year, month, today.day)
+            return today + timedelta(days=amount * (7 if unit.startswith("w") else 1))
+
+        if kind == "PERIOD":
+            if value.endswith("weekend"):
+                penalties.append("weekend")
+                saturday = self._next_weekday(today, 5)
+                return saturday + timedelta(days=7) if value.startswith("next") else saturday
+            if value == "next week":
+                return today + timedelta(days=7 - today.weekday())
+            if value == "next month":
+                return date(today.year + today.month // 12, today.month % 12 + 1, 1)
+            if value == "next year":
+                return date(today.year + 1, 1, 1)
+            if value in ("eod", "end of day", "end of the day"):
+                return today
+            if value in ("eow", "end of week", "end of the week"):
+                return self._next_weekday(today, 4)
+            return self._clamped(today.year, today.month, 31)  # end of month
+
+        if kind == "WEEKDAY":
+            words = value.split()
+            weekday = WEEKDAYS[words[-1]]
+            resolved = self._next_weekday(today, weekday)
+            if words[0] == "next":
+                # "next friday" is read both ways; take the coming one, a week out when that is today
+                penalties.append("next_weekday")
+                if resolved == today:
+                    resolved += timedelta(days=7)
+            return resolved
+
+        if kind == "ISO_DATE":
+            try:
+                return date.fromisoformat(value)
+            except ValueError:
+                penalties.append("conflict")
+                return None
+
+        numbers = [int(n) for n in _DIGITS.findall(value)]
+        try:
+            if kind in ("MONTH_DAY", "DAY_MONTH"):
+                month = next(MONTHS[w[:3]] for w in value.split() if w[:3] in MONTHS)
+                year = numbers[1] if len(numbers) > 1 else None
+                return self._upcoming(today, month, numbers[0], year)
+
+            # NUMERIC_DATE: month/day unless the first part can only be a day
+            first, second = numbers[0], numbers[1]
+            year = numbers[2] if len(numbers) > 2 else None
+            if year is not None and year < 100:
+                year += 2000
+            if first > 12:
+                first, second = second, first
+            elif second <= 12 and first != second:
+                penalties.append("day_month_order")
+            return self._upcoming(today, first, second, year)
+        except (ValueError, StopIteration, KeyError):
+            penalties.append("conflict")
+            return None
+
+    @staticmethod
+    def _clamped(year: int, month: int, day: int) -> date:
+        """date(), with day clamped to the length of the month"""
+        while True:
+            try:
+                return date(year, month, day)
+            except ValueError:
+                day -= 1
+
+
+def merge_llm_result(parsed: ParsedTask, content: str) -> ParsedTask:
+    """
+    Overlay fields from an LLM reply on a local parse
+
+    Fields missing or invalid in the reply keep the local value; an
+    unusable reply returns the local parse unchanged.
+    """
+    try:
+        data = json.loads(content)
+    except ValueError:
+        return parsed
+    if not isinstance(data, dict) or not isinstance(data.get("title"), str) or not data["title"].strip():
+        return parsed
+
+    merged = ParsedTask(
+        title=data["title"].strip()[:255],
+        due_date=parsed.due_date,
+        priority=parsed.priority,
+        tags=parsed.tags,
+        project=parsed.project,
+        recurrence=parsed.recurrence,
+        confidence=parsed.confidence,
+        source="llm",
+    )
+
+    due = data.get("due_date")
+    if isinstance(due, str) and due:
+        try:
+            value = datetime.fromisoformat(due.replace("Z", "+00:00"))
+            merged.due_date = (value if value.tzinfo else value.replace(tzinfo=timezone.utc)).astimezone(timezone.utc)
+        except ValueError:
+            pass
+    if data.get("priority") in (1, 2, 3):
+        merged.priority = data["priority"]
+    if isinstance(data.get("tags"), list):
+        merged.tags = [str(tag).lstrip("#").lower() for tag in data["tags"] if tag]
+    if isinstance(data.get("project"), str) and data["project"]:
+        merged.project = data["project"].lstrip("@+")
+    if isinstance(data.get("recurrence"), str) and data["recurrence"].upper().startswith("FREQ="):
+        merged.recurrence = data["recurrence"].upper()
+
+    return merged
+
+
+# Global task parser instance
+task_parser = TaskParser()
@@ -0,0 +1,181 @@
+"""
+TaskFlow AI - Token Budget
+
+Following Backend Template Epic 4: Advanced Business Logic
+- One shared tiktoken encoder, loaded once in a worker thread
+- Memoized token counts for recurring prompt fragments
+- Prompt trimming to the context window with a binary search over lines
+"""
+
+import asyncio
+import bisect
+import itertools
+import math
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+import structlog
+
+from app.core.config import settings
+
+logger = structlog.get_logger(__name__)
+
+
+class TokenCounter:
+    """
+    Counts chat prompt tokens the way the OpenAI API bills them
+
+    The encoder is loaded once (warm() at startup, or on first use) and
+    shared. Until it is available, or if tiktoken cannot load, counts fall
+    back to a conservative characters-per-token estimate. Counts of texts up
+    to max_cached_chars are memoized, so system prompts and other recurring
+    fragments are encoded once.
+    """
+
+    # Chat format overhead per message and for the reply priming
+    TOKENS_PER_MESSAGE = 3
+    TOKENS_PER_REPLY = 3
+    # Estimate used without an encoder; errs towards overcounting
+    CHARS_PER_TOKEN = 3
+
+    def __init__(self, model: str, cache_size: int = 4096, max_cached_chars: int = 2000):
+        self.model = model
+        self.cache_size = cache_size
+        self.max_cached_chars = max_cached_chars
+
+        self._encoder = None
+        self._loaded = False
+        self._load_lock = threading.Lock()
+        self._warming: Optional[asyncio.Task] = None
+        self._counts: "OrderedDict[str, int]" = OrderedDict()
+        self._counts_lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.estimated = 0
+
+    def load(self) -> None:
+        """Load the encoder (blocking; idempotent)"""
+        if self._loaded:
+            return
+        with self._load_lock:
+            if self._loaded:
+                return
+            try:
+                import tiktoken
+
+                try:
+                    self._encoder = tiktoken.encoding_for_model(self.model)
+                except KeyError:
+                    self._encoder = tiktoken.get_encoding("cl100k_base")
+                logger.info("token_encoder_loaded", model=self.model, encoding=self._encoder.name)
+            except Exception as e:
+                logger.warning("token_encoder_unavailable_using_estimate", error=str(e))
+            self._loaded = True
+
+    async def warm(self) -> None:
+        """Load the encoder in a worker thread"""
+        await asyncio.to_thread(self.load)
+
+    def warm_in_background(self) -> None:
+        """Start loading the encoder without delaying the caller"""
+        if self._warming is None and not self._loaded:
+            self._warming = asyncio.ensure_future(self.warm())
+
+    @property
+    def exact(self) -> bool:
+        """Whether counts come from the real encoder"""
+        return self._encoder is not None
+
+    def count(self, text: str) -> int:
+        """Tokens in text"""
+        if not text:
+            return 0
+        if self._encoder is None:
+            self.estimated += 1
+            return math.ceil(len(text) / self.CHARS_PER_TOKEN)
+
+        cacheable = len(text) <= self.max_cached_chars
+        if cacheable:
+            with self._counts_lock:
+                cached = self._counts.get(text)
+                if cached is not None:
+                    self._counts.move_to_end(text)
+                    self.hits += 1
+                    return cached
+
+        tokens = len(self._encoder.encode(text, disallowed_special=()))
+
+        if cacheable:
+            with self._counts_lock:
+                self.misses += 1
+                self._counts[text] = tokens
+                while len(self._counts) > self.cache_size:
+                    self._counts.popitem(last=False)
+        return tokens
+
+    def count_messages(self, messages: List[Dict[str, str]]) -> int:
+        """Prompt tokens of a chat request"""
+        return self.TOKENS_PER_REPLY + sum(
+            self.TOKENS_PER_MESSAGE + self.count(m["content"]) for m in messages
+        )
+
+    def fit_lines(self, lines: List[str], budget: int) -> int:
+        """
+        How many leading lines fit in budget tokens (newline-joined)
+
+        Each line is counted once (memoized), then the cut-off is found by
+        binary search over the running totals rather than by re-encoding
+        ever shorter prompts.
+        """
+        totals = list(itertools.accumulate(self.count(line) + 1 for line in lines))  # +1 for the newline
+        return bisect.bisect_right(totals, budget)
+
+    def trim_text(self, text: str, budget: int) -> str:
+        """Leading part of text that fits in budget tokens"""
+        if budget <= 0:
+            return ""
+        if self._encoder is None:
+            return text[:budget * self.CHARS_PER_TOKEN]
+        tokens = self._encoder.encode(text, disallowed_special=())
+        return text if len(tokens) <= budget else self._encoder.decode(tokens[:budget])
+
+    def fit_messages(self, messages: List[Dict[str, str]], max_prompt_tokens: int) -> List[Dict[str, str]]:
+        """
+        Messages trimmed to max_prompt_tokens
+
+        Earlier messages (system prompt, instructions) are kept whole; the
+        last message, which carries the variable context, loses trailing
+        lines until the prompt fits.
+        """
+        if not messages or self.count_messages(messages) <= max_prompt_tokens:
+            return messages
+
+        *head, last = messages
+        budget = max_prompt_tokens - self.count_messages(head) - self.TOKENS_PER_MESSAGE
+        lines = last["content"].split("\n")
+        keep = self.fit_lines(lines, budget)
+
+        if keep:
+            content = "\n".join(lines[:keep])
+        else:
+            content = self.trim_text(lines[0], budget)
+
+        logger.info("llm_prompt_trimmed", kept_lines=keep, total_lines=len(lines), budget=max_prompt_tokens)
+        return [*head, {**last, "content": content}]
+
+    def metrics(self) -> Dict[str, Any]:
+        """Snapshot of counter metrics for monitoring"""
+        lookups = self.hits + self.misses
+        return {
+            "encoder": self._encoder.name if self._encoder is not None else None,
+            "loaded": self._loaded,
+            "memo_size": len(self._counts),
+            "memo_hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "estimated_counts": self.estimated,
+        }
+
+
+# Global token counter instance
+token_counter = TokenCounter(settings.OPENAI_MODEL, cache_size=settings.TOKEN_COUNT_CACHE_SIZE)
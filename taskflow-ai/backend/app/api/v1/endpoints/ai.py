@@ -1,16 +1,281 @@
 """
 TaskFlow AI - AI-Powered Features Endpoints
 
-Placeholder for AI-powered features
 Following Backend Template Epic 4: Advanced Business Logic
+- Local vectorized backlog prioritization, LLM only for near ties
+- Local quick-add parsing, LLM only for low-confidence input
+- AI task suggestions and productivity insights
+- LLM responses served through the shared response cache
 """
 
-from fastapi import APIRouter
+import asyncio
+import json
+from dataclasses import asdict
+from datetime import datetime, timezone
+from typing import Any, List, Sequence
+from zoneinfo import ZoneInfo
 
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+import structlog
+
+from app.ai.llm_client import llm_client
+from app.ai.llm_dispatcher import LLMQueueTimeout
+from app.ai.task_parser import merge_llm_result, task_parser
+from app.auth.dependencies import get_current_user
+from app.core.config import settings
+from app.db.database import get_async_db
+from app.models.task import Task
+from app.schemas.ai import (
+    InsightsResponse,
+    PrioritizedTask,
+    PrioritizeRequest,
+    PrioritizeResponse,
+    TaskParseRequest,
+    TaskParseResponse,
+    TaskSuggestionRequest,
+    TaskSuggestionResponse,
+)
+from app.services.user_stats import OPEN_TASK_STATUSES, AsyncUserStatsService
+
+logger = structlog.get_logger(__name__)
 router = APIRouter()
 
-# TODO: Implement AI-powered endpoints
-# - POST /ai/prioritize - AI task prioritization
-# - POST /ai/suggest - AI task suggestions
-# - POST /ai/parse - Natural language task parsing
-# - GET /ai/insights - AI-powered productivity insights
+PRIORITIZE_SYSTEM_PROMPT = (
+    "You order tasks by what should be done first. The tasks scored almost "
+    'the same on urgency and importance. Reply with JSON only: {"order": [task numbers, first to last]}'
+)
+
+PARSE_SYSTEM_PROMPT = (
+    "You turn a to-do note into task fields. Resolve relative dates against the "
+    "reference date and timezone given. Reply with JSON only: "
+    '{"title": "...", "due_date": "ISO 8601 with offset or null", "priority": 1-3 or null '
+    '(1=high), "tags": ["..."], "project": "name or null", "recurrence": "RRULE or null"}'
+)
+
+SUGGEST_SYSTEM_PROMPT = (
+    "You help people get tasks done. Suggest up to 5 short, concrete next steps "
+    'for the task. Reply with JSON only: {"items": ["..."]}'
+)
+
+INSIGHTS_SYSTEM_PROMPT = (
+    "You are a productivity coach. Given task statistics, give up to 3 short, "
+    'actionable insights. Reply with JSON only: {"items": ["..."]}'
+)
+
+
+def _parse_items(content: str) -> List[str]:
+    """Read the items list from a JSON reply, falling back to one item per line"""
+    try:
+        items = json.loads(content).get("items")
+        if isinstance(items, list):
+            return [str(item) for item in items if item]
+    except (ValueError, AttributeError):
+        pass
+    return [line.strip("-• ").strip() for line in content.splitlines() if line.strip()]
+
+
+async def _complete(endpoint: str, messages, user_id=None) -> str:
+    """Cached LLM call, mapping a full queue to 503 and upstream failures to 502"""
+    try:
+        return await llm_client.complete(endpoint, messages, user_id=user_id)
+    except LLMQueueTimeout:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="AI service busy, try again shortly",
+        )
+    except Exception as e:
+        logger.error("llm_request_failed", endpoint=endpoint, error=str(e))
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail="AI service unavailable",
+        )
+
+
+def _rank_backlog(rows: Sequence, request: PrioritizeRequest):
+    """Build features, score and rank (CPU-bound, runs in a thread)"""
+    # Imported on first use: NumPy is the heaviest import in the API process
+    from app.ai.prioritization import build_features, prioritization_engine
+
+    features = build_features(rows, request.project_weights, request.dependency_counts)
+    scores = prioritization_engine.score(features)
+    return features, scores, prioritization_engine.rank(scores, request.limit)
+
+
+async def _review_ties(titles: List[str], user_id) -> List[int]:
+    """Ask the LLM to order near-tied tasks; returns a permutation of their positions"""
+    numbered = "\n".join(f"{i + 1}. {title}" for i, title in enumerate(titles))
+    content = await _complete("prioritize", [
+        {"role": "system", "content": PRIORITIZE_SYSTEM_PROMPT},
+        {"role": "user", "content": numbered},
+    ], user_id)
+
+    try:
+        order = [int(n) - 1 for n in json.loads(content)["order"]]
+    except (ValueError, KeyError, TypeError):
+        return list(range(len(titles)))
+
+    # Only accept a complete permutation
+    if sorted(order) != list(range(len(titles))):
+        return list(range(len(titles)))
+    return order
+
+
+@router.post("/prioritize", response_model=PrioritizeResponse)
+async def prioritize(
+    request: PrioritizeRequest,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user),
+) -> Any:
+    """
+    Rank the current user's open tasks
+
+    The whole backlog is scored locally in one vectorized pass. The LLM is
+    only consulted to order the first run of near-tied items in the top
+    results, and its answer is cached.
+
+    Following Epic 4 - AI task prioritization
+    """
+    rows = (
+        await db.execute(
+            select(
+                Task.id,
+                Task.title,
+                Task.priority,
+                Task.status,
+                Task.due_date,
+                Task.project_id,
+                Task.created_at,
+            )
+            .where(Task.user_id == current_user.id, Task.status.in_(OPEN_TASK_STATUSES))
+            .limit(settings.PRIORITIZE_MAX_BACKLOG)
+        )
+    ).all()
+
+    features, scores, ranked = await asyncio.to_thread(_rank_backlog, rows, request)
+    ranked = ranked.tolist()
+
+    ai_reviewed = 0
+    if request.use_ai and len(ranked) > 1:
+        from app.ai.prioritization import prioritization_engine
+
+        start, end = prioritization_engine.ambiguous_span(
+            scores[ranked], settings.PRIORITIZE_TIE_TOLERANCE, settings.PRIORITIZE_MAX_AI_ITEMS,
+        )
+        if end - start > 1:
+            tied = ranked[start:end]
+            order = await _review_ties([features.titles[i] for i in tied], current_user.id)
+            ranked[start:end] = [tied[i] for i in order]
+            ai_reviewed = len(tied)
+
+    return PrioritizeResponse(
+        items=[
+            PrioritizedTask(
+                id=features.ids[i],
+                title=features.titles[i],
+                score=round(float(scores[i]), 4),
+                rank=position + 1,
+            )
+            for position, i in enumerate(ranked)
+        ],
+        total_tasks=len(features),
+        ai_reviewed=ai_reviewed,
+    )
+
+
+@router.post("/parse", response_model=TaskParseResponse)
+async def parse(
+    request: TaskParseRequest,
+    current_user=Depends(get_current_user),
+) -> Any:
+    """
+    Parse quick-add text into task fields
+
+    Parsed locally first; only inputs the local parser is unsure about
+    (confidence below TASK_PARSER_CONFIDENCE_THRESHOLD) are sent to the
+    LLM. The prompt carries the reference date rather than the time, so
+    escalated inputs stay cacheable for the day, and concurrent escalations
+    are batched into one call. An unavailable LLM falls back to the local
+    result.
+
+    Following Epic 4 - Natural language task parsing
+    """
+    now = datetime.now(timezone.utc)
+    tz = request.timezone or (current_user.preferences or {}).get("timezone") or "UTC"
+    try:
+        parsed = task_parser.parse(request.text, now=now, tz=tz)
+    except (KeyError, ValueError):  # unknown timezone stored in preferences
+        tz = "UTC"
+        parsed = task_parser.parse(request.text, now=now, tz=tz)
+
+    if parsed.confidence < settings.TASK_PARSER_CONFIDENCE_THRESHOLD:
+        local_now = now.astimezone(ZoneInfo(tz))
+        try:
+            content = await llm_client.classify(
+                "parse",
+                PARSE_SYSTEM_PROMPT,
+                f"Reference date: {local_now:%A %Y-%m-%d}\nTimezone: {tz}\nText: {request.text}",
+                user_id=current_user.id,
+            )
+            parsed = merge_llm_result(parsed, content)
+        except Exception as e:
+            logger.warning("task_parse_llm_failed", error=str(e))
+
+    return TaskParseResponse(**asdict(parsed))
+
+
+@router.post("/suggest", response_model=TaskSuggestionResponse)
+async def suggest(
+    request: TaskSuggestionRequest,
+    current_user=Depends(get_current_user),
+) -> Any:
+    """
+    Suggest next steps for a task
+
+    The prompt carries nothing user-specific, so identical tasks across
+    users share cached responses.
+
+    Following Epic 4 - AI task suggestions
+    """
+    user_prompt = f"Task: {request.title}"
+    if request.description:
+        user_prompt += f"\nDetails: {request.description}"
+
+    content = await _complete("suggest", [
+        {"role": "system", "content": SUGGEST_SYSTEM_PROMPT},
+        {"role": "user", "content": user_prompt},
+    ], current_user.id)
+
+    return TaskSuggestionResponse(suggestions=_parse_items(content)[:5])
+
+
+@router.get("/insights", response_model=InsightsResponse)
+async def insights(
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user),
+) -> Any:
+    """
+    Productivity insights from the user's task statistics
+
+    Built from the stats rollup; the completion rate is rounded so users
+    with similar statistics share cached responses.
+
+    Following Epic 4 - AI-powered productivity insights
+    """
+    stats = await AsyncUserStatsService(db).get_stats(current_user.id)
+
+    user_prompt = (
+        f"Total tasks: {stats.total_tasks}\n"
+        f"Completed tasks: {stats.completed_tasks}\n"
+        f"Completion rate: {round(stats.completion_rate * 20) * 5}%\n"
+        f"Active projects: {stats.active_projects}\n"
+        f"Current streak: {stats.streak_days} days"
+    )
+
+    content = await _complete("insights", [
+        {"role": "system", "content": INSIGHTS_SYSTEM_PROMPT},
+        {"role": "user", "content": user_prompt},
+    ], current_user.id)
+
+    return InsightsResponse(insights=_parse_items(content)[:3], stats=stats)
@@ -4,25 +4,31 @@ TaskFlow AI - Authentication Endpoints
 Following Backend Template Epic 1: Authentication & Security Foundation
 - User registration and login endpoints
 - JWT token management and refresh
+- Session tracking, rotation and logout
 - Password reset functionality
 """
 
 from datetime import timedelta
-from typing import Any
+from typing import Any, Optional
+from uuid import uuid4
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
+from app.core.hashing import HashingPoolSaturated
 from app.core.security import (
     create_access_token,
+    create_password_reset_token,
     create_refresh_token,
+    get_session_id,
     verify_password,
     get_password_hash,
     verify_token,
 )
-from app.db.database import get_db
+from app.auth.dependencies import oauth2_scheme
+from app.db.database import get_async_db
 from app.models.user import User
 from app.schemas.auth import (
     UserCreate,
@@ -33,8 +39,9 @@ from app.schemas.auth import (
     PasswordReset,
     PasswordResetConfirm,
 )
-from app.services.user_service import UserService
+from app.services.user_service import AsyncUserService
 from app.services.email_service import EmailService
+from app.services.session_service import AsyncSessionService
 import structlog
 
 logger = structlog.get_logger(__name__)
@@ -44,7 +51,7 @@ router = APIRouter()
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 async def register(
     user_data: UserCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> Any:
     """
     Register a new user
@@ -56,10 +63,10 @@ async def register(
     """
     logger.info("user_registration_attempt", email=user_data.email)
     
-    user_service = UserService(db)
+    user_service = AsyncUserService(db)
     
     # Check if user already exists
-    existing_user = user_service.get_user_by_email(user_data.email)
+    existing_user = await user_service.get_user_by_email(user_data.email)
     if existing_user:
         logger.warning("registration_failed_user_exists", email=user_data.email)
         raise HTTPException(
@@ -69,12 +76,11 @@ async def register(
     
     # Create new user
     try:
-        user = user_service.create_user(user_data)
+        user = await user_service.create_user(user_data)
         logger.info("user_registration_success", user_id=str(user.id), email=user.email)
         
-        # TODO: Send verification email
-        # email_service = EmailService()
-        # await email_service.send_verification_email(user)
+        # Queued in the outbox; delivery happens off the request path
+        await EmailService(db).send_verification_email(user)
         
         return UserResponse(
             id=user.id,
@@ -86,6 +92,8 @@ async def register(
             created_at=user.created_at,
         )
         
+    except HashingPoolSaturated:
+        raise
     except Exception as e:
         logger.error("user_registration_failed", email=user_data.email, error=str(e))
         raise HTTPException(
@@ -96,8 +104,9 @@ async def register(
 
 @router.post("/login", response_model=Token)
 async def login(
+    request: Request,
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> Any:
     """
     User login with email and password
@@ -109,10 +118,31 @@ async def login(
     """
     logger.info("user_login_attempt", email=form_data.username)
     
-    user_service = UserService(db)
+    user_service = AsyncUserService(db)
+    client_ip = request.client.host if request.client else None
+    
+    # Claim the attempt before spending a bcrypt verification; locked accounts
+    # are rejected, and concurrent guesses cannot all pass the check
+    claim = await user_service.claim_login_attempt(form_data.username, client_ip)
+    if claim is None:
+        logger.warning("login_failed_account_locked", email=form_data.username)
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many failed login attempts, please try again later",
+        )
     
     # Authenticate user
-    user = user_service.authenticate_user(form_data.username, form_data.password)
+    try:
+        user = await user_service.authenticate_user(
+            form_data.username,
+            form_data.password,
+            ip_address=client_ip,
+            user_agent=request.headers.get("user-agent"),
+            claim=claim,
+        )
+    except Exception:
+        await user_service.release_login_attempt(claim)
+        raise
     if not user:
         logger.warning("login_failed_invalid_credentials", email=form_data.username)
         raise HTTPException(
@@ -128,19 +158,27 @@ async def login(
             detail="Inactive user account"
         )
     
-    # Create tokens
+    # Create tokens bound to a new session
+    session_id = uuid4()
+    claims = {"sub": user.email, "user_id": str(user.id), "sid": str(session_id)}
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
-        data={"sub": user.email, "user_id": str(user.id)},
+        data=claims,
         expires_delta=access_token_expires
     )
     
-    refresh_token = create_refresh_token(
-        data={"sub": user.email, "user_id": str(user.id)}
+    refresh_token = create_refresh_token(data=claims)
+    
+    await AsyncSessionService(db).open(
+        session_id,
+        user.id,
+        refresh_token,
+        ip_address=client_ip,
+        user_agent=request.headers.get("user-agent"),
     )
     
     # Update last login
-    user_service.update_last_login(user.id)
+    await user_service.update_last_login(user.id)
     
     logger.info("user_login_success", user_id=str(user.id), email=user.email)
     
@@ -155,28 +193,49 @@ async def login(
 @router.post("/refresh", response_model=Token)
 async def refresh_token(
     token_data: TokenRefresh,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> Any:
     """
     Refresh access token using refresh token
     
+    The refresh token is rotated: the session accepts only the newest one,
+    and presenting an older one revokes the session. Tokens issued before
+    session tracking carry no session and are rejected; their users log in
+    again.
+    
     Following Epic 1 - JWT/Session token management and refresh
     """
     try:
-        # Verify refresh token
+        # Verify refresh token (revoked sessions are rejected here)
         payload = verify_token(token_data.refresh_token)
         email = payload.get("sub")
         user_id = payload.get("user_id")
         
-        if not email or not user_id:
+        if not email or not user_id or payload.get("type") != "refresh":
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid refresh token"
+            )
+        
+        # Without a session the token could not be rotated, so it would stay reusable
+        session_id = get_session_id(payload)
+        if session_id is None:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid refresh token"
             )
         
+        session_service = AsyncSessionService(db)
+        session = await session_service.get_active(session_id)
+        if session is None or str(session.user_id) != user_id:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Session expired or revoked"
+            )
+        
         # Get user
-        user_service = UserService(db)
-        user = user_service.get_user_by_email(email)
+        user_service = AsyncUserService(db)
+        user = await user_service.get_user_by_email(email)
         
         if not user or not user.is_active:
             raise HTTPException(
@@ -185,15 +244,20 @@ async def refresh_token(
             )
         
         # Create new tokens
+        claims = {"sub": user.email, "user_id": str(user.id), "sid": str(session_id)}
         access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
         access_token = create_access_token(
-            data={"sub": user.email, "user_id": str(user.id)},
+            data=claims,
             expires_delta=access_token_expires
         )
         
-        new_refresh_token = create_refresh_token(
-            data={"sub": user.email, "user_id": str(user.id)}
-        )
+        new_refresh_token = create_refresh_token(data=claims)
+        
+        if not await session_service.rotate(session, token_data.refresh_token, new_refresh_token):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Session expired or revoked"
+            )
         
         logger.info("token_refresh_success", user_id=str(user.id))
         
@@ -212,10 +276,41 @@ async def refresh_token(
         )
 
 
+@router.post("/logout")
+async def logout(
+    token: Optional[str] = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_async_db),
+) -> Any:
+    """
+    Revoke the session of the presented access token
+    
+    Its access and refresh tokens stop working immediately in this process
+    and within SESSION_REVOCATION_SYNC_SECONDS in the others.
+    
+    Following Epic 1 - JWT/Session token management
+    """
+    try:
+        payload = verify_token(token) if token else None
+    except ValueError:
+        payload = None
+    session_id = get_session_id(payload) if payload else None
+    if session_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    
+    await AsyncSessionService(db).revoke(session_id)
+    logger.info("user_logout", user_id=payload.get("user_id"), session_id=str(session_id))
+    
+    return {"message": "Logged out"}
+
+
 @router.post("/forgot-password")
 async def forgot_password(
     password_reset: PasswordReset,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> Any:
     """
     Request password reset
@@ -224,21 +319,16 @@ async def forgot_password(
     """
     logger.info("password_reset_request", email=password_reset.email)
     
-    user_service = UserService(db)
-    user = user_service.get_user_by_email(password_reset.email)
+    user_service = AsyncUserService(db)
+    user = await user_service.get_user_by_email(password_reset.email)
     
     if user:
         # Generate reset token
-        reset_token = create_access_token(
-            data={"sub": user.email, "type": "password_reset"},
-            expires_delta=timedelta(hours=1)  # Reset token expires in 1 hour
-        )
+        reset_token = create_password_reset_token(user.email)
         
-        # TODO: Send password reset email
-        # email_service = EmailService()
-        # await email_service.send_password_reset_email(user, reset_token)
+        await EmailService(db).send_password_reset_email(user, reset_token)
         
-        logger.info("password_reset_email_sent", email=password_reset.email)
+        logger.info("password_reset_email_queued", email=password_reset.email)
     else:
         # Don't reveal if email exists or not for security
         logger.warning("password_reset_unknown_email", email=password_reset.email)
@@ -249,7 +339,7 @@ async def forgot_password(
 @router.post("/reset-password")
 async def reset_password(
     password_reset_confirm: PasswordResetConfirm,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> Any:
     """
     Confirm password reset with token
@@ -269,8 +359,8 @@ async def reset_password(
             )
         
         # Update user password
-        user_service = UserService(db)
-        user = user_service.get_user_by_email(email)
+        user_service = AsyncUserService(db)
+        user = await user_service.get_user_by_email(email)
         
         if not user:
             raise HTTPException(
@@ -278,13 +368,16 @@ async def reset_password(
                 detail="User not found"
             )
         
-        # Update password
-        user_service.update_password(user.id, password_reset_confirm.new_password)
+        # Update password and sign out everywhere
+        await user_service.update_password(user.id, password_reset_confirm.new_password)
+        revoked = await AsyncSessionService(db).revoke_user_sessions(user.id)
         
-        logger.info("password_reset_success", user_id=str(user.id))
+        logger.info("password_reset_success", user_id=str(user.id), sessions_revoked=revoked)
         
         return {"message": "Password has been reset successfully"}
         
+    except HashingPoolSaturated:
+        raise
     except Exception as e:
         logger.error("password_reset_failed", error=str(e))
         raise HTTPException(
@@ -1,17 +1,167 @@
 """
 TaskFlow AI - Task Management Endpoints
 
-Placeholder for task management endpoints
 Following Backend Template Epic 3: Core Business Entities
+- Task CRUD endpoints
+- Keyset-paginated, streamed task listings
 """
 
-from fastapi import APIRouter
+import json
+from typing import Any, AsyncIterator, Optional
+from uuid import UUID
 
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+import structlog
+
+from app.auth.dependencies import get_current_user
+from app.core.config import settings
+from app.db.database import AsyncSessionLocal, get_async_db
+from app.schemas.task import TaskCreate, TaskPage, TaskResponse, TaskStatus, TaskUpdate
+from app.services.task_service import AsyncTaskService, TaskListing
+from app.utils.pagination import InvalidCursor
+
+logger = structlog.get_logger(__name__)
 router = APIRouter()
 
-# TODO: Implement task management endpoints
-# - GET /tasks - List user tasks with filtering/pagination
-# - POST /tasks - Create new task
-# - GET /tasks/{task_id} - Get specific task
-# - PUT /tasks/{task_id} - Update task
-# - DELETE /tasks/{task_id} - Delete task
+# Encoded list items buffered per response chunk
+STREAM_CHUNK_ROWS = 200
+
+
+def _task_summary_json(row: Row) -> str:
+    """Serialize a listing row as a TaskSummary JSON object"""
+    return json.dumps({
+        "id": str(row.id),
+        "title": row.title,
+        "status": row.status,
+        "priority": row.priority,
+        "due_date": row.due_date.isoformat() if row.due_date else None,
+        "project_id": str(row.project_id) if row.project_id else None,
+    })
+
+
+async def _stream_task_page(listing: TaskListing) -> AsyncIterator[str]:
+    """
+    Write a TaskPage body while rows arrive from the database
+
+    Uses its own session so the connection lives exactly as long as the
+    response body.
+    """
+    yield '{"items":['
+
+    async with AsyncSessionLocal() as db:
+        buffered = []
+        emitted = 0
+        previous_row = None
+        next_cursor = None
+
+        async for row in AsyncTaskService(db).stream_listing(listing):
+            if emitted + len(buffered) == listing.limit:
+                # The extra row only signals that another page exists
+                next_cursor = listing.next_cursor(previous_row)
+                break
+
+            buffered.append(_task_summary_json(row))
+            previous_row = row
+            if len(buffered) >= STREAM_CHUNK_ROWS:
+                yield ("," if emitted else "") + ",".join(buffered)
+                emitted += len(buffered)
+                buffered = []
+
+        if buffered:
+            yield ("," if emitted else "") + ",".join(buffered)
+
+    yield '],"next_cursor":' + json.dumps(next_cursor) + "}"
+
+
+@router.get("", response_model=TaskPage)
+async def list_tasks(
+    status_filter: Optional[TaskStatus] = Query(default=None, alias="status"),
+    project_id: Optional[UUID] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(default=50, ge=1, le=settings.TASK_PAGE_MAX_SIZE),
+    current_user=Depends(get_current_user),
+) -> Any:
+    """
+    List the current user's tasks, soonest due first
+
+    Pass next_cursor back as ?cursor= to fetch the following page; it is
+    null on the last page.
+
+    Following Epic 3 - Task listing with filtering and pagination
+    """
+    try:
+        listing = TaskListing(
+            user_id=current_user.id,
+            status=status_filter.value if status_filter else None,
+            project_id=project_id,
+            cursor=cursor,
+            limit=limit,
+        )
+    except InvalidCursor as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    return StreamingResponse(_stream_task_page(listing), media_type="application/json")
+
+
+@router.post("", response_model=TaskResponse, status_code=status.HTTP_201_CREATED)
+async def create_task(
+    task_data: TaskCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user),
+) -> Any:
+    """
+    Create a new task
+
+    Following Epic 3 - Task CRUD operations
+    """
+    return await AsyncTaskService(db).create_task(current_user.id, task_data)
+
+
+@router.get("/{task_id}", response_model=TaskResponse)
+async def get_task(
+    task_id: UUID,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user),
+) -> Any:
+    """Get a specific task"""
+    task = await AsyncTaskService(db).get_task(current_user.id, task_id)
+    if not task:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
+    return task
+
+
+@router.put("/{task_id}", response_model=TaskResponse)
+async def update_task(
+    task_id: UUID,
+    task_data: TaskUpdate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user),
+) -> Any:
+    """
+    Update a task
+
+    Following Epic 3 - Task CRUD operations
+    """
+    task = await AsyncTaskService(db).update_task(current_user.id, task_id, task_data)
+    if not task:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
+    return task
+
+
+@router.delete("/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_task(
+    task_id: UUID,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user),
+) -> Response:
+    """
+    Delete a task
+
+    Following Epic 3 - Task CRUD operations
+    """
+    if not await AsyncTaskService(db).delete_task(current_user.id, task_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
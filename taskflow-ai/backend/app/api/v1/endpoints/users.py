@@ -1,12 +1,33 @@
 """
 TaskFlow AI - User Management Endpoints
 
-Placeholder for user management endpoints
 Following Backend Template Epic 3: Core Business Entities
+- User profile management
+- Bulk account provisioning for organization onboarding
+- Dashboard statistics from maintained rollups
+- Weekly digest job trigger
 """
 
-from fastapi import APIRouter
+from typing import Any
 
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from sqlalchemy.ext.asyncio import AsyncSession
+import structlog
+
+from app.auth.dependencies import get_current_superuser, get_current_user
+from app.db.database import get_async_db
+from app.schemas.auth import UserStats
+from app.schemas.user import BulkProvisioningResponse
+from app.services.user_provisioning import (
+    UPLOAD_FORMATS,
+    AsyncUserProvisioningService,
+    ProvisioningFormatError,
+    parse_upload,
+)
+from app.services.user_stats import AsyncUserStatsService, user_stats_rebuilder
+from app.services.weekly_digest import weekly_digest_runner
+
+logger = structlog.get_logger(__name__)
 router = APIRouter()
 
 # TODO: Implement user management endpoints
@@ -14,3 +35,87 @@ router = APIRouter()
 # - PUT /users/me - Update current user profile
 # - GET /users/me/preferences - Get user preferences
 # - PUT /users/me/preferences - Update user preferences
+
+
+@router.post("/bulk", response_model=BulkProvisioningResponse)
+async def bulk_provision_users(
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_superuser),
+) -> Any:
+    """
+    Create many user accounts from a streamed upload (superusers only)
+
+    Body is CSV with an email,password[,first_name,last_name] header
+    (Content-Type: text/csv) or one JSON object per line
+    (Content-Type: application/x-ndjson). The body is parsed as it
+    arrives; the response reports per-row errors and throughput.
+
+    Following Epic 3 - User Management
+    """
+    media_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    upload_format = UPLOAD_FORMATS.get(media_type)
+    if upload_format is None:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Upload must be text/csv or application/x-ndjson",
+        )
+
+    logger.info("bulk_provisioning_started", user_id=str(current_user.id), format=upload_format)
+
+    service = AsyncUserProvisioningService(db)
+    try:
+        return await service.provision(parse_upload(upload_format, request.stream()))
+    except ProvisioningFormatError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.get("/me/stats", response_model=UserStats)
+async def get_my_stats(
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user),
+) -> Any:
+    """
+    Get the current user's task statistics
+
+    Read from the user's stats rollup row; no task aggregation.
+
+    Following Epic 3 - User dashboard statistics
+    """
+    return await AsyncUserStatsService(db).get_stats(current_user.id)
+
+
+@router.post("/stats/rebuild", status_code=status.HTTP_202_ACCEPTED)
+async def rebuild_user_stats(current_user=Depends(get_current_superuser)) -> Any:
+    """
+    Recompute all users' stats rollups from tasks in the background (superusers only)
+
+    Reconciles drift such as streaks left long after a completion was undone.
+    """
+    if not user_stats_rebuilder.start():
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A stats rebuild is already running",
+        )
+
+    logger.info("user_stats_rebuild_started", user_id=str(current_user.id))
+
+    return {"message": "Stats rebuild started"}
+
+
+@router.post("/digests/weekly", status_code=status.HTTP_202_ACCEPTED)
+async def run_weekly_digest(current_user=Depends(get_current_superuser)) -> Any:
+    """
+    Queue last week's digest emails in the background (superusers only)
+
+    Resumes an interrupted run from its checkpoint; a completed week is not sent again.
+    """
+    if not weekly_digest_runner.start():
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A digest run is already in progress",
+        )
+
+    logger.info("weekly_digest_started", user_id=str(current_user.id))
+
+    return {"message": "Weekly digest started"}
@@ -0,0 +1,114 @@
+"""
+TaskFlow AI - Authentication Dependencies
+
+Following Backend Template Epic 1: Authentication & Security Foundation
+- Request authentication dependencies for API routes
+"""
+
+from typing import Optional, Union
+from uuid import UUID
+
+from fastapi import Depends, HTTPException, Security, status
+from fastapi.security import APIKeyHeader, OAuth2PasswordBearer
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.security import get_session_id, verify_token
+from app.db.database import get_async_db
+from app.models.api_key import APIKey
+from app.models.user import User
+from app.services.api_key_service import AsyncAPIKeyService
+from app.services.session_service import session_activity
+from app.services.user_cache import UserSnapshot
+from app.services.user_service import AsyncUserService
+
+api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login", auto_error=False)
+
+
+async def get_current_user(
+    token: Optional[str] = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_async_db),
+) -> Union[User, UserSnapshot]:
+    """
+    Authenticate a request by its bearer access token
+
+    Served from the verified token and user caches on the hot path;
+    session revocation and last_activity never touch the database here.
+
+    Following Epic 1 - Protected route dependencies
+    """
+    credentials_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+    if not token:
+        raise credentials_exception
+
+    try:
+        payload = verify_token(token)
+        user_id = UUID(payload["user_id"])
+    except (ValueError, KeyError, TypeError):
+        raise credentials_exception
+
+    # Refresh tokens are signed with the same key but are not access tokens
+    if payload.get("type") != "access":
+        raise credentials_exception
+
+    user = await AsyncUserService(db).get_user_by_id(user_id)
+    if not user:
+        raise credentials_exception
+
+    if not user.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Inactive user account",
+        )
+
+    session_id = get_session_id(payload)
+    if session_id is not None:
+        session_activity.touch(session_id)
+
+    return user
+
+
+async def get_current_superuser(
+    current_user: Union[User, UserSnapshot] = Depends(get_current_user),
+) -> Union[User, UserSnapshot]:
+    """
+    Require an authenticated superuser
+
+    Following Epic 1 - Role-based access control
+    """
+    if not current_user.is_superuser:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not enough permissions",
+        )
+
+    return current_user
+
+
+async def get_api_key(
+    api_key: Optional[str] = Security(api_key_header),
+    db: AsyncSession = Depends(get_async_db),
+) -> APIKey:
+    """
+    Authenticate a machine-to-machine request by its X-API-Key header
+
+    Following Epic 1 - API security
+    """
+    if not api_key:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Missing API key",
+        )
+
+    db_key = await AsyncAPIKeyService(db).authenticate(api_key)
+    if not db_key:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid API key",
+        )
+
+    return db_key
@@ -8,7 +8,7 @@ Following Backend Template Epic 0: Project Setup & Architecture Planning
 - External service configuration
 """
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -33,6 +33,30 @@ class Settings(BaseSettings):
     ALGORITHM: str = Field(default="HS256", description="JWT algorithm")
     ACCESS_TOKEN_EXPIRE_MINUTES: int = Field(default=30, description="Access token expiration time")
     REFRESH_TOKEN_EXPIRE_DAYS: int = Field(default=7, description="Refresh token expiration time")
+    PASSWORD_RESET_TOKEN_EXPIRE_MINUTES: int = Field(default=60, description="Password reset link expiration time")
+    PASSWORD_HASH_WORKERS: int = Field(default=2, description="Worker processes for password hashing")
+    PASSWORD_HASH_QUEUE_SIZE: int = Field(default=64, description="Max password hashes waiting for a worker before returning 503")
+    API_KEY_HMAC_SECRET: Optional[str] = Field(default=None, description="Secret for API key HMACs (defaults to SECRET_KEY)")
+    TOKEN_CACHE_MAX_SIZE: int = Field(default=10_000, description="Max verified JWTs kept in the in-process cache (0 disables)")
+    SESSION_CACHE_SIZE: int = Field(default=10_000, description="Active sessions kept in the in-process read-through cache")
+    SESSION_CACHE_TTL_SECONDS: float = Field(default=60.0, description="Max age of a cached session before it is re-read")
+    SESSION_ACTIVITY_FLUSH_INTERVAL_SECONDS: float = Field(default=30.0, description="How often coalesced last_activity stamps are written")
+    SESSION_REVOCATION_SYNC_SECONDS: float = Field(default=5.0, description="How often revocations made by other processes are loaded")
+    SESSION_REVOCATION_FILTER_CAPACITY: int = Field(default=100_000, description="Revoked sessions the bloom filter is sized for (1% false positives)")
+    USER_CACHE_MAX_SIZE: int = Field(default=10_000, description="Max users kept in the in-process user cache (0 disables)")
+    USER_CACHE_TTL_SECONDS: float = Field(default=60.0, description="Seconds a cached user snapshot may be served")
+    LAST_LOGIN_STAMP_DEFERRED: bool = Field(default=True, description="Coalesce last_login stamps and write them in bulk off the login path")
+    LAST_LOGIN_FLUSH_INTERVAL_SECONDS: float = Field(default=5.0, description="Max seconds a deferred last_login stamp waits before being written")
+    PROVISIONING_BATCH_SIZE: int = Field(default=1000, description="Rows deduped, hashed and inserted per bulk provisioning batch")
+    PROVISIONING_MAX_ROWS: int = Field(default=100_000, description="Max rows accepted in one bulk provisioning upload")
+    PROVISIONING_HASH_CHUNK_SIZE: int = Field(default=8, description="Passwords hashed per hashing pool task during bulk provisioning")
+    PROVISIONING_MAX_REPORTED_ERRORS: int = Field(default=1000, description="Max per-row errors returned by a bulk provisioning upload")
+    TASK_PAGE_MAX_SIZE: int = Field(default=1000, description="Max tasks per listing page")
+    USER_STATS_REBUILD_CHUNK_SIZE: int = Field(default=1000, description="Users recomputed per transaction by the stats rebuild job")
+    LOCKOUT_BACKEND: str = Field(default="memory", description="Lockout counter backend: memory or redis")
+    LOCKOUT_WINDOW_SECONDS: int = Field(default=3600, description="Sliding window for failed login counting")
+    LOCKOUT_MAX_FAILED_ATTEMPTS: int = Field(default=5, description="Failed logins per email before lockout")
+    LOCKOUT_MAX_FAILED_ATTEMPTS_PER_IP: int = Field(default=50, description="Failed logins per client IP before lockout")
     
     # CORS Settings
     ALLOWED_HOSTS: List[str] = Field(
@@ -47,11 +71,38 @@ class Settings(BaseSettings):
     
     # Redis Settings (for caching and background jobs)
     REDIS_URL: str = Field(default="redis://localhost:6379/0", description="Redis URL")
+    JOBS_BACKEND: str = Field(default="memory", description="Background jobs: memory (run in this process) or celery (Redis broker, separate workers)")
+    JOBS_BROKER_URL: Optional[str] = Field(default=None, description="Celery broker URL; defaults to REDIS_URL")
+    JOBS_MAX_QUEUE_SIZE: int = Field(default=10_000, description="Jobs buffered in-process before new ones are dropped")
+    JOBS_IDEMPOTENCY_TTL_SECONDS: int = Field(default=3600, description="How long a keyed job blocks duplicates while it waits for a Celery worker")
     
     # AI/ML Settings
     OPENAI_API_KEY: Optional[str] = Field(default=None, description="OpenAI API key")
     OPENAI_MODEL: str = Field(default="gpt-4", description="OpenAI model to use")
     OPENAI_MAX_TOKENS: int = Field(default=1000, description="Max tokens for OpenAI requests")
+    LLM_CONTEXT_WINDOW: int = Field(default=8192, description="Context window of OPENAI_MODEL in tokens; prompts are trimmed to leave OPENAI_MAX_TOKENS for the reply")
+    TOKEN_COUNT_CACHE_SIZE: int = Field(default=4096, description="Prompt fragments whose token counts are memoized")
+    TOKEN_USAGE_FLUSH_INTERVAL_SECONDS: float = Field(default=10.0, description="How often per-user token usage is written")
+    LLM_PROVIDER: str = Field(default="openai", description="LLM backend: openai, or local for a deterministic offline stand-in")
+    LLM_CACHE_ENABLED: bool = Field(default=True, description="Cache LLM responses")
+    LLM_CACHE_BACKEND: str = Field(default="sqlite", description="Persistent LLM cache tier: sqlite, redis or none")
+    LLM_CACHE_SQLITE_PATH: str = Field(default="llm_cache.sqlite3", description="SQLite file for the persistent LLM cache tier")
+    LLM_CACHE_MAX_ENTRIES: int = Field(default=100_000, description="Max responses kept in the SQLite LLM cache tier")
+    LLM_CACHE_MEMORY_MAX_SIZE: int = Field(default=2000, description="Max responses kept in the in-process LLM cache tier")
+    LLM_CACHE_DEFAULT_TTL_SECONDS: int = Field(default=3600, description="LLM cache TTL for endpoints without their own")
+    LLM_CACHE_TTLS: Dict[str, int] = Field(
+        default={"prioritize": 300, "suggest": 3600, "parse": 86400, "insights": 900},
+        description="LLM cache TTL in seconds per AI endpoint (0 disables caching)",
+    )
+    LLM_MAX_CONCURRENCY: int = Field(default=8, description="Max concurrent outbound LLM calls per process")
+    LLM_PER_USER_CONCURRENCY: int = Field(default=2, description="Max concurrent outbound LLM calls per user (0 = unlimited)")
+    LLM_QUEUE_TIMEOUT_SECONDS: float = Field(default=30.0, description="Max wait for an LLM slot before failing the request")
+    LLM_BATCH_WINDOW_MS: int = Field(default=20, description="How long classification prompts are collected into one call")
+    LLM_BATCH_MAX_SIZE: int = Field(default=16, description="Max classification prompts per batched call")
+    PRIORITIZE_MAX_BACKLOG: int = Field(default=100_000, description="Max open tasks scored per /ai/prioritize request")
+    PRIORITIZE_TIE_TOLERANCE: float = Field(default=0.01, description="Score difference below which ranked tasks count as tied")
+    PRIORITIZE_MAX_AI_ITEMS: int = Field(default=8, description="Max near-tied tasks sent to the LLM for ordering")
+    TASK_PARSER_CONFIDENCE_THRESHOLD: float = Field(default=0.7, description="Local parses below this confidence go to the LLM")
     
     # Email Settings (for notifications)
     SMTP_HOST: Optional[str] = Field(default=None, description="SMTP server host")
@@ -59,6 +110,19 @@ class Settings(BaseSettings):
     SMTP_USERNAME: Optional[str] = Field(default=None, description="SMTP username")
     SMTP_PASSWORD: Optional[str] = Field(default=None, description="SMTP password")
     SMTP_FROM_EMAIL: Optional[str] = Field(default=None, description="From email address")
+    SMTP_USE_TLS: bool = Field(default=True, description="Upgrade SMTP connections with STARTTLS")
+    SMTP_USE_SSL: bool = Field(default=False, description="Connect with implicit TLS (usually port 465)")
+    SMTP_TIMEOUT_SECONDS: float = Field(default=10.0, description="SMTP socket timeout")
+    SMTP_POOL_SIZE: int = Field(default=4, description="SMTP connections kept open and reused for delivery")
+    SMTP_MAX_IDLE_SECONDS: float = Field(default=60.0, description="Idle time after which a pooled SMTP connection is checked before reuse")
+    EMAIL_BATCH_SIZE: int = Field(default=50, description="Queued emails claimed per delivery round")
+    EMAIL_POLL_INTERVAL_SECONDS: float = Field(default=5.0, description="How often the outbox is polled when no new mail was signalled")
+    EMAIL_MAX_ATTEMPTS: int = Field(default=8, description="Delivery attempts before an email is marked failed")
+    EMAIL_RETRY_BASE_SECONDS: float = Field(default=30.0, description="First retry delay; doubles per attempt")
+    EMAIL_RETRY_MAX_SECONDS: float = Field(default=3600.0, description="Max retry delay")
+    FRONTEND_URL: str = Field(default="http://localhost:3000", description="Base URL for links in emails")
+    DIGEST_CHUNK_SIZE: int = Field(default=1000, description="Users per chunk (cursor fetch, aggregate queries and outbox insert) in the weekly digest")
+    DIGEST_RENDER_WORKERS: int = Field(default=2, description="Processes rendering digest emails; 0 renders inline")
     
     # File Storage Settings
     UPLOAD_DIR: str = Field(default="uploads", description="Local upload directory")
@@ -69,11 +133,38 @@ class Settings(BaseSettings):
     )
     
     # External API Settings
-    RATE_LIMIT_PER_MINUTE: int = Field(default=100, description="API rate limit per minute")
+    RATE_LIMIT_PER_MINUTE: int = Field(default=100, description="API rate limit per minute per user (verified bearer token) or, unauthenticated, per client IP")
+    RATE_LIMIT_IP_PER_MINUTE: int = Field(default=600, description="Rate limit per minute for all authenticated traffic from one client IP")
+    RATE_LIMIT_ENABLED: bool = Field(default=True, description="Enable request rate limiting")
+    RATE_LIMIT_BACKEND: str = Field(default="memory", description="Rate limit bucket store: memory or redis")
+    RATE_LIMIT_ROUTES: Dict[str, int] = Field(
+        default={
+            "/api/v1/auth/login": 10,
+            "/api/v1/auth/register": 5,
+            "/api/v1/auth/forgot-password": 5,
+            "/api/v1/auth/reset-password": 5,
+        },
+        description="Per-route requests per minute per client IP, on top of RATE_LIMIT_PER_MINUTE"
+    )
     
     # Logging Settings
     LOG_LEVEL: str = Field(default="INFO", description="Logging level")
     LOG_FORMAT: str = Field(default="json", description="Log format: json or text")
+    LOG_SUCCESS_SAMPLE_RATE: float = Field(default=1.0, description="Share of successful request logs kept (errors are always kept)")
+    LOG_QUEUE_SIZE: int = Field(default=10_000, description="Log events buffered for the writer thread before dropping")
+    LOGIN_AUDIT_BATCH_SIZE: int = Field(default=500, description="Login attempt rows per bulk insert")
+    LOGIN_AUDIT_FLUSH_INTERVAL_SECONDS: float = Field(default=1.0, description="Max seconds a login attempt row stays buffered")
+    LOGIN_AUDIT_MAX_QUEUE_SIZE: int = Field(default=10_000, description="Buffered login attempt rows before spilling to the log")
+    RETENTION_ENABLED: bool = Field(default=True, description="Run the retention sweeper in this process")
+    RETENTION_INTERVAL_SECONDS: float = Field(default=3600.0, description="Time between retention sweeps")
+    RETENTION_BATCH_SIZE: int = Field(default=1000, description="Rows deleted per retention transaction")
+    RETENTION_BATCH_PAUSE_SECONDS: float = Field(default=0.05, description="Pause between retention batches to bound lock time and replication lag")
+    RETENTION_MAX_RUNTIME_SECONDS: float = Field(default=300.0, description="Max time one sweep spends deleting; the rest waits for the next sweep")
+    LOGIN_ATTEMPT_RETENTION_DAYS: int = Field(default=90, description="Days login attempts are kept (must exceed the lockout window)")
+    LOGIN_ATTEMPT_PARTITION_DAYS: int = Field(default=7, description="Width of login_attempts range partitions on PostgreSQL; retention drops whole partitions")
+    LOGIN_ATTEMPT_PARTITION_PREMAKE: int = Field(default=4, description="Future login_attempts partitions kept created ahead of time")
+    SESSION_RETENTION_DAYS: int = Field(default=30, description="Days sessions are kept after they expire")
+    PASSWORD_RESET_TOKEN_RETENTION_DAYS: int = Field(default=7, description="Days password reset tokens are kept after they expire")
     
     # Monitoring Settings
     SENTRY_DSN: Optional[str] = Field(default=None, description="Sentry DSN for error tracking")
@@ -124,10 +215,15 @@ def validate_config():
         raise ValueError(f"Configuration errors: {', '.join(errors)}")
 
 
-# Validate configuration on import
-try:
-    validate_config()
-except ValueError as e:
-    print(f"⚠️  Configuration Warning: {e}")
-    if settings.is_production:
-        raise
+def check_config() -> None:
+    """
+    Validate configuration at process startup (API startup, Celery worker import)
+
+    Outside production problems are only printed; in production they are fatal.
+    """
+    try:
+        validate_config()
+    except ValueError as e:
+        print(f"⚠️  Configuration Warning: {e}")
+        if settings.is_production:
+            raise
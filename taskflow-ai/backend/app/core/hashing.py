@@ -0,0 +1,141 @@
+"""
+TaskFlow AI - Password Hashing Executor
+
+Following Backend Template Epic 1: Authentication & Security Foundation
+- Run bcrypt hashing and verification off the event loop
+- Bounded worker pool with backpressure
+- Queue depth and wait time metrics
+"""
+
+import asyncio
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import structlog
+
+from app.core.config import settings
+
+logger = structlog.get_logger(__name__)
+
+
+class HashingPoolSaturated(Exception):
+    """Raised when the hashing queue is full and the request should be shed"""
+
+
+def _timed_call(fn: Callable[..., Any], args: Tuple[Any, ...]) -> Tuple[float, Any]:
+    """
+    Run a hashing function inside a worker process
+
+    Returns the monotonic start time so the caller can compute queue wait.
+    time.monotonic() is system-wide on Linux, so it is comparable across processes.
+    """
+    started_at = time.monotonic()
+    return started_at, fn(*args)
+
+
+class HashingExecutor:
+    """
+    Process pool for CPU-bound password hashing
+
+    Following Epic 1 - Password hashing and validation
+    - At most max_workers hashes run concurrently
+    - At most max_queue_size further hashes wait for a worker
+    - Anything beyond that is rejected with HashingPoolSaturated (mapped to 503)
+    """
+
+    def __init__(self, max_workers: int, max_queue_size: int):
+        self.max_workers = max(1, max_workers)
+        self.max_queue_size = max(0, max_queue_size)
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+        # Only touched from the event loop thread, so no locking is needed
+        self._pending = 0
+        self._submitted = 0
+        self._completed = 0
+        self._rejected = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of hashes running or waiting at once"""
+        return self.max_workers + self.max_queue_size
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of hashes waiting for a free worker"""
+        return max(0, self._pending - self.max_workers)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Create the process pool on first use"""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            logger.info(
+                "hashing_pool_started",
+                max_workers=self.max_workers,
+                max_queue_size=self.max_queue_size,
+            )
+        return self._executor
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run fn(*args) in the worker pool
+
+        Raises HashingPoolSaturated when the pool and its queue are full.
+        """
+        if self._pending >= self.capacity:
+            self._rejected += 1
+            logger.warning(
+                "hashing_pool_saturated",
+                pending=self._pending,
+                capacity=self.capacity,
+            )
+            raise HashingPoolSaturated("Password hashing pool is saturated")
+
+        self._pending += 1
+        self._submitted += 1
+        submitted_at = time.monotonic()
+        loop = asyncio.get_running_loop()
+
+        try:
+            started_at, result = await loop.run_in_executor(
+                self._get_executor(), _timed_call, fn, args
+            )
+        finally:
+            self._pending -= 1
+
+        wait = max(0.0, started_at - submitted_at)
+        self._completed += 1
+        self._total_wait += wait
+        self._max_wait = max(self._max_wait, wait)
+
+        return result
+
+    def metrics(self) -> Dict[str, Any]:
+        """Snapshot of pool metrics for monitoring"""
+        return {
+            "max_workers": self.max_workers,
+            "max_queue_size": self.max_queue_size,
+            "in_flight": min(self._pending, self.max_workers),
+            "queue_depth": self.queue_depth,
+            "submitted": self._submitted,
+            "completed": self._completed,
+            "rejected": self._rejected,
+            "avg_wait_ms": round(self._total_wait / self._completed * 1000, 3) if self._completed else 0.0,
+            "max_wait_ms": round(self._max_wait * 1000, 3),
+        }
+
+    def shutdown(self) -> None:
+        """Stop the worker processes"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+            logger.info("hashing_pool_stopped")
+
+
+# Global hashing executor instance
+hashing_executor = HashingExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_queue_size=settings.PASSWORD_HASH_QUEUE_SIZE,
+)
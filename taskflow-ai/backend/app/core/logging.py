@@ -5,17 +5,36 @@ Following Backend Template Epic 0: Project Setup & Architecture Planning
 - Structured logging setup
 - Environment-based log configuration
 - Request/response logging
+- Queue-backed log sink that renders and writes on a background thread
+- Success-path sampling with errors always logged
 """
 
+import json
 import logging
+import queue
+import random
 import sys
-from typing import Any, Dict
+import threading
+from typing import Any, Callable, Dict, List, Optional
 
 import structlog
 from structlog.types import EventDict
 
 from app.core.config import settings
 
+try:  # Optional fast JSON encoder
+    import orjson
+except ImportError:  # pragma: no cover - depends on installed extras
+    orjson = None
+
+# Events subject to LOG_SUCCESS_SAMPLE_RATE when they describe a success
+SAMPLED_EVENTS = {"request_completed"}
+
+# Max log events rendered and written per stdout write
+LOG_WRITE_BATCH_SIZE = 256
+
+_STOP = object()
+
 
 def add_correlation_id(logger: Any, method_name: str, event_dict: EventDict) -> EventDict:
     """Add correlation ID to log entries"""
@@ -33,8 +52,129 @@ def add_service_info(logger: Any, method_name: str, event_dict: EventDict) -> Ev
     return event_dict
 
 
+def sample_success_events(logger: Any, method_name: str, event_dict: EventDict) -> EventDict:
+    """
+    Drop a share of successful high-volume events
+    
+    Warnings, errors and responses with status >= 400 are always kept.
+    """
+    if event_dict.get("event") not in SAMPLED_EVENTS:
+        return event_dict
+    if method_name not in ("debug", "info") or event_dict.get("status_code", 0) >= 400:
+        return event_dict
+    if random.random() < settings.LOG_SUCCESS_SAMPLE_RATE:
+        return event_dict
+    raise structlog.DropEvent
+
+
+def render_json(event_dict: EventDict) -> str:
+    """Render an event as a single JSON line (orjson when installed)"""
+    if orjson is not None:
+        return orjson.dumps(event_dict, default=str, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(event_dict, default=str, separators=(",", ":"))
+
+
+class BackgroundLogWriter:
+    """
+    Renders and writes log events on a dedicated thread
+    
+    The calling thread (usually the event loop) only enqueues the event
+    dict. When the queue is full, events are dropped and counted rather
+    than blocking the caller on a slow stdout.
+    """
+    
+    def __init__(self, render: Callable[[EventDict], str], stream=None, max_queue_size: int = 10_000):
+        self.render = render
+        self.stream = stream or sys.stdout
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_queue_size)
+        self._thread: Optional[threading.Thread] = None
+        self.dropped = 0
+    
+    def start(self) -> None:
+        """Start the writer thread"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+            self._thread.start()
+    
+    def submit(self, event_dict: EventDict) -> None:
+        """Queue an event without blocking"""
+        try:
+            self._queue.put_nowait(event_dict)
+        except queue.Full:
+            self.dropped += 1
+    
+    def stop(self, timeout: float = 5.0) -> None:
+        """Write everything already queued, then stop the thread"""
+        if self._thread is None:
+            return
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            pass
+        self._thread.join(timeout=timeout)
+        self._thread = None
+    
+    def metrics(self) -> Dict[str, Any]:
+        """Snapshot of writer metrics for monitoring"""
+        return {
+            "queued": self._queue.qsize(),
+            "dropped": self.dropped,
+        }
+    
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < LOG_WRITE_BATCH_SIZE:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            stop = any(item is _STOP for item in batch)
+            lines: List[str] = []
+            for item in batch:
+                if item is _STOP:
+                    continue
+                try:
+                    lines.append(self.render(item))
+                except Exception as e:  # never let one bad event kill the writer
+                    lines.append(render_json({"event": "log_render_failed", "error": str(e)}))
+            
+            if lines:
+                try:
+                    self.stream.write("\n".join(lines) + "\n")
+                    self.stream.flush()
+                except Exception:
+                    pass
+            
+            if stop:
+                return
+
+
+class QueuedLogger:
+    """structlog logger that hands event dicts to the background writer"""
+    
+    def __init__(self, writer: BackgroundLogWriter):
+        self._writer = writer
+    
+    def msg(self, event_dict: EventDict) -> None:
+        self._writer.submit(event_dict)
+    
+    log = debug = info = warn = warning = error = critical = exception = fatal = failure = err = msg
+
+
+def enqueue_event(logger: Any, method_name: str, event_dict: EventDict) -> Any:
+    """Final processor: pass the event dict through unrendered"""
+    return (event_dict,), {}
+
+
+# Background writer started by setup_logging()
+log_writer: Optional[BackgroundLogWriter] = None
+
+
 def setup_logging():
     """Configure structured logging for the application"""
+    global log_writer
     
     # Configure standard library logging
     logging.basicConfig(
@@ -46,33 +186,54 @@ def setup_logging():
     # Configure structlog
     processors = [
         structlog.contextvars.merge_contextvars,
+        sample_success_events,
         add_service_info,
         add_correlation_id,
         structlog.processors.TimeStamper(fmt="iso"),
         structlog.processors.add_log_level,
         structlog.processors.StackInfoRenderer(),
         structlog.dev.set_exc_info,
+        # Tracebacks must be captured on the calling thread
+        structlog.processors.format_exc_info,
+        enqueue_event,
     ]
     
     if settings.LOG_FORMAT.lower() == "json":
         # JSON logging for production
-        processors.append(structlog.processors.JSONRenderer())
+        render = render_json
     else:
         # Pretty console logging for development
-        processors.extend([
-            structlog.dev.ConsoleRenderer(colors=True),
-        ])
+        console_renderer = structlog.dev.ConsoleRenderer(colors=True)
+        
+        def render(event_dict: EventDict) -> str:
+            return console_renderer(None, event_dict.get("level", "info"), event_dict)
+    
+    if log_writer is not None:
+        log_writer.stop()
+    log_writer = BackgroundLogWriter(render, max_queue_size=settings.LOG_QUEUE_SIZE)
+    log_writer.start()
     
     structlog.configure(
         processors=processors,
         wrapper_class=structlog.make_filtering_bound_logger(
             getattr(logging, settings.LOG_LEVEL.upper())
         ),
-        logger_factory=structlog.PrintLoggerFactory(),
+        logger_factory=lambda *args: QueuedLogger(log_writer),
         cache_logger_on_first_use=True,
     )
 
 
+def get_logging_metrics() -> Dict[str, Any]:
+    """Log writer metrics, empty before setup_logging() runs"""
+    return log_writer.metrics() if log_writer is not None else {}
+
+
+def shutdown_logging():
+    """Flush queued log events and stop the writer thread"""
+    if log_writer is not None:
+        log_writer.stop()
+
+
 def get_logger(name: str = None) -> structlog.BoundLogger:
     """Get a configured logger instance"""
     if name:
@@ -0,0 +1,291 @@
+"""
+TaskFlow AI - Rate Limiting
+
+Following Backend Template Epic 1: Authentication & Security Foundation
+- Token-bucket rate limiting per client IP, route and verified principal
+- Lock-sharded in-process bucket store
+- Optional Redis bucket store shared by all workers
+- ASGI middleware that rejects before the request body is read
+"""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from itertools import islice
+from typing import Any, Dict, List, Optional, Tuple
+
+import structlog
+
+from app.core.config import settings
+from app.core.security import verify_token
+
+logger = structlog.get_logger(__name__)
+
+# Paths that are never rate limited
+EXEMPT_PATHS = {"/health"}
+
+
+class LocalBucketStore:
+    """
+    In-process token buckets split across independently locked shards
+
+    Each shard is an LRU capped at max_buckets_per_shard. A bucket records
+    when it will be full again; a full bucket is equivalent to a missing
+    one, so when a shard is at its cap the first full bucket among the
+    EVICTION_SCAN least recently used ones is dropped, and only if none of
+    them is full the least recently used one regardless. Every take is
+    O(1), including under a flood of new keys.
+    """
+
+    # LRU buckets inspected for a full one before evicting a draining bucket
+    EVICTION_SCAN = 8
+
+    def __init__(self, shards: int = 64, max_buckets_per_shard: int = 10_000):
+        # key -> [tokens, updated_at, full_at]
+        self._shards: List[Tuple[threading.Lock, "OrderedDict[str, List[float]]"]] = [
+            (threading.Lock(), OrderedDict()) for _ in range(max(1, shards))
+        ]
+        self.max_buckets_per_shard = max(1, max_buckets_per_shard)
+        self.evictions = 0
+
+    def _shard(self, key: str) -> Tuple[threading.Lock, "OrderedDict[str, List[float]]"]:
+        return self._shards[hash(key) % len(self._shards)]
+
+    async def take(self, key: str, capacity: int, refill_per_second: float) -> Tuple[bool, float]:
+        """Take one token; returns (allowed, seconds until a token is available)"""
+        return self._take(key, capacity, refill_per_second, time.monotonic())
+
+    def _take(self, key: str, capacity: int, refill_per_second: float, now: float) -> Tuple[bool, float]:
+        lock, buckets = self._shard(key)
+        with lock:
+            bucket = buckets.get(key)
+            if bucket is None:
+                while len(buckets) >= self.max_buckets_per_shard:
+                    self._evict(buckets, now)
+                bucket = [float(capacity), now, now]
+                buckets[key] = bucket
+            else:
+                buckets.move_to_end(key)
+
+            tokens, updated_at, _ = bucket
+            tokens = min(capacity, tokens + (now - updated_at) * refill_per_second)
+
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+            bucket[0] = tokens
+            bucket[1] = now
+            bucket[2] = now + (capacity - tokens) / refill_per_second
+            return (True, 0.0) if allowed else (False, (1 - tokens) / refill_per_second)
+
+    def _evict(self, buckets: "OrderedDict[str, List[float]]", now: float) -> None:
+        """Drop a full bucket near the LRU end, else the least recently used one"""
+        for key in islice(buckets, self.EVICTION_SCAN):
+            if buckets[key][2] <= now:
+                del buckets[key]
+                return
+        # Evicting a bucket that was still draining forgets its limit
+        buckets.popitem(last=False)
+        self.evictions += 1
+
+    def size(self) -> int:
+        return sum(len(buckets) for _, buckets in self._shards)
+
+
+# Atomic token bucket: KEYS[1]=bucket, ARGV=capacity, refill/sec, now (seconds)
+_REDIS_TOKEN_BUCKET = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local allowed = 0
+local retry_after = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+else
+    retry_after = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate * 1000))
+return {allowed, tostring(retry_after)}
+"""
+
+
+class RedisBucketStore:
+    """
+    Token buckets shared across workers, updated atomically by a Lua script
+
+    Falls back to a local store if Redis is unavailable, so an outage
+    degrades to per-worker limits instead of failing requests.
+    """
+
+    def __init__(self, url: str, key_prefix: str = "ratelimit:"):
+        self.url = url
+        self.key_prefix = key_prefix
+        self._script = None
+        self._fallback = LocalBucketStore()
+
+    def _get_script(self):
+        if self._script is None:
+            import redis.asyncio as redis
+
+            self._script = redis.from_url(self.url).register_script(_REDIS_TOKEN_BUCKET)
+        return self._script
+
+    async def take(self, key: str, capacity: int, refill_per_second: float) -> Tuple[bool, float]:
+        """Take one token; returns (allowed, seconds until a token is available)"""
+        try:
+            allowed, retry_after = await self._get_script()(
+                keys=[self.key_prefix + key],
+                args=[capacity, refill_per_second, time.time()],
+            )
+            return bool(int(allowed)), float(retry_after)
+        except Exception as e:
+            logger.warning("rate_limit_redis_unavailable", error=str(e))
+            return await self._fallback.take(key, capacity, refill_per_second)
+
+
+class RateLimiter:
+    """
+    Token-bucket rate limit decisions per client IP, route and principal
+
+    Every request is charged to its client IP (ip_per_minute) and to its
+    principal (per_minute): the user of a bearer token that verifies, or
+    the client IP itself. Unverified credentials never pick the bucket, so
+    a fresh random header per request cannot buy a fresh bucket. Routes in
+    route_limits (login, password reset) get an additional, tighter bucket
+    per client IP, since their callers are not authenticated yet.
+
+    Following Epic 1 - Security middleware and utilities
+    """
+
+    def __init__(self, store, per_minute: int, ip_per_minute: int, route_limits: Dict[str, int]):
+        self.store = store
+        self.per_minute = per_minute
+        self.ip_per_minute = ip_per_minute
+        self.route_limits = route_limits
+
+        self.allowed = 0
+        self.rejected = 0
+
+    async def check(self, scope) -> Optional[Tuple[int, float]]:
+        """Return None if allowed, else (limit, retry_after_seconds)"""
+        client = scope.get("client")
+        ip = client[0] if client else "unknown"
+        path = scope["path"]
+
+        buckets = []
+        route_limit = self.route_limits.get(path)
+        if route_limit:
+            buckets.append((f"{path}|ip:{ip}", route_limit))
+        user = self._verified_user(scope)
+        if user is not None:
+            buckets.append((f"ip:{ip}", self.ip_per_minute))
+            buckets.append((f"user:{user}", self.per_minute))
+        else:
+            buckets.append((f"anon:{ip}", self.per_minute))
+
+        for key, limit in buckets:
+            allowed, retry_after = await self.store.take(key, limit, limit / 60.0)
+            if not allowed:
+                self.rejected += 1
+                return limit, retry_after
+
+        self.allowed += 1
+        return None
+
+    @staticmethod
+    def _verified_user(scope) -> Optional[str]:
+        """
+        Subject of the request's bearer token, if it verifies
+
+        Verified tokens are served from the verified token cache, and
+        garbage fails to decode before any signature check, so this is
+        cheap either way. API keys need a database lookup to verify and
+        are charged by client IP.
+        """
+        for name, value in scope.get("headers", ()):
+            if name == b"authorization" and value[:7].lower() == b"bearer ":
+                try:
+                    payload = verify_token(value[7:].decode("latin-1"))
+                except ValueError:
+                    return None
+                subject = payload.get("sub")
+                return str(subject) if subject else None
+        return None
+
+    def metrics(self) -> Dict[str, Any]:
+        """Snapshot of limiter metrics for monitoring"""
+        metrics = {
+            "backend": type(self.store).__name__,
+            "per_minute": self.per_minute,
+            "ip_per_minute": self.ip_per_minute,
+            "allowed": self.allowed,
+            "rejected": self.rejected,
+        }
+        if isinstance(self.store, LocalBucketStore):
+            metrics["buckets"] = self.store.size()
+            metrics["evictions"] = self.store.evictions
+        return metrics
+
+
+class RateLimitMiddleware:
+    """
+    Pure ASGI rate limiting middleware
+
+    Decisions use only the scope and headers, so rejected requests never
+    have their body read or parsed.
+    """
+
+    def __init__(self, app, limiter: Optional[RateLimiter] = None):
+        self.app = app
+        self.limiter = limiter or rate_limiter
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in EXEMPT_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        rejection = await self.limiter.check(scope)
+        if rejection is not None:
+            await self._reject(send, *rejection)
+            return
+
+        await self.app(scope, receive, send)
+
+    @staticmethod
+    async def _reject(send, limit: int, retry_after: float) -> None:
+        """Send a 429 without touching the request body"""
+        body = json.dumps({"detail": "Rate limit exceeded"}).encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": 429,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("latin-1")),
+                (b"retry-after", str(max(1, int(retry_after + 0.999))).encode("latin-1")),
+                (b"x-ratelimit-limit", str(limit).encode("latin-1")),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+
+def create_bucket_store():
+    """Build the configured bucket store"""
+    if settings.RATE_LIMIT_BACKEND.lower() == "redis":
+        return RedisBucketStore(settings.REDIS_URL)
+    return LocalBucketStore()
+
+
+# Global rate limiter instance
+rate_limiter = RateLimiter(
+    store=create_bucket_store(),
+    per_minute=settings.RATE_LIMIT_PER_MINUTE,
+    ip_per_minute=settings.RATE_LIMIT_IP_PER_MINUTE,
+    route_limits=settings.RATE_LIMIT_ROUTES,
+)
@@ -7,17 +7,35 @@ Following Backend Template Epic 1: Authentication & Security Foundation
 - Security middleware and utilities
 """
 
+import hashlib
+import hmac
+import re
+import secrets
+import string
 from datetime import datetime, timedelta
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Union
+from uuid import UUID
 
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 
 from app.core.config import settings
+from app.core.hashing import hashing_executor
+from app.core.session_revocation import revoked_sessions
+from app.core.token_cache import verified_token_cache
 
 # Password hashing context
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# API key format: tf_<lookup_id>_<secret>
+API_KEY_PREFIX = "tf"
+API_KEY_LOOKUP_ID_BYTES = 6  # 12 hex characters
+API_KEY_SECRET_LENGTH = 32
+API_KEY_ALPHABET = string.ascii_letters + string.digits
+LEGACY_API_KEY_LOOKUP_ID_LENGTH = 16
+# Exact shape of keys issued by the old scheme: tf_ + 32 letters/digits
+LEGACY_API_KEY_PATTERN = re.compile(rf"{API_KEY_PREFIX}_[A-Za-z0-9]{{{API_KEY_SECRET_LENGTH}}}")
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
@@ -37,6 +55,33 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+def get_password_hashes(passwords: List[str]) -> List[str]:
+    """
+    Hash several passwords in one call
+    
+    Lets bulk callers ship a chunk of passwords to a hashing worker at once.
+    """
+    return [pwd_context.hash(password) for password in passwords]
+
+
+async def averify_password(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password in the hashing pool without blocking the event loop
+
+    Raises HashingPoolSaturated when the pool is overloaded.
+    """
+    return await hashing_executor.run(verify_password, plain_password, hashed_password)
+
+
+async def aget_password_hash(password: str) -> str:
+    """
+    Hash a password in the hashing pool without blocking the event loop
+
+    Raises HashingPoolSaturated when the pool is overloaded.
+    """
+    return await hashing_executor.run(get_password_hash, password)
+
+
 def create_access_token(
     data: Dict[str, Any],
     expires_delta: Optional[timedelta] = None
@@ -80,7 +125,9 @@ def create_refresh_token(data: Dict[str, Any]) -> str:
     to_encode.update({
         "exp": expire,
         "iat": datetime.utcnow(),
-        "type": "refresh"
+        "type": "refresh",
+        # Unique per token, so a rotation within the same second still changes it
+        "jti": secrets.token_hex(8),
     })
     
     encoded_jwt = jwt.encode(
@@ -92,21 +139,80 @@ def create_refresh_token(data: Dict[str, Any]) -> str:
     return encoded_jwt
 
 
+def create_password_reset_token(email: str) -> str:
+    """
+    Create a JWT for a password reset link
+
+    Typed "password_reset", so it is never accepted as an access token.
+
+    Following Epic 1 - Password reset functionality
+    """
+    now = datetime.utcnow()
+    to_encode = {
+        "sub": email,
+        "exp": now + timedelta(minutes=settings.PASSWORD_RESET_TOKEN_EXPIRE_MINUTES),
+        "iat": now,
+        "type": "password_reset",
+    }
+
+    return jwt.encode(
+        to_encode,
+        settings.SECRET_KEY,
+        algorithm=settings.ALGORITHM
+    )
+
+
 def verify_token(token: str) -> Dict[str, Any]:
     """
     Verify and decode a JWT token
     
+    Previously verified tokens are served from the verified token cache
+    until their exp claim, skipping signature verification. Tokens of a
+    revoked session are rejected from the in-memory revocation filter,
+    cached or not.
+    
     Following Epic 1 - JWT token verification
     """
+    payload = verified_token_cache.get(token)
+    if payload is None:
+        try:
+            payload = jwt.decode(
+                token,
+                settings.SECRET_KEY,
+                algorithms=[settings.ALGORITHM]
+            )
+        except JWTError:
+            raise ValueError("Invalid token")
+        
+        verified_token_cache.put(token, payload)
+    
+    if revoked_sessions.is_revoked(get_session_id(payload)):
+        raise ValueError("Revoked token")
+    return payload
+
+
+def get_session_id(payload: Dict[str, Any]) -> Optional[UUID]:
+    """
+    Session id (sid claim) of a decoded token
+    
+    Tokens issued before sessions were tracked carry no sid.
+    """
+    sid = payload.get("sid")
+    if not sid:
+        return None
     try:
-        payload = jwt.decode(
-            token,
-            settings.SECRET_KEY,
-            algorithms=[settings.ALGORITHM]
-        )
-        return payload
-    except JWTError:
-        raise ValueError("Invalid token")
+        return UUID(sid)
+    except (ValueError, TypeError):
+        return None
+
+
+def revoke_cached_token(token: str) -> None:
+    """
+    Drop a revoked token from the verified token cache
+    
+    Following Epic 1 - JWT token verification
+    """
+    verified_token_cache.invalidate(token)
 
 
 def decode_token(token: str) -> Optional[Dict[str, Any]]:
@@ -152,25 +258,55 @@ def generate_api_key() -> str:
     """
     Generate a secure API key
     
+    Keys have the form tf_<lookup_id>_<secret>. The lookup id is public and
+    indexed, so a key is found with a single query and then checked with a
+    constant-time HMAC comparison instead of bcrypt.
+    
     Following Epic 1 - API security
     """
-    import secrets
-    import string
+    lookup_id = secrets.token_hex(API_KEY_LOOKUP_ID_BYTES)
+    api_key = ''.join(secrets.choice(API_KEY_ALPHABET) for _ in range(API_KEY_SECRET_LENGTH))
+    return f"{API_KEY_PREFIX}_{lookup_id}_{api_key}"
+
+
+def is_legacy_api_key(api_key: str) -> bool:
+    """
+    Check whether a key has the exact legacy tf_<secret> shape (no lookup id)
+
+    Anything else cannot be a legacy key, so it never reaches the bcrypt scan.
+    """
+    return LEGACY_API_KEY_PATTERN.fullmatch(api_key) is not None
+
+
+def get_api_key_lookup_id(api_key: str) -> Optional[str]:
+    """
+    Get the indexed lookup id for an API key
     
-    alphabet = string.ascii_letters + string.digits
-    api_key = ''.join(secrets.choice(alphabet) for _ in range(32))
-    return f"tf_{api_key}"
+    Current keys carry their lookup id. Legacy keys get one derived from
+    their HMAC so they use the same indexed path once migrated.
+    """
+    parts = api_key.split("_")
+    if len(parts) == 3 and parts[0] == API_KEY_PREFIX and parts[1] and parts[2]:
+        return parts[1]
+    if is_legacy_api_key(api_key) and parts[1]:
+        return hash_api_key(api_key)[:LEGACY_API_KEY_LOOKUP_ID_LENGTH]
+    return None
 
 
 def hash_api_key(api_key: str) -> str:
     """
-    Hash an API key for storage
+    Hash an API key for storage (HMAC-SHA256, hex encoded)
     """
-    return get_password_hash(api_key)
+    secret = settings.API_KEY_HMAC_SECRET or settings.SECRET_KEY
+    return hmac.new(secret.encode("utf-8"), api_key.encode("utf-8"), hashlib.sha256).hexdigest()
 
 
 def verify_api_key(plain_api_key: str, hashed_api_key: str) -> bool:
     """
     Verify an API key against its hash
+    
+    Accepts HMAC hashes and legacy bcrypt hashes.
     """
-    return verify_password(plain_api_key, hashed_api_key)
+    if hashed_api_key.startswith("$2"):
+        return verify_password(plain_api_key, hashed_api_key)
+    return hmac.compare_digest(hash_api_key(plain_api_key), hashed_api_key)
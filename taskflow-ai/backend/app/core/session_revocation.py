@@ -0,0 +1,125 @@
+"""
+TaskFlow AI - Session Revocation Filter
+
+Following Backend Template Epic 1: Authentication & Security Foundation
+- In-memory set of revoked session ids checked on every token verification
+- Bloom filter in front of an exact set: the common "not revoked" answer is a few bit tests
+- Entries expire with their session, so memory is bounded by live revocations
+"""
+
+import math
+import threading
+import time
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from app.core.config import settings
+
+
+class BloomFilter:
+    """
+    Fixed-size bloom filter over UUIDs
+
+    Session ids are random uuid4 values, so the two halves of the id serve
+    as the base hashes for double hashing; no hash function runs per lookup.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        self.capacity = max(1, capacity)
+        self.error_rate = error_rate
+        self.size = max(8, int(-self.capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / self.capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: UUID):
+        value = item.int
+        h1 = value & 0xFFFFFFFFFFFFFFFF
+        h2 = (value >> 64) | 1
+        for i in range(self.hashes):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, item: UUID) -> None:
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: UUID) -> bool:
+        bits = self._bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+
+class RevokedSessions:
+    """
+    Revoked session ids, each kept until its session would have expired anyway
+
+    is_revoked() consults the bloom filter first and the exact set only on
+    a filter hit, so false positives never reject a valid session. The
+    filter cannot forget, so prune() rebuilds it from the exact set (sized
+    for at least twice the live entries) once expired entries are dropped.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = max(1, capacity)
+        self._revoked: Dict[UUID, float] = {}  # session id -> session expiry (epoch seconds)
+        self._filter = BloomFilter(self.capacity)
+        self._lock = threading.Lock()
+
+        self.checks = 0
+        self.filter_hits = 0
+        self.rejections = 0
+
+    def revoke(self, session_id: UUID, expires_at: float) -> None:
+        """Reject session_id until expires_at"""
+        if expires_at <= time.time():
+            return
+        with self._lock:
+            if session_id not in self._revoked:
+                self._filter.add(session_id)
+            self._revoked[session_id] = expires_at
+            if self._filter.count > self._filter.capacity:
+                self._rebuild()
+
+    def is_revoked(self, session_id: Optional[UUID]) -> bool:
+        """True if session_id was revoked; lock-free for the common negative case"""
+        self.checks += 1
+        if session_id is None or session_id not in self._filter:
+            return False
+        self.filter_hits += 1
+        if session_id in self._revoked:
+            self.rejections += 1
+            return True
+        return False
+
+    def prune(self) -> int:
+        """Forget revocations whose sessions have expired; returns how many"""
+        now = time.time()
+        with self._lock:
+            expired = [session_id for session_id, expires_at in self._revoked.items() if expires_at <= now]
+            for session_id in expired:
+                del self._revoked[session_id]
+            if expired:
+                self._rebuild()
+        return len(expired)
+
+    def _rebuild(self) -> None:
+        """Swap in a filter holding only the live entries (caller holds the lock)"""
+        rebuilt = BloomFilter(max(self.capacity, 2 * len(self._revoked)))
+        for session_id in self._revoked:
+            rebuilt.add(session_id)
+        self._filter = rebuilt
+
+    def metrics(self) -> Dict[str, Any]:
+        """Snapshot of revocation filter metrics for monitoring"""
+        return {
+            "revoked": len(self._revoked),
+            "filter_capacity": self._filter.capacity,
+            "filter_bytes": len(self._filter._bits),
+            "checks": self.checks,
+            "filter_hits": self.filter_hits,
+            "rejections": self.rejections,
+        }
+
+
+# Global revoked session filter
+revoked_sessions = RevokedSessions(capacity=settings.SESSION_REVOCATION_FILTER_CAPACITY)
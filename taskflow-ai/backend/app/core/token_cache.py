@@ -0,0 +1,116 @@
+"""
+TaskFlow AI - Verified Token Cache
+
+Following Backend Template Epic 1: Authentication & Security Foundation
+- Cache decoded JWT claims so repeated bearer tokens skip signature verification
+- Entries expire at the token's own exp claim
+- LRU eviction, hit/miss counters and explicit invalidation for revoked tokens
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+from app.core.config import settings
+
+
+class VerifiedTokenCache:
+    """
+    Bounded in-process cache of verified JWT claims
+
+    Keys are SHA-256 digests of the raw token, so tokens themselves are never
+    held in memory. Only tokens that passed signature verification are stored.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: "OrderedDict[bytes, tuple[Dict[str, Any], float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        """Digest used as the cache key for a token"""
+        return hashlib.sha256(token.encode("utf-8")).digest()
+
+    def get(self, token: str) -> Optional[Dict[str, Any]]:
+        """Return cached claims for a token, or None on miss or expiry"""
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            claims, expires_at = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+        # Callers may mutate the payload, so hand out a copy
+        return dict(claims)
+
+    def put(self, token: str, claims: Dict[str, Any]) -> None:
+        """Cache verified claims until the token's exp claim"""
+        expires_at = claims.get("exp")
+        if self.max_size <= 0 or not isinstance(expires_at, (int, float)):
+            return
+        if expires_at <= time.time():
+            return
+
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = (dict(claims), float(expires_at))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, token: str) -> bool:
+        """Drop a revoked token so the next use is fully re-verified"""
+        with self._lock:
+            removed = self._entries.pop(self._key(token), None) is not None
+            if removed:
+                self.invalidations += 1
+        return removed
+
+    def invalidate_where(self, predicate: Callable[[Dict[str, Any]], bool]) -> int:
+        """Drop every cached token whose claims match predicate (e.g. all tokens of a user)"""
+        with self._lock:
+            keys = [key for key, (claims, _) in self._entries.items() if predicate(claims)]
+            for key in keys:
+                del self._entries[key]
+            self.invalidations += len(keys)
+        return len(keys)
+
+    def clear(self) -> None:
+        """Drop all cached tokens"""
+        with self._lock:
+            self._entries.clear()
+
+    def metrics(self) -> Dict[str, Any]:
+        """Snapshot of cache metrics for monitoring"""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+
+# Global verified token cache instance
+verified_token_cache = VerifiedTokenCache(max_size=settings.TOKEN_CACHE_MAX_SIZE)
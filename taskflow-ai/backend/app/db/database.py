@@ -5,32 +5,124 @@ Following Database Template Epic 0: Database Architecture Planning
 - Database connection management
 - Session handling
 - Connection pooling
+- Engines created lazily, on first use
 """
 
+import threading
+from typing import Any, AsyncIterator, Optional
+
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import StaticPool
 
 from app.core.config import settings
 import structlog
 
 logger = structlog.get_logger(__name__)
 
-# Create database engine
-engine = create_engine(
-    settings.DATABASE_URL,
-    pool_size=settings.DATABASE_POOL_SIZE,
-    max_overflow=settings.DATABASE_MAX_OVERFLOW,
-    pool_pre_ping=True,  # Verify connections before use
-    echo=settings.DEBUG,  # Log SQL queries in debug mode
-)
+# Engines are created on first use: creating one imports the database
+# driver, and importing models or the app should not pay for that
+_engine: Optional[Engine] = None
+_async_engine: Optional[AsyncEngine] = None
+_engine_lock = threading.Lock()
+
+
+def get_engine() -> Engine:
+    """
+    Sync database engine, created on first use
+
+    Following Epic 0 - Connection pooling
+    """
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = create_engine(
+                    settings.DATABASE_URL,
+                    pool_size=settings.DATABASE_POOL_SIZE,
+                    max_overflow=settings.DATABASE_MAX_OVERFLOW,
+                    pool_pre_ping=True,  # Verify connections before use
+                    echo=settings.DEBUG,  # Log SQL queries in debug mode
+                )
+                SessionLocal.configure(bind=_engine)
+    return _engine
+
+
+def get_async_engine() -> AsyncEngine:
+    """
+    Async database engine (asyncpg / aiosqlite) for request handlers, created on first use
+
+    Following Epic 0 - Connection pooling
+    """
+    global _async_engine
+    if _async_engine is None:
+        with _engine_lock:
+            if _async_engine is None:
+                # Pool sizing applies to asyncpg; aiosqlite runs on NullPool, which takes no sizing arguments
+                pool_options = (
+                    {}
+                    if settings.database_url_async.startswith("sqlite")
+                    else {
+                        "pool_size": settings.DATABASE_POOL_SIZE,
+                        "max_overflow": settings.DATABASE_MAX_OVERFLOW,
+                    }
+                )
+                _async_engine = create_async_engine(
+                    settings.database_url_async,
+                    pool_pre_ping=True,
+                    echo=settings.DEBUG,
+                    **pool_options,
+                )
+                AsyncSessionLocal.configure(bind=_async_engine)
+    return _async_engine
+
+
+async def dispose_engines() -> None:
+    """Close the connection pools of whichever engines were created"""
+    if _async_engine is not None:
+        await _async_engine.dispose()
+    if _engine is not None:
+        _engine.dispose()
+
+
+def __getattr__(name: str) -> Any:
+    # engine / async_engine stay importable by name; the first access creates the engine
+    if name == "engine":
+        return get_engine()
+    if name == "async_engine":
+        return get_async_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class _LazySessionmaker(sessionmaker):
+    """sessionmaker that creates the sync engine before its first session"""
+
+    def __call__(self, **local_kw: Any) -> Session:
+        get_engine()
+        return super().__call__(**local_kw)
+
+
+class _LazyAsyncSessionmaker(async_sessionmaker):
+    """async_sessionmaker that creates the async engine before its first session"""
+
+    def __call__(self, **local_kw: Any) -> AsyncSession:
+        get_async_engine()
+        return super().__call__(**local_kw)
+
 
 # Create session factory
-SessionLocal = sessionmaker(
+SessionLocal = _LazySessionmaker(
     autocommit=False,
     autoflush=False,
-    bind=engine
+)
+
+# Create async session factory
+# Objects stay usable after commit without an implicit (blocking) reload
+AsyncSessionLocal = _LazyAsyncSessionmaker(
+    autoflush=False,
+    expire_on_commit=False,
 )
 
 # Base class for all models
@@ -54,6 +146,21 @@ def get_db() -> Session:
         db.close()
 
 
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """
+    Dependency to get an async database session
+    
+    Following Epic 0 - Database connection management
+    """
+    async with AsyncSessionLocal() as db:
+        try:
+            yield db
+        except Exception as e:
+            logger.error("database_session_error", error=str(e))
+            await db.rollback()
+            raise
+
+
 def create_tables():
     """
     Create all database tables
@@ -61,7 +168,7 @@ def create_tables():
     Following Epic 0 - Database setup
     """
     logger.info("creating_database_tables")
-    Base.metadata.create_all(bind=engine)
+    Base.metadata.create_all(bind=get_engine())
     logger.info("database_tables_created")
 
 
@@ -70,7 +177,7 @@ def drop_tables():
     Drop all database tables (for testing/development)
     """
     logger.warning("dropping_database_tables")
-    Base.metadata.drop_all(bind=engine)
+    Base.metadata.drop_all(bind=get_engine())
     logger.warning("database_tables_dropped")
 
 
@@ -0,0 +1,182 @@
+"""
+TaskFlow AI - Time-Range Table Partitioning
+
+Following Database Template Epic 0: Database Architecture Planning
+- Native PostgreSQL range partitioning of append-only tables by a timestamp column
+- Fixed-width partitions created ahead of time, so inserts never wait on DDL
+- Retention by dropping whole expired partitions instead of deleting rows
+- Other dialects, and tables not yet migrated to partitioning, keep a plain
+  table; callers fall back to batched deletes
+"""
+
+import re
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Tuple
+
+from sqlalchemy import Table, event, text
+from sqlalchemy.engine import Connection
+import structlog
+
+from app.db.database import get_async_engine
+
+logger = structlog.get_logger(__name__)
+
+# Partition boundaries are counted from a Monday, so 7-day partitions are calendar weeks
+EPOCH = datetime(1970, 1, 5, tzinfo=timezone.utc)
+
+_BOUND = re.compile(r"FROM \('([^']+)'\) TO \('([^']+)'\)")
+
+
+class RangePartitions:
+    """
+    Fixed-width range partitions of table by a timestamp column
+
+    Partition n covers [EPOCH + n * width, EPOCH + (n + 1) * width) and is
+    named <table>_pYYYYMMDD after its lower bound. ensure() keeps the
+    current partition and the next premake ones in place; a DEFAULT
+    partition catches rows outside them (clock skew, a lapsed premake) so
+    inserts never fail, and should stay empty. Queries filtering on the
+    column are pruned by the planner to the partitions they touch.
+
+    Tables are only created partitioned; an existing plain table has to be
+    migrated by hand, and until then everything here treats it as plain.
+    """
+
+    def __init__(self, table: str, column: str, width_days: int, premake: int):
+        self.table = table
+        self.column = column
+        self.width = timedelta(days=max(1, width_days))
+        self.premake = max(1, premake)
+        self._partitioned = False  # once seen partitioned, a table stays so
+
+    @property
+    def supported(self) -> bool:
+        """Partitioning is only used on PostgreSQL"""
+        return get_async_engine().dialect.name == "postgresql"
+
+    def is_partitioned_sync(self, connection: Connection) -> bool:
+        """Whether the table exists and is a partitioned table (relkind 'p')"""
+        relkind = connection.execute(
+            text("SELECT relkind FROM pg_class WHERE oid = to_regclass(:table)"),
+            {"table": self.table},
+        ).scalar()
+        return relkind == "p"
+
+    async def enabled(self) -> bool:
+        """Whether the table is actually partitioned; False on other dialects"""
+        if not self._partitioned and self.supported:
+            async with get_async_engine().connect() as connection:
+                self._partitioned = await connection.run_sync(self.is_partitioned_sync)
+        return self._partitioned
+
+    @property
+    def partition_by(self) -> str:
+        """postgresql_partition_by clause for the parent table"""
+        return f"RANGE ({self.column})"
+
+    def bounds(self, at: datetime) -> Tuple[datetime, datetime]:
+        """[start, end) of the partition holding timestamp at"""
+        if at.tzinfo is None:
+            at = at.replace(tzinfo=timezone.utc)
+        start = EPOCH + ((at - EPOCH) // self.width) * self.width
+        return start, start + self.width
+
+    def partition_name(self, start: datetime) -> str:
+        return f"{self.table}_p{start:%Y%m%d}"
+
+    def attach(self, table: Table) -> None:
+        """Create the initial partitions whenever table itself is created"""
+        event.listen(table, "after_create", self._after_create)
+
+    def _after_create(self, target: Table, connection: Connection, **kw) -> None:
+        if connection.dialect.name == "postgresql":
+            self.ensure_sync(connection)
+
+    def ensure_sync(
+        self, connection: Connection, now: Optional[datetime] = None, since: Optional[datetime] = None
+    ) -> List[str]:
+        """
+        Create the DEFAULT, current and next premake partitions if missing
+
+        Following Epic 0 - Database setup
+        since also creates the partitions back to that timestamp (backfills).
+        Returns the names of partitions that did not exist before.
+        """
+        now = now or datetime.now(timezone.utc)
+        start, _ = self.bounds(since or now)
+        current, _ = self.bounds(now)
+        count = (current - start) // self.width + self.premake + 1
+        existing = {name for name, _, _ in self.list_sync(connection)}
+        created = []
+
+        default = f"{self.table}_default"
+        if default not in existing:
+            connection.execute(text(f'CREATE TABLE IF NOT EXISTS "{default}" PARTITION OF "{self.table}" DEFAULT'))
+            created.append(default)
+
+        for n in range(count):
+            lower = start + n * self.width
+            name = self.partition_name(lower)
+            if name in existing:
+                continue
+            connection.execute(text(
+                f'CREATE TABLE IF NOT EXISTS "{name}" PARTITION OF "{self.table}" '
+                f"FOR VALUES FROM ('{lower.isoformat()}') TO ('{(lower + self.width).isoformat()}')"
+            ))
+            created.append(name)
+
+        if created:
+            logger.info("partitions_created", table=self.table, partitions=created)
+        return created
+
+    def list_sync(self, connection: Connection) -> List[Tuple[str, Optional[datetime], Optional[datetime]]]:
+        """(name, lower, upper) of every partition; bounds are None for the DEFAULT partition"""
+        rows = connection.execute(
+            text(
+                "SELECT c.relname, pg_get_expr(c.relpartbound, c.oid) "
+                "FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+                "WHERE i.inhparent = CAST(:parent AS regclass)"
+            ),
+            {"parent": self.table},
+        )
+        partitions = []
+        for name, bound in rows:
+            match = _BOUND.search(bound or "")
+            if match:
+                partitions.append((name, datetime.fromisoformat(match[1]), datetime.fromisoformat(match[2])))
+            else:
+                partitions.append((name, None, None))
+        return sorted(partitions, key=lambda p: (p[1] is not None, p[1] or EPOCH))
+
+    def expired_sync(self, connection: Connection, cutoff: datetime) -> List[str]:
+        """Partitions whose every row is older than cutoff"""
+        return [name for name, _, upper in self.list_sync(connection) if upper is not None and upper <= cutoff]
+
+    def drop_sync(self, connection: Connection, name: str, lock_timeout: str = "5s") -> None:
+        """
+        Drop one partition
+
+        Dropping takes a brief exclusive lock on the parent; lock_timeout
+        makes it give up (and retry next sweep) rather than queue inserts
+        behind a long-running query.
+        """
+        connection.execute(text(f"SET LOCAL lock_timeout = '{lock_timeout}'"))
+        connection.execute(text(f'DROP TABLE IF EXISTS "{name}"'))
+        logger.info("partition_dropped", table=self.table, partition=name)
+
+    async def ensure(self, now: Optional[datetime] = None, since: Optional[datetime] = None) -> List[str]:
+        """ensure_sync() on the async engine; no-op unless the table is partitioned"""
+        if not await self.enabled():
+            if self.supported:
+                logger.warning("table_not_partitioned", table=self.table)
+            return []
+        async with get_async_engine().begin() as connection:
+            return await connection.run_sync(self.ensure_sync, now, since)
+
+    async def expired(self, cutoff: datetime) -> List[str]:
+        async with get_async_engine().connect() as connection:
+            return await connection.run_sync(self.expired_sync, cutoff)
+
+    async def drop(self, name: str) -> None:
+        async with get_async_engine().begin() as connection:
+            await connection.run_sync(self.drop_sync, name)
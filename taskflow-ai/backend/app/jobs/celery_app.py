@@ -0,0 +1,89 @@
+"""
+TaskFlow AI - Celery Worker Application
+
+Following Backend Template Epic 4: Advanced Business Logic
+- Celery app for JOBS_BACKEND=celery, one Celery task per registered job
+- Priority queues and periodic schedules
+
+Run workers with:
+    celery -A app.jobs.celery_app worker -Q critical,default,bulk
+    celery -A app.jobs.celery_app beat
+"""
+
+import asyncio
+from typing import Any, Optional
+
+from celery import Celery
+from celery.schedules import crontab
+from kombu import Queue
+import redis
+import structlog
+
+from app.core.config import check_config, settings
+from app.jobs.queue import JOB_KEY_PREFIX
+from app.jobs.tasks import JOB_QUEUES, JOBS, JobSpec
+
+logger = structlog.get_logger(__name__)
+
+check_config()
+
+broker_url = settings.JOBS_BROKER_URL or settings.REDIS_URL
+
+celery_app = Celery("taskflow")
+celery_app.conf.update(
+    broker_url=broker_url,
+    task_ignore_result=True,
+    task_serializer="json",
+    accept_content=["json"],
+    task_queues=[Queue(queue) for queue in JOB_QUEUES],
+    task_default_queue="default",
+    task_routes={spec.name: {"queue": spec.queue} for spec in JOBS.values()},
+    broker_transport_options={"queue_order_strategy": "priority", "priority_steps": list(range(10))},
+    # Jobs are short and idempotent; redeliver if a worker dies mid-job
+    task_acks_late=True,
+    worker_prefetch_multiplier=1,
+    beat_schedule={
+        "email-deliver-outbox": {
+            "task": "email.deliver_outbox",
+            "schedule": settings.EMAIL_POLL_INTERVAL_SECONDS,
+        },
+        "retention-sweep": {
+            "task": "maintenance.retention",
+            "schedule": settings.RETENTION_INTERVAL_SECONDS,
+        },
+        "weekly-digest": {
+            "task": "digest.weekly",
+            "schedule": crontab(minute=0, hour=6, day_of_week="mon"),
+        },
+    },
+)
+
+# One event loop per worker process, so pooled async DB connections stay
+# bound to the loop that created them across tasks
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_redis: Optional[redis.Redis] = None
+
+
+def _run(spec: JobSpec, kwargs: dict) -> Any:
+    global _loop, _redis
+
+    key = kwargs.pop("_job_key", None)
+    if key is not None:
+        # Started: an identical job may be queued again
+        if _redis is None:
+            _redis = redis.Redis.from_url(broker_url)
+        _redis.delete(JOB_KEY_PREFIX + key)
+
+    if _loop is None:
+        _loop = asyncio.new_event_loop()
+    return _loop.run_until_complete(spec.handler(**kwargs))
+
+
+def _register(spec: JobSpec) -> None:
+    @celery_app.task(name=spec.name)
+    def run(**kwargs: Any) -> Any:
+        return _run(spec, kwargs)
+
+
+for _spec in JOBS.values():
+    _register(_spec)
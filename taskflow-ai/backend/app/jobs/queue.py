@@ -0,0 +1,283 @@
+"""
+TaskFlow AI - Background Job Queue
+
+Following Backend Template Epic 4: Advanced Business Logic
+- Request-side enqueue that only appends to an in-process buffer
+- Dispatch to an in-process runner or to Celery over Redis
+- Idempotent job keys: a keyed job is queued at most once until it starts
+"""
+
+import asyncio
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+
+import structlog
+
+from app.core.config import settings
+from app.jobs.tasks import JOB_QUEUES, JOBS, JobSpec
+
+logger = structlog.get_logger(__name__)
+
+# (name, key, kwargs)
+QueuedJob = Tuple[str, Optional[str], Dict[str, Any]]
+
+# Redis marker held by a keyed job between publish and worker start
+JOB_KEY_PREFIX = "taskflow:job-key:"
+
+# Per-job outcomes of a backend dispatch
+DISPATCHED = "dispatched"
+DUPLICATE = "duplicate"
+FAILED = "failed"
+
+
+class MemoryJobBackend:
+    """
+    Runs jobs in this process, each as its own task on the event loop
+
+    No broker is needed, so the whole pipeline runs in tests and single
+    instance deployments without Redis. A slow bulk job does not hold up
+    the critical ones dispatched after it.
+    """
+
+    name = "memory"
+
+    def __init__(self):
+        self._running: Set[asyncio.Task] = set()
+
+    async def dispatch(self, jobs: List[QueuedJob]) -> List[str]:
+        for name, _, kwargs in jobs:
+            task = asyncio.create_task(run_job(JOBS[name], kwargs))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+        return [DISPATCHED] * len(jobs)
+
+    async def submit(self, spec: JobSpec, kwargs: Dict[str, Any]) -> None:
+        await spec.handler(**kwargs)
+
+    async def join(self) -> None:
+        """Wait for dispatched jobs to finish"""
+        while self._running:
+            await asyncio.gather(*self._running)
+
+
+class CeleryJobBackend:
+    """
+    Publishes jobs to Celery workers
+
+    Publishing is blocking network I/O, so it runs in a thread. A keyed job
+    claims a Redis marker first; the worker deletes it when the job starts,
+    so duplicates are dropped across all API processes while a job waits.
+    A job whose publish fails gives its marker back, so a retry is not
+    dropped as a duplicate of a job that was never sent.
+    """
+
+    name = "celery"
+
+    def __init__(self, broker_url: str, idempotency_ttl: int):
+        self.broker_url = broker_url
+        self.idempotency_ttl = idempotency_ttl
+        self._app = None
+        self._redis = None
+
+    def _client(self):
+        if self._app is None:
+            import redis
+
+            from app.jobs.celery_app import celery_app
+
+            self._redis = redis.Redis.from_url(self.broker_url)
+            self._app = celery_app
+        return self._app
+
+    def _send(self, spec: JobSpec, kwargs: Dict[str, Any]) -> None:
+        self._client().send_task(spec.name, kwargs=kwargs, queue=spec.queue, priority=spec.priority)
+
+    def _publish(self, jobs: List[QueuedJob]) -> List[str]:
+        """Publish each job; returns its outcome (DISPATCHED, DUPLICATE or FAILED)"""
+        self._client()
+        outcomes = []
+        for name, key, kwargs in jobs:
+            claimed = False
+            try:
+                if key is not None:
+                    claimed = bool(self._redis.set(JOB_KEY_PREFIX + key, 1, nx=True, ex=self.idempotency_ttl))
+                    if not claimed:
+                        outcomes.append(DUPLICATE)
+                        continue
+                    kwargs = {**kwargs, "_job_key": key}
+                self._send(JOBS[name], kwargs)
+            except Exception as e:
+                logger.error("job_publish_failed", job=name, key=key, error=str(e))
+                if claimed:
+                    self._release_key(key)
+                outcomes.append(FAILED)
+                continue
+            outcomes.append(DISPATCHED)
+        return outcomes
+
+    def _release_key(self, key: str) -> None:
+        try:
+            self._redis.delete(JOB_KEY_PREFIX + key)
+        except Exception as e:
+            # Expires after idempotency_ttl anyway
+            logger.warning("job_key_release_failed", key=key, error=str(e))
+
+    async def dispatch(self, jobs: List[QueuedJob]) -> List[str]:
+        return await asyncio.to_thread(self._publish, jobs)
+
+    async def submit(self, spec: JobSpec, kwargs: Dict[str, Any]) -> None:
+        await asyncio.to_thread(self._send, spec, kwargs)
+
+    async def join(self) -> None:
+        """Published jobs belong to the workers; nothing to wait for"""
+
+
+async def run_job(spec: JobSpec, kwargs: Dict[str, Any]) -> Any:
+    """Run one job handler, logging instead of raising on failure"""
+    try:
+        return await spec.handler(**kwargs)
+    except Exception as e:
+        logger.error("job_failed", job=spec.name, error=str(e))
+        return None
+
+
+class JobQueue:
+    """
+    Buffers jobs on the request path and dispatches them in the background
+
+    enqueue() is a dict lookup and a deque append, so side effects cost the
+    request microseconds. A dispatcher task drains the buffer by queue
+    priority (critical, default, bulk) and hands each batch to the backend.
+    A job enqueued with a key is dropped while an identical key is still
+    waiting. When the buffer is full, new jobs are dropped and logged.
+
+    submit() skips the buffer for callers that already batch, such as the
+    login audit writer: it runs or publishes one job and raises on failure.
+    """
+
+    def __init__(self, backend, max_queue_size: int, max_batch_size: int = 100):
+        self.backend = backend
+        self.max_queue_size = max(1, max_queue_size)
+        self.max_batch_size = max(1, max_batch_size)
+
+        self._queues: Dict[str, Deque[QueuedJob]] = {queue: deque() for queue in JOB_QUEUES}
+        self._size = 0
+        self._waiting_keys: Set[str] = set()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+        self.enqueued = 0
+        self.deduplicated = 0
+        self.dropped = 0
+        self.dispatched = 0
+        self.failed = 0
+
+    def enqueue(self, name: str, key: Optional[str] = None, **kwargs: Any) -> bool:
+        """Queue a job; returns False if it was a duplicate or the buffer is full"""
+        spec = JOBS.get(name)
+        if spec is None:
+            raise ValueError(f"Unknown job: {name}")
+
+        if key is not None and key in self._waiting_keys:
+            self.deduplicated += 1
+            return False
+        if self._size >= self.max_queue_size:
+            self.dropped += 1
+            logger.warning("job_dropped", job=name, key=key)
+            return False
+
+        if key is not None:
+            self._waiting_keys.add(key)
+        self._queues[spec.queue].append((name, key, kwargs))
+        self._size += 1
+        self.enqueued += 1
+
+        if self._wakeup is not None:
+            self._wakeup.set()
+        return True
+
+    async def submit(self, name: str, **kwargs: Any) -> None:
+        """Run (memory) or publish (celery) one job now"""
+        await self.backend.submit(JOBS[name], kwargs)
+        self.dispatched += 1
+
+    async def start(self) -> None:
+        """Start the dispatcher task"""
+        if self._task is None:
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+            logger.info("job_queue_started", backend=self.backend.name)
+
+    async def stop(self) -> None:
+        """Stop the dispatcher, dispatch everything still buffered and wait for in-process jobs"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        await self.drain()
+        await self.backend.join()
+
+    async def _run(self) -> None:
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            await self.drain()
+
+    def _next_batch(self) -> List[QueuedJob]:
+        batch: List[QueuedJob] = []
+        for queue in JOB_QUEUES:
+            pending = self._queues[queue]
+            while pending and len(batch) < self.max_batch_size:
+                batch.append(pending.popleft())
+            if batch:
+                break  # re-check higher priorities before taking lower ones
+        self._size -= len(batch)
+        return batch
+
+    async def drain(self) -> None:
+        """Dispatch buffered jobs, highest priority first"""
+        while self._size:
+            batch = self._next_batch()
+            # The key is free again once the job has left this process
+            self._waiting_keys.difference_update(key for _, key, _ in batch if key is not None)
+            try:
+                outcomes = await self.backend.dispatch(batch)
+            except Exception as e:
+                self.failed += len(batch)
+                logger.error("job_dispatch_failed", jobs=len(batch), backend=self.backend.name, error=str(e))
+                continue
+            self.dispatched += outcomes.count(DISPATCHED)
+            self.deduplicated += outcomes.count(DUPLICATE)
+            self.failed += outcomes.count(FAILED)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Snapshot of queue metrics for monitoring"""
+        return {
+            "backend": self.backend.name,
+            "buffered": {queue: len(pending) for queue, pending in self._queues.items()},
+            "enqueued": self.enqueued,
+            "deduplicated": self.deduplicated,
+            "dropped": self.dropped,
+            "dispatched": self.dispatched,
+            "failed": self.failed,
+        }
+
+
+def create_job_queue() -> JobQueue:
+    """Job queue for the configured backend"""
+    if settings.JOBS_BACKEND.lower() == "celery":
+        backend = CeleryJobBackend(
+            broker_url=settings.JOBS_BROKER_URL or settings.REDIS_URL,
+            idempotency_ttl=settings.JOBS_IDEMPOTENCY_TTL_SECONDS,
+        )
+    else:
+        backend = MemoryJobBackend()
+    return JobQueue(backend, max_queue_size=settings.JOBS_MAX_QUEUE_SIZE)
+
+
+# Global job queue instance
+job_queue = create_job_queue()
@@ -0,0 +1,112 @@
+"""
+TaskFlow AI - Background Job Definitions
+
+Following Backend Template Epic 4: Advanced Business Logic
+- Job handlers shared by the in-process and Celery backends
+- Queue routing by priority: critical, default, bulk
+"""
+
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from sqlalchemy import insert, update
+import structlog
+
+from app.db.database import AsyncSessionLocal
+from app.models.user import LoginAttempt, User, UserSession
+
+logger = structlog.get_logger(__name__)
+
+# Highest priority first; in-process dispatch drains them in this order
+JOB_QUEUES = ("critical", "default", "bulk")
+
+
+@dataclass(frozen=True)
+class JobSpec:
+    """A named job, its async handler and the queue it is routed to"""
+    name: str
+    handler: Callable[..., Awaitable[Any]]
+    queue: str = "default"
+
+    @property
+    def priority(self) -> int:
+        """Celery message priority (Redis transport: 0 is highest)"""
+        return JOB_QUEUES.index(self.queue) * 3
+
+
+JOBS: Dict[str, JobSpec] = {}
+
+
+def job(name: str, queue: str = "default"):
+    """Register an async function as a background job"""
+    if queue not in JOB_QUEUES:
+        raise ValueError(f"Unknown job queue: {queue}")
+
+    def register(handler: Callable[..., Awaitable[Any]]):
+        JOBS[name] = JobSpec(name=name, handler=handler, queue=queue)
+        return handler
+
+    return register
+
+
+@job("email.deliver_outbox", queue="critical")
+async def deliver_outbox() -> int:
+    """Send everything due in the email outbox"""
+    from app.services.mail_delivery import mail_delivery_worker
+
+    delivered = 0
+    while True:
+        claimed = await mail_delivery_worker.deliver_due()
+        delivered += claimed
+        if claimed < mail_delivery_worker.batch_size:
+            return delivered
+
+
+@job("auth.record_login_attempts")
+async def record_login_attempts(rows: List[Dict[str, Any]]) -> None:
+    """Bulk-insert a batch of login attempt audit rows"""
+    async with AsyncSessionLocal() as db:
+        await db.execute(insert(LoginAttempt), rows)
+        await db.commit()
+
+
+@job("auth.stamp_last_login")
+async def stamp_last_login(stamps: List[Dict[str, Any]]) -> None:
+    """Write a batch of last_login stamps as one bulk UPDATE by primary key"""
+    async with AsyncSessionLocal() as db:
+        await db.execute(update(User), stamps)
+        await db.commit()
+
+
+@job("auth.touch_sessions")
+async def touch_sessions(stamps: List[Dict[str, Any]]) -> None:
+    """Write a batch of session last_activity stamps as one bulk UPDATE by primary key"""
+    async with AsyncSessionLocal() as db:
+        await db.execute(update(UserSession), stamps)
+        await db.commit()
+
+
+@job("digest.weekly", queue="bulk")
+async def weekly_digest(period_start: Optional[str] = None) -> Dict[str, Any]:
+    """Queue (or resume) a week's digest emails"""
+    from app.services.weekly_digest import weekly_digest_runner
+
+    return await weekly_digest_runner.service.run(date.fromisoformat(period_start) if period_start else None)
+
+
+@job("maintenance.retention", queue="bulk")
+async def retention_sweep() -> Dict[str, Any]:
+    """Purge auth rows past their retention"""
+    from app.services.retention import retention_sweeper
+
+    return await retention_sweeper.sweep()
+
+
+@job("stats.rebuild", queue="bulk")
+async def rebuild_user_stats() -> int:
+    """Recompute every user's task rollups"""
+    from app.services.user_stats import AsyncUserStatsService
+
+    async with AsyncSessionLocal() as db:
+        return await AsyncUserStatsService(db).rebuild()
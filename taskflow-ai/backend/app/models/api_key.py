@@ -0,0 +1,47 @@
+"""
+TaskFlow AI - API Key Models
+
+Following Database Template Epic 1: User & Authentication Schema
+- Machine-to-machine API keys
+- Indexed lookup ids with HMAC-SHA256 key hashes
+"""
+
+import uuid
+
+from sqlalchemy import Column, String, Boolean, DateTime
+from sqlalchemy import Uuid as UUID  # native UUID on PostgreSQL, CHAR(32) on SQLite
+from sqlalchemy.sql import func
+
+from app.db.database import Base
+
+
+class APIKey(Base):
+    """
+    API key for machine-to-machine authentication
+
+    Following Database Epic 1 - Session & Security Schema
+    """
+    __tablename__ = "api_keys"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id = Column(UUID(as_uuid=True), nullable=False, index=True)
+    name = Column(String(100), nullable=False)
+
+    # Key information
+    # lookup_id is NULL only for legacy keys that have not been used since import
+    lookup_id = Column(String(16), unique=True, nullable=True, index=True)
+    key_hash = Column(String(255), nullable=False)  # HMAC-SHA256 hex, or bcrypt for unmigrated legacy keys
+    is_legacy = Column(Boolean, default=False, nullable=False)
+
+    # Key lifecycle
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    last_used_at = Column(DateTime(timezone=True), nullable=True)
+    revoked_at = Column(DateTime(timezone=True), nullable=True)
+
+    @property
+    def is_revoked(self) -> bool:
+        """Check if key has been revoked"""
+        return self.revoked_at is not None
+
+    def __repr__(self):
+        return f"<APIKey(id={self.id}, user_id={self.user_id}, lookup_id={self.lookup_id})>"
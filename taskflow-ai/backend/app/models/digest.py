@@ -0,0 +1,37 @@
+"""
+TaskFlow AI - Digest Models
+
+Following Database Template Epic 2: Core Business Schema
+- Weekly digest run checkpoints
+"""
+
+from sqlalchemy import Column, Date, DateTime, Integer, String
+from sqlalchemy import Uuid as UUID  # native UUID on PostgreSQL, CHAR(32) on SQLite
+from sqlalchemy.sql import func
+
+from app.db.database import Base
+
+
+class DigestRun(Base):
+    """
+    Progress of the weekly digest for one week
+
+    last_user_id is the keyset cursor: it is advanced in the same
+    transaction that queues a chunk's emails, so a run restarted after a
+    crash continues after the last queued chunk without sending twice.
+    """
+    __tablename__ = "digest_runs"
+
+    period_start = Column(Date, primary_key=True)  # Monday (UTC) of the summarized week
+
+    status = Column(String(20), default="running", nullable=False)  # running, completed
+    last_user_id = Column(UUID(as_uuid=True), nullable=True)
+    users_scanned = Column(Integer, default=0, nullable=False)
+    emails_queued = Column(Integer, default=0, nullable=False)
+
+    started_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    completed_at = Column(DateTime(timezone=True), nullable=True)
+
+    def __repr__(self):
+        return f"<DigestRun(period_start={self.period_start}, status='{self.status}')>"
@@ -0,0 +1,52 @@
+"""
+TaskFlow AI - Email Models
+
+Following Database Template Epic 2: Core Business Schema
+- Persistent outbound mail queue (outbox)
+"""
+
+import uuid
+
+from sqlalchemy import Column, DateTime, Index, Integer, String, Text
+from sqlalchemy import Uuid as UUID  # native UUID on PostgreSQL, CHAR(32) on SQLite
+from sqlalchemy.sql import func
+
+from app.db.database import Base
+
+# Outbox lifecycle; "sending" rows whose lease (next_attempt_at) expired are reclaimed
+EMAIL_STATUSES = ("pending", "sending", "sent", "failed")
+
+
+class OutboundEmail(Base):
+    """
+    One queued email
+
+    Written on the request path; delivered, retried and finalized by the
+    mail delivery worker.
+    """
+    __tablename__ = "email_outbox"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+
+    to_address = Column(String(255), nullable=False)
+    subject = Column(String(255), nullable=False)
+    body_text = Column(Text, nullable=False)
+    body_html = Column(Text, nullable=True)
+    kind = Column(String(50), nullable=False)  # verification, password_reset, ...
+
+    # Delivery state
+    status = Column(String(20), default="pending", nullable=False)
+    attempts = Column(Integer, default=0, nullable=False)
+    next_attempt_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    last_error = Column(Text, nullable=True)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    sent_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        # Worker claim query: due rows by status, oldest first
+        Index("ix_email_outbox_status_next_attempt_at", "status", "next_attempt_at"),
+    )
+
+    def __repr__(self):
+        return f"<OutboundEmail(id={self.id}, kind='{self.kind}', status='{self.status}')>"
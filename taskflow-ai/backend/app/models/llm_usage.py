@@ -0,0 +1,30 @@
+"""
+TaskFlow AI - LLM Usage Models
+
+Following Database Template Epic 2: Core Business Schema
+- Daily token usage per user and AI endpoint
+"""
+
+from sqlalchemy import BigInteger, Column, Date, DateTime, Integer, String
+from sqlalchemy import Uuid as UUID  # native UUID on PostgreSQL, CHAR(32) on SQLite
+from sqlalchemy.sql import func
+
+from app.db.database import Base
+
+
+class LLMTokenUsage(Base):
+    """Tokens sent to and received from the LLM by one user, per day and endpoint"""
+    __tablename__ = "llm_token_usage"
+
+    user_id = Column(UUID(as_uuid=True), primary_key=True)
+    usage_date = Column(Date, primary_key=True)  # UTC
+    endpoint = Column(String(50), primary_key=True)
+
+    prompt_tokens = Column(BigInteger, default=0, nullable=False)
+    completion_tokens = Column(BigInteger, default=0, nullable=False)
+    requests = Column(Integer, default=0, nullable=False)
+
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    def __repr__(self):
+        return f"<LLMTokenUsage(user_id={self.user_id}, usage_date={self.usage_date}, endpoint='{self.endpoint}')>"
@@ -0,0 +1,72 @@
+"""
+TaskFlow AI - Task Models
+
+Following Database Template Epic 2: Core Business Schema
+- Task management schema
+- Composite indexes matching the keyset listing order
+"""
+
+import uuid
+
+from sqlalchemy import Column, String, DateTime, Text, Integer, Numeric, Index
+from sqlalchemy import Uuid as UUID  # native UUID on PostgreSQL, CHAR(32) on SQLite
+from sqlalchemy.sql import func
+
+from app.db.database import Base
+
+# Task status values
+TASK_STATUSES = ("pending", "in_progress", "completed", "cancelled")
+
+# Columns returned by task listings; the listing indexes INCLUDE them on
+# PostgreSQL so list pages are served by index-only scans
+TASK_LISTING_INCLUDE = ["title", "priority", "project_id"]
+
+
+class Task(Base):
+    """
+    Task model for user task management
+
+    Following Database Epic 2 - Task Management Schema
+    """
+    __tablename__ = "tasks"
+    __table_args__ = (
+        # Listing filtered by status, ordered by due date
+        Index(
+            "ix_tasks_user_status_due_date_id",
+            "user_id", "status", "due_date", "id",
+            postgresql_include=TASK_LISTING_INCLUDE,
+        ),
+        # Listing across all statuses, ordered by due date
+        Index(
+            "ix_tasks_user_due_date_id",
+            "user_id", "due_date", "id",
+            postgresql_include=TASK_LISTING_INCLUDE + ["status"],
+        ),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id = Column(UUID(as_uuid=True), nullable=False)
+    project_id = Column(UUID(as_uuid=True), nullable=True, index=True)
+
+    # Task content
+    title = Column(String(255), nullable=False)
+    description = Column(Text, nullable=True)
+
+    # Planning
+    priority = Column(Integer, default=2, nullable=False)  # 1=High, 2=Medium, 3=Low
+    status = Column(String(20), default="pending", nullable=False)
+    due_date = Column(DateTime(timezone=True), nullable=True)
+    ai_priority_score = Column(Numeric(5, 2), nullable=True)
+
+    # Timestamps
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    completed_at = Column(DateTime(timezone=True), nullable=True)
+
+    @property
+    def is_completed(self) -> bool:
+        """Check if task is completed"""
+        return self.status == "completed"
+
+    def __repr__(self):
+        return f"<Task(id={self.id}, user_id={self.user_id}, status={self.status})>"
@@ -8,15 +8,17 @@ Following Database Template Epic 1: User & Authentication Schema
 """
 
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 
-from sqlalchemy import Column, String, Boolean, DateTime, Text, JSON
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, Boolean, DateTime, Text, JSON, Index
+from sqlalchemy import Uuid as UUID  # native UUID on PostgreSQL, CHAR(32) on SQLite
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 
+from app.core.config import settings
 from app.db.database import Base
+from app.db.partitioning import RangePartitions
 
 
 class User(Base):
@@ -102,11 +104,11 @@ class UserSession(Base):
     # Session lifecycle
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     last_activity = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    expires_at = Column(DateTime(timezone=True), nullable=False)
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)  # retention sweeps by this
     
     # Session status
     is_active = Column(Boolean, default=True, nullable=False)
-    revoked_at = Column(DateTime(timezone=True), nullable=True)
+    revoked_at = Column(DateTime(timezone=True), nullable=True, index=True)  # revocation sync polls by this
     
     def __repr__(self):
         return f"<UserSession(id={self.id}, user_id={self.user_id})>"
@@ -128,7 +130,7 @@ class PasswordResetToken(Base):
     
     # Token lifecycle
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    expires_at = Column(DateTime(timezone=True), nullable=False)
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)  # retention sweeps by this
     used_at = Column(DateTime(timezone=True), nullable=True)
     
     # Security tracking
@@ -149,18 +151,38 @@ class PasswordResetToken(Base):
         return f"<PasswordResetToken(id={self.id}, user_id={self.user_id})>"
 
 
+# Stored as login_attempts.ip_address when the client address is not known
+UNKNOWN_IP = "unknown"
+
+# Range partitions of login_attempts by attempted_at (PostgreSQL only)
+login_attempt_partitions = RangePartitions(
+    "login_attempts",
+    "attempted_at",
+    width_days=settings.LOGIN_ATTEMPT_PARTITION_DAYS,
+    premake=settings.LOGIN_ATTEMPT_PARTITION_PREMAKE,
+)
+
+
 class LoginAttempt(Base):
     """
     Login attempt tracking for security
     
     Following Database Epic 1 - Login attempts and security logging
+    On PostgreSQL the table is range-partitioned by attempted_at, so the
+    primary key includes it; lockout queries prune to recent partitions and
+    retention drops old ones.
     """
     __tablename__ = "login_attempts"
+    __table_args__ = (
+        # Per-email failure lookups; also covers plain email lookups
+        Index("ix_login_attempts_email_success_attempted_at", "email", "success", "attempted_at"),
+        {"postgresql_partition_by": login_attempt_partitions.partition_by},
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     
     # Attempt information
-    email = Column(String(255), nullable=False, index=True)
+    email = Column(String(255), nullable=False)
     ip_address = Column(String(45), nullable=False)
     user_agent = Column(Text, nullable=True)
     
@@ -169,7 +191,16 @@ class LoginAttempt(Base):
     failure_reason = Column(String(100), nullable=True)  # invalid_password, user_not_found, etc.
     
     # Timestamps
-    attempted_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    attempted_at = Column(
+        DateTime(timezone=True),
+        primary_key=True,  # partition key must be part of the primary key
+        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
+        index=True,
+    )
     
     def __repr__(self):
         return f"<LoginAttempt(id={self.id}, email={self.email}, success={self.success})>"
+
+
+login_attempt_partitions.attach(LoginAttempt.__table__)
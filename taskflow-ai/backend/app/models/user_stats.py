@@ -0,0 +1,52 @@
+"""
+TaskFlow AI - User Statistics Models
+
+Following Database Template Epic 2: Core Business Schema
+- Per-user task rollups maintained with each task write
+- Per-project open task counters backing active_projects
+"""
+
+from sqlalchemy import Column, Date, DateTime, Integer
+from sqlalchemy import Uuid as UUID  # native UUID on PostgreSQL, CHAR(32) on SQLite
+from sqlalchemy.sql import func
+
+from app.db.database import Base
+
+
+class UserStatistics(Base):
+    """
+    Task counters and completion streak for one user
+
+    Updated in the same transaction as the task write that changes them;
+    rates and scores are derived from these counters when read.
+    """
+    __tablename__ = "user_stats"
+
+    user_id = Column(UUID(as_uuid=True), primary_key=True)
+
+    # Counters
+    total_tasks = Column(Integer, default=0, nullable=False)
+    completed_tasks = Column(Integer, default=0, nullable=False)
+    active_projects = Column(Integer, default=0, nullable=False)
+
+    # Streak of consecutive UTC days with at least one completion,
+    # ending on last_completed_on
+    streak_days = Column(Integer, default=0, nullable=False)
+    last_completed_on = Column(Date, nullable=True)
+
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    def __repr__(self):
+        return f"<UserStatistics(user_id={self.user_id}, total_tasks={self.total_tasks})>"
+
+
+class UserProjectStatistics(Base):
+    """Open (pending or in progress) task count per user and project"""
+    __tablename__ = "user_project_stats"
+
+    user_id = Column(UUID(as_uuid=True), primary_key=True)
+    project_id = Column(UUID(as_uuid=True), primary_key=True)
+    open_tasks = Column(Integer, default=0, nullable=False)
+
+    def __repr__(self):
+        return f"<UserProjectStatistics(user_id={self.user_id}, project_id={self.project_id})>"
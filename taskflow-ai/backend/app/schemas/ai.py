@@ -0,0 +1,84 @@
+"""
+TaskFlow AI - AI Feature Schemas
+
+Following Backend Template Epic 2: Core API Framework
+- Request/response validation and serialization
+- Pydantic models for AI-powered features
+"""
+
+from datetime import datetime
+from typing import Dict, List, Optional
+from uuid import UUID
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from pydantic import BaseModel, Field, validator
+
+from app.schemas.auth import UserStats
+
+
+class TaskSuggestionRequest(BaseModel):
+    """Task to suggest next steps for"""
+    title: str = Field(..., min_length=1, max_length=255)
+    description: Optional[str] = Field(default=None, max_length=2000)
+
+
+class TaskSuggestionResponse(BaseModel):
+    """AI suggestions for a task"""
+    suggestions: List[str] = []
+
+
+class InsightsResponse(BaseModel):
+    """AI productivity insights for the current user"""
+    insights: List[str] = []
+    stats: UserStats
+
+
+class PrioritizeRequest(BaseModel):
+    """Backlog prioritization options"""
+    limit: int = Field(default=50, ge=1, le=1000)
+    project_weights: Dict[UUID, float] = {}  # multiplier per project, default 1.0
+    dependency_counts: Dict[UUID, int] = {}  # tasks waiting on each task
+    use_ai: bool = True  # let the LLM order near-tied top items
+
+
+class PrioritizedTask(BaseModel):
+    """A ranked task"""
+    id: UUID
+    title: str
+    score: float
+    rank: int
+
+
+class PrioritizeResponse(BaseModel):
+    """Ranked open tasks of the current user"""
+    items: List[PrioritizedTask] = []
+    total_tasks: int = 0
+    ai_reviewed: int = 0  # near-tied items the LLM was asked to order
+
+
+class TaskParseRequest(BaseModel):
+    """Quick-add text to turn into task fields"""
+    text: str = Field(..., min_length=1, max_length=500)
+    timezone: Optional[str] = None  # IANA name; defaults to the user's preference, then UTC
+
+    @validator("timezone")
+    def validate_timezone(cls, v):
+        if v is None:
+            return v
+        try:
+            ZoneInfo(v)
+        except (ZoneInfoNotFoundError, ValueError):
+            raise ValueError("Unknown timezone")
+        return v
+
+
+class TaskParseResponse(BaseModel):
+    """Task fields parsed from text"""
+    title: str
+    due_date: Optional[datetime] = None
+    priority: Optional[int] = None
+    tags: List[str] = []
+    project: Optional[str] = None
+    recurrence: Optional[str] = None  # RFC 5545 RRULE
+    confidence: float
+    source: str  # "local" or "llm"
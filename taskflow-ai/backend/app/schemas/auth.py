@@ -13,6 +13,23 @@ from uuid import UUID
 from pydantic import BaseModel, EmailStr, Field, validator
 
 
+def check_password_strength(v: str) -> str:
+    """Password strength rules shared by every schema that sets a password"""
+    if len(v) < 8:
+        raise ValueError('Password must be at least 8 characters long')
+    
+    if not any(c.isupper() for c in v):
+        raise ValueError('Password must contain at least one uppercase letter')
+    
+    if not any(c.islower() for c in v):
+        raise ValueError('Password must contain at least one lowercase letter')
+    
+    if not any(c.isdigit() for c in v):
+        raise ValueError('Password must contain at least one digit')
+    
+    return v
+
+
 class UserBase(BaseModel):
     """Base user schema"""
     email: EmailStr
@@ -34,19 +51,7 @@ class UserCreate(UserBase):
     @validator('password')
     def validate_password_strength(cls, v):
         """Validate password strength"""
-        if len(v) < 8:
-            raise ValueError('Password must be at least 8 characters long')
-        
-        if not any(c.isupper() for c in v):
-            raise ValueError('Password must contain at least one uppercase letter')
-        
-        if not any(c.islower() for c in v):
-            raise ValueError('Password must contain at least one lowercase letter')
-        
-        if not any(c.isdigit() for c in v):
-            raise ValueError('Password must contain at least one digit')
-        
-        return v
+        return check_password_strength(v)
 
 
 class UserLogin(BaseModel):
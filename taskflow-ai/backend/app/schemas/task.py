@@ -0,0 +1,74 @@
+"""
+TaskFlow AI - Task Schemas
+
+Following Backend Template Epic 2: Core API Framework
+- Request/response validation and serialization
+- Pydantic models for task management
+"""
+
+from datetime import datetime
+from enum import Enum
+from typing import List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+class TaskStatus(str, Enum):
+    """Task lifecycle states"""
+    pending = "pending"
+    in_progress = "in_progress"
+    completed = "completed"
+    cancelled = "cancelled"
+
+
+class TaskBase(BaseModel):
+    """Base task schema"""
+    title: str = Field(..., min_length=1, max_length=255)
+    description: Optional[str] = None
+    priority: int = Field(default=2, ge=1, le=3)  # 1=High, 2=Medium, 3=Low
+    due_date: Optional[datetime] = None
+    project_id: Optional[UUID] = None
+
+
+class TaskCreate(TaskBase):
+    """Task creation schema"""
+    status: TaskStatus = TaskStatus.pending
+
+
+class TaskUpdate(BaseModel):
+    """Task update schema"""
+    title: Optional[str] = Field(default=None, min_length=1, max_length=255)
+    description: Optional[str] = None
+    priority: Optional[int] = Field(default=None, ge=1, le=3)
+    status: Optional[TaskStatus] = None
+    due_date: Optional[datetime] = None
+    project_id: Optional[UUID] = None
+
+
+class TaskResponse(TaskBase):
+    """Full task response schema"""
+    id: UUID
+    status: TaskStatus
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+class TaskSummary(BaseModel):
+    """Task list item: only the columns listings need"""
+    id: UUID
+    title: str
+    status: TaskStatus
+    priority: int
+    due_date: Optional[datetime] = None
+    project_id: Optional[UUID] = None
+
+
+class TaskPage(BaseModel):
+    """One page of a task listing"""
+    items: List[TaskSummary]
+    next_cursor: Optional[str] = None  # opaque; pass back as ?cursor= for the next page
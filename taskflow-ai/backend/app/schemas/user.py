@@ -0,0 +1,50 @@
+"""
+TaskFlow AI - User Management Schemas
+
+Following Backend Template Epic 2: Core API Framework
+- Request/response validation and serialization
+- Pydantic models for user administration
+"""
+
+from typing import List, Optional
+
+from pydantic import BaseModel, EmailStr, Field, validator
+
+from app.schemas.auth import check_password_strength
+
+
+class UserProvisionRow(BaseModel):
+    """One account in a bulk provisioning upload"""
+    email: EmailStr
+    password: str = Field(..., min_length=8, max_length=100)
+    first_name: Optional[str] = Field(default=None, max_length=100)
+    last_name: Optional[str] = Field(default=None, max_length=100)
+
+    @validator('first_name', 'last_name', pre=True)
+    def empty_as_none(cls, v):
+        # CSV has no null, so empty cells mean "not provided"
+        return v or None
+
+    @validator('password')
+    def validate_password_strength(cls, v):
+        """Validate password strength"""
+        return check_password_strength(v)
+
+
+class ProvisioningRowError(BaseModel):
+    """A rejected row in a bulk provisioning upload"""
+    row: int  # 1-based data row number, excluding the CSV header
+    email: Optional[str] = None
+    error: str
+
+
+class BulkProvisioningResponse(BaseModel):
+    """Outcome of a bulk provisioning upload"""
+    total_rows: int = 0
+    created: int = 0
+    duplicates: int = 0
+    failed: int = 0
+    errors: List[ProvisioningRowError] = []
+    errors_truncated: bool = False
+    elapsed_seconds: float = 0.0
+    rows_per_second: float = 0.0
@@ -0,0 +1,242 @@
+"""
+TaskFlow AI - API Key Service
+
+Following Backend Template Epic 1: Authentication & Security Foundation
+- API key issuing and revocation
+- Indexed, constant-time API key authentication
+- Migration of legacy bcrypt-hashed keys
+"""
+
+import time
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from typing import Deque, Optional, Set, Tuple
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+import structlog
+
+from app.core.security import (
+    averify_password,
+    generate_api_key,
+    get_api_key_lookup_id,
+    hash_api_key,
+    is_legacy_api_key,
+    verify_api_key,
+)
+from app.models.api_key import APIKey
+
+logger = structlog.get_logger(__name__)
+
+# last_used_at is only rewritten when older than this, to avoid a write per request
+LAST_USED_RESOLUTION = timedelta(hours=1)
+
+# Legacy lookup ids that matched no legacy hash, so repeated bad keys don't rescan with bcrypt
+MAX_UNKNOWN_LEGACY_IDS = 10_000
+_unknown_legacy_ids: Set[str] = set()
+
+
+class LegacyScanGate:
+    """
+    Admission control for legacy key scans
+
+    A scan bcrypt-compares the presented key with every unmigrated legacy
+    hash on the shared hashing pool, so unauthenticated callers must not be
+    able to start them at will. Scans run one at a time (callers finding
+    one in progress are turned away, not queued), at most scans_per_minute
+    start, and none start for recheck_seconds after a scan found no
+    unmigrated keys left.
+    """
+
+    def __init__(self, scans_per_minute: int = 10, recheck_seconds: float = 300.0):
+        self.scans_per_minute = scans_per_minute
+        self.recheck_seconds = recheck_seconds
+        self._running = False  # one event loop per process, so a flag is enough
+        self._started: Deque[float] = deque()
+        self._none_left_until = 0.0
+
+        self.scans = 0
+        self.rejected = 0
+
+    def try_start(self) -> bool:
+        """Claim the scan slot; the caller must call finish() if this returns True"""
+        now = time.monotonic()
+        if now < self._none_left_until:
+            return False
+        while self._started and now - self._started[0] >= 60.0:
+            self._started.popleft()
+        if self._running or len(self._started) >= self.scans_per_minute:
+            self.rejected += 1
+            return False
+
+        self._running = True
+        self._started.append(now)
+        self.scans += 1
+        return True
+
+    def finish(self, none_left: bool = False) -> None:
+        if none_left:
+            self._none_left_until = time.monotonic() + self.recheck_seconds
+        self._running = False
+
+    def reset(self) -> None:
+        """Legacy keys were imported; scan again"""
+        self._none_left_until = 0.0
+
+
+# Global legacy scan gate
+legacy_scan_gate = LegacyScanGate()
+
+
+class AsyncAPIKeyService:
+    """
+    API key service for request handlers
+
+    Following Backend Epic 1 - API security
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def create_api_key(self, user_id: UUID, name: str) -> Tuple[str, APIKey]:
+        """
+        Issue a new API key
+
+        Returns the plaintext key (shown once) and the stored record.
+        """
+        api_key = generate_api_key()
+
+        db_key = APIKey(
+            user_id=user_id,
+            name=name,
+            lookup_id=get_api_key_lookup_id(api_key),
+            key_hash=hash_api_key(api_key),
+            is_legacy=False,
+        )
+
+        self.db.add(db_key)
+        await self.db.commit()
+        await self.db.refresh(db_key)
+
+        logger.info("api_key_created", user_id=str(user_id), api_key_id=str(db_key.id))
+
+        return api_key, db_key
+
+    async def import_legacy_key(self, user_id: UUID, name: str, legacy_hash: str) -> APIKey:
+        """
+        Import a key issued by the old tf_<secret> scheme from its bcrypt hash
+
+        The key is upgraded to an indexed HMAC hash the first time it is used.
+        """
+        db_key = APIKey(
+            user_id=user_id,
+            name=name,
+            lookup_id=None,
+            key_hash=legacy_hash,
+            is_legacy=True,
+        )
+
+        self.db.add(db_key)
+        await self.db.commit()
+        await self.db.refresh(db_key)
+
+        # A newly imported hash may match a key we previously failed to find
+        _unknown_legacy_ids.clear()
+        legacy_scan_gate.reset()
+
+        logger.info("legacy_api_key_imported", user_id=str(user_id), api_key_id=str(db_key.id))
+
+        return db_key
+
+    async def authenticate(self, api_key: str) -> Optional[APIKey]:
+        """
+        Authenticate an API key
+
+        A single indexed lookup by lookup id followed by a constant-time
+        HMAC comparison.
+        """
+        lookup_id = get_api_key_lookup_id(api_key)
+        if not lookup_id:
+            return None
+
+        db_key = await self.db.scalar(select(APIKey).where(APIKey.lookup_id == lookup_id))
+
+        if db_key is None and is_legacy_api_key(api_key):
+            db_key = await self._migrate_legacy_key(api_key, lookup_id)
+
+        if db_key is None or db_key.is_revoked:
+            logger.warning("api_key_authentication_failed", lookup_id=lookup_id)
+            return None
+
+        if not verify_api_key(api_key, db_key.key_hash):
+            logger.warning("api_key_authentication_failed", lookup_id=lookup_id)
+            return None
+
+        await self._touch(db_key)
+
+        return db_key
+
+    async def revoke_api_key(self, api_key_id: UUID, user_id: UUID) -> bool:
+        """Revoke an API key owned by user_id"""
+        db_key = await self.db.scalar(
+            select(APIKey).where(APIKey.id == api_key_id, APIKey.user_id == user_id)
+        )
+        if not db_key:
+            return False
+
+        db_key.revoked_at = datetime.now(timezone.utc)
+        await self.db.commit()
+
+        logger.info("api_key_revoked", user_id=str(user_id), api_key_id=str(api_key_id))
+
+        return True
+
+    async def _migrate_legacy_key(self, api_key: str, lookup_id: str) -> Optional[APIKey]:
+        """
+        Find a legacy key by bcrypt comparison and upgrade it in place
+
+        This is the old per-key bcrypt scan, paid at most once per legacy key
+        and admitted by legacy_scan_gate; a key turned away fails this attempt
+        and is retried on its next use.
+        """
+        if lookup_id in _unknown_legacy_ids or not legacy_scan_gate.try_start():
+            return None
+
+        none_left = False
+        try:
+            candidates = (
+                await self.db.scalars(
+                    select(APIKey).where(APIKey.lookup_id.is_(None), APIKey.revoked_at.is_(None))
+                )
+            ).all()
+            none_left = not candidates
+
+            for candidate in candidates:
+                if await averify_password(api_key, candidate.key_hash):
+                    candidate.lookup_id = lookup_id
+                    candidate.key_hash = hash_api_key(api_key)
+                    await self.db.commit()
+
+                    logger.info("legacy_api_key_migrated", api_key_id=str(candidate.id))
+
+                    return candidate
+        finally:
+            legacy_scan_gate.finish(none_left=none_left)
+
+        if len(_unknown_legacy_ids) >= MAX_UNKNOWN_LEGACY_IDS:
+            _unknown_legacy_ids.clear()
+        _unknown_legacy_ids.add(lookup_id)
+
+        return None
+
+    async def _touch(self, db_key: APIKey) -> None:
+        """Record key usage at LAST_USED_RESOLUTION granularity"""
+        now = datetime.now(timezone.utc)
+        last_used_at = db_key.last_used_at
+        if last_used_at is not None and last_used_at.tzinfo is None:
+            last_used_at = last_used_at.replace(tzinfo=timezone.utc)
+
+        if last_used_at is None or now - last_used_at >= LAST_USED_RESOLUTION:
+            db_key.last_used_at = now
+            await self.db.commit()
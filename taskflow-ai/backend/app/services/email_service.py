@@ -1,39 +1,99 @@
 """
 TaskFlow AI - Email Service
 
-Placeholder email service for sending notifications
 Following Backend Template Epic 4: Advanced Business Logic
+- Notification emails queued in the persistent outbox
+- Request path only enqueues; delivery runs as the email.deliver_outbox job
 """
 
+from datetime import datetime, timezone
+from typing import Optional
+from uuid import UUID, uuid4
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
 import structlog
 
+from app.core.config import settings
+from app.db.database import AsyncSessionLocal
+from app.models.email import OutboundEmail
+from app.jobs.queue import job_queue
+
 logger = structlog.get_logger(__name__)
 
 
 class EmailService:
     """
     Email service for sending notifications
-    
-    TODO: Implement actual email sending functionality
+
+    Messages are written to the email outbox with a single INSERT and a
+    delivery job is queued; SMTP never runs on the request path. Sending
+    is enabled when SMTP_HOST is configured.
     """
-    
-    def __init__(self):
-        self.enabled = False  # Disable by default for development
-    
-    async def send_verification_email(self, user, verification_token: str = None):
-        """Send email verification email"""
+
+    def __init__(self, db: Optional[AsyncSession] = None):
+        self.db = db
+        self.enabled = bool(settings.SMTP_HOST)
+
+    async def enqueue(
+        self,
+        to_address: str,
+        subject: str,
+        body_text: str,
+        kind: str,
+        body_html: Optional[str] = None,
+    ) -> Optional[UUID]:
+        """Queue one email; returns its outbox id, or None when email is disabled"""
         if not self.enabled:
-            logger.info("email_verification_disabled", user_id=str(user.id), email=user.email)
-            return
-        
-        # TODO: Implement actual email sending
-        logger.info("send_verification_email", user_id=str(user.id), email=user.email)
-    
+            logger.info("email_disabled", kind=kind, email=to_address)
+            return None
+
+        email_id = uuid4()
+        stmt = insert(OutboundEmail).values(
+            id=email_id,
+            to_address=to_address,
+            subject=subject,
+            body_text=body_text,
+            body_html=body_html,
+            kind=kind,
+            next_attempt_at=datetime.now(timezone.utc),
+        )
+
+        try:
+            if self.db is not None:
+                await self.db.execute(stmt)
+                await self.db.commit()
+            else:
+                async with AsyncSessionLocal() as db:
+                    await db.execute(stmt)
+                    await db.commit()
+        except Exception as e:
+            # Notification mail must not fail the request that triggered it
+            logger.error("email_queue_failed", kind=kind, email=to_address, error=str(e))
+            return None
+
+        # Bursts of mail collapse into one delivery job
+        job_queue.enqueue("email.deliver_outbox", key="email.deliver_outbox")
+        logger.info("email_queued", email_id=str(email_id), kind=kind, email=to_address)
+        return email_id
+
+    async def send_verification_email(self, user, verification_token: str = None):
+        """Queue the email verification email"""
+        body = f"Hi {user.first_name or 'there'},\n\nWelcome to TaskFlow AI.\n"
+        if verification_token:
+            body += (
+                "\nPlease confirm your email address:\n"
+                f"{settings.FRONTEND_URL}/verify-email?token={verification_token}\n"
+            )
+        return await self.enqueue(user.email, "Welcome to TaskFlow AI", body, kind="verification")
+
     async def send_password_reset_email(self, user, reset_token: str):
-        """Send password reset email"""
-        if not self.enabled:
-            logger.info("password_reset_email_disabled", user_id=str(user.id), email=user.email)
-            return
-        
-        # TODO: Implement actual email sending
-        logger.info("send_password_reset_email", user_id=str(user.id), email=user.email)
+        """Queue the password reset email"""
+        body = (
+            f"Hi {user.first_name or 'there'},\n\n"
+            "We received a request to reset your TaskFlow AI password. "
+            f"The link is valid for {settings.PASSWORD_RESET_TOKEN_EXPIRE_MINUTES} minutes:\n"
+            f"{settings.FRONTEND_URL}/reset-password?token={reset_token}\n\n"
+            "If you did not ask for this, you can ignore this email.\n"
+        )
+        return await self.enqueue(user.email, "Reset your TaskFlow AI password", body, kind="password_reset")
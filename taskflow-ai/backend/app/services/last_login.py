@@ -0,0 +1,102 @@
+"""
+TaskFlow AI - Deferred Last-Login Stamps
+
+Following Backend Template Epic 3: Core Business Entities
+- Coalesce last_login writes off the login path
+- Periodic bulk UPDATE by primary key, run as the auth.stamp_last_login job
+"""
+
+import asyncio
+from datetime import datetime
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+import structlog
+
+from app.core.config import settings
+from app.jobs.queue import job_queue
+
+logger = structlog.get_logger(__name__)
+
+
+class LastLoginStamper:
+    """
+    Buffers last_login stamps and writes them in one executemany UPDATE
+
+    Repeated logins by the same user between flushes collapse into a single
+    row update carrying the latest timestamp. last_login is informational,
+    so losing at most flush_interval seconds of stamps on a crash is
+    acceptable; a clean shutdown flushes everything.
+    """
+
+    def __init__(self, flush_interval: float, max_pending: int = 50_000):
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._pending: Dict[UUID, datetime] = {}
+        self._task: Optional[asyncio.Task] = None
+
+        self.stamped = 0
+        self.written = 0
+        self.failed = 0
+
+    def stamp(self, user_id: UUID, at: datetime) -> None:
+        """Record a login time for the next flush"""
+        self._pending[user_id] = at
+        self.stamped += 1
+
+        # Don't let a stalled flush grow the buffer forever
+        if len(self._pending) > self.max_pending:
+            self._pending.pop(next(iter(self._pending)))
+            self.failed += 1
+
+    async def start(self) -> None:
+        """Start the periodic flush task"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the flush task and write all pending stamps"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        await self.flush()
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Write pending stamps as one bulk UPDATE by primary key"""
+        if not self._pending:
+            return
+
+        pending, self._pending = self._pending, {}
+        rows = [{"id": user_id, "last_login": at} for user_id, at in pending.items()]
+
+        try:
+            await job_queue.submit("auth.stamp_last_login", stamps=rows)
+        except Exception as e:
+            self.failed += len(rows)
+            logger.error("last_login_flush_failed", rows=len(rows), error=str(e))
+            return
+
+        self.written += len(rows)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Snapshot of stamper metrics for monitoring"""
+        return {
+            "pending": len(self._pending),
+            "stamped": self.stamped,
+            "written": self.written,
+            "failed": self.failed,
+        }
+
+
+# Global last-login stamper instance
+last_login_stamper = LastLoginStamper(flush_interval=settings.LAST_LOGIN_FLUSH_INTERVAL_SECONDS)
@@ -0,0 +1,320 @@
+"""
+TaskFlow AI - Account Lockout Engine
+
+Following Backend Template Epic 1: Authentication & Security Foundation
+- Sliding-window failed login counters per email and per IP
+- Attempts claimed atomically before the password is checked
+- Pluggable counter backend (in-process or shared Redis)
+- Rebuild of in-process counters from login_attempts after a restart
+"""
+
+import time
+import uuid
+from collections import OrderedDict, deque
+from datetime import datetime, timedelta, timezone
+from dataclasses import dataclass
+from typing import Deque, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+import structlog
+
+from app.core.config import settings
+from app.models.user import UNKNOWN_IP, LoginAttempt
+
+logger = structlog.get_logger(__name__)
+
+
+class InMemoryLockoutBackend:
+    """
+    Per-process sliding-window counters
+
+    Each key keeps at most `limit` timestamps, which is all that is needed to
+    decide whether the limit was reached inside the window. Keys are evicted
+    LRU beyond max_keys so credential-stuffing traffic cannot grow memory
+    without bound.
+    """
+
+    is_local = True
+
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        self._hits: "OrderedDict[str, Deque[float]]" = OrderedDict()
+
+    async def hit(self, key: str, now: float, window: float, limit: int) -> int:
+        """Record one event and return the number of events in the window"""
+        hits = self._hits.get(key)
+        if hits is None:
+            hits = deque(maxlen=limit)
+            self._hits[key] = hits
+            while len(self._hits) > self.max_keys:
+                self._hits.popitem(last=False)
+        else:
+            self._hits.move_to_end(key)
+
+        hits.append(now)
+        return self._prune(hits, now, window)
+
+    async def claim(self, key: str, now: float, window: float, limit: int) -> Optional[str]:
+        """
+        Record one event unless the window already holds limit events
+
+        Returns a token for release(), or None when the limit was reached.
+        Check and record happen without yielding, so concurrent claims
+        cannot all pass the check.
+        """
+        hits = self._hits.get(key)
+        if hits is not None and self._prune(hits, now, window) >= limit:
+            self._hits.move_to_end(key)
+            return None
+        await self.hit(key, now, window, limit)
+        return repr(now)
+
+    async def release(self, key: str, token: str) -> None:
+        """Take back an event recorded by claim()"""
+        hits = self._hits.get(key)
+        if hits:
+            try:
+                hits.remove(float(token))
+            except ValueError:
+                pass
+
+    async def count(self, key: str, now: float, window: float) -> int:
+        """Return the number of events in the window"""
+        hits = self._hits.get(key)
+        if not hits:
+            return 0
+        return self._prune(hits, now, window)
+
+    async def reset(self, key: str) -> None:
+        """Forget all events for a key"""
+        self._hits.pop(key, None)
+
+    @staticmethod
+    def _prune(hits: Deque[float], now: float, window: float) -> int:
+        cutoff = now - window
+        while hits and hits[0] <= cutoff:
+            hits.popleft()
+        return len(hits)
+
+
+class RedisLockoutBackend:
+    """
+    Sliding-window counters shared by all workers, stored as Redis sorted sets
+
+    The redis client is imported lazily so the dependency is only needed
+    when LOCKOUT_BACKEND=redis.
+    """
+
+    is_local = False
+
+    # Prune, compare and add in one step; returns 1 if the event was added
+    CLAIM_SCRIPT = """
+redis.call('ZREMRANGEBYSCORE', KEYS[1], 0, ARGV[1] - ARGV[2])
+if redis.call('ZCARD', KEYS[1]) >= tonumber(ARGV[3]) then
+    return 0
+end
+redis.call('ZADD', KEYS[1], ARGV[1], ARGV[4])
+redis.call('EXPIRE', KEYS[1], ARGV[5])
+return 1
+"""
+
+    def __init__(self, url: str, key_prefix: str = "lockout:"):
+        self.url = url
+        self.key_prefix = key_prefix
+        self._client = None
+        self._claim_script = None
+
+    def _get_client(self):
+        if self._client is None:
+            import redis.asyncio as redis
+
+            self._client = redis.from_url(self.url)
+            self._claim_script = self._client.register_script(self.CLAIM_SCRIPT)
+        return self._client
+
+    async def hit(self, key: str, now: float, window: float, limit: int) -> int:
+        """Record one event and return the number of events in the window"""
+        redis_key = self.key_prefix + key
+        pipe = self._get_client().pipeline(transaction=True)
+        pipe.zadd(redis_key, {f"{now}:{uuid.uuid4().hex}": now})
+        pipe.zremrangebyscore(redis_key, 0, now - window)
+        pipe.zremrangebyrank(redis_key, 0, -(limit + 1))  # keep only the newest `limit`
+        pipe.zcard(redis_key)
+        pipe.expire(redis_key, int(window) + 1)
+        results = await pipe.execute()
+        return int(results[3])
+
+    async def claim(self, key: str, now: float, window: float, limit: int) -> Optional[str]:
+        """Record one event unless the window already holds limit events (atomic on the server)"""
+        self._get_client()
+        member = f"{now}:{uuid.uuid4().hex}"
+        added = await self._claim_script(
+            keys=[self.key_prefix + key], args=[now, window, limit, member, int(window) + 1],
+        )
+        return member if int(added) else None
+
+    async def release(self, key: str, token: str) -> None:
+        """Take back an event recorded by claim()"""
+        await self._get_client().zrem(self.key_prefix + key, token)
+
+    async def count(self, key: str, now: float, window: float) -> int:
+        """Return the number of events in the window"""
+        return int(await self._get_client().zcount(self.key_prefix + key, f"({now - window}", "+inf"))
+
+    async def reset(self, key: str) -> None:
+        """Forget all events for a key"""
+        await self._get_client().delete(self.key_prefix + key)
+
+
+@dataclass
+class LoginClaim:
+    """Failure slots held by one login attempt while its password is checked"""
+    email: str
+    ip_address: Optional[str]
+    email_token: str
+    ip_token: Optional[str]
+
+
+class LockoutEngine:
+    """
+    Failed-login lockout decisions without counting rows in login_attempts
+
+    A login claims a failure slot for its email and IP before the password
+    is verified, so concurrent guesses cannot all pass the check before any
+    of them is counted; the slots are given back if the login succeeds.
+
+    Following Epic 1 - Login attempts and security logging
+    """
+
+    def __init__(
+        self,
+        backend,
+        window_seconds: int,
+        max_email_failures: int,
+        max_ip_failures: int,
+    ):
+        self.backend = backend
+        self.window_seconds = window_seconds
+        self.max_email_failures = max_email_failures
+        self.max_ip_failures = max_ip_failures
+
+    @staticmethod
+    def _email_key(email: str) -> str:
+        return f"email:{email.lower()}"
+
+    @staticmethod
+    def _ip_key(ip_address: str) -> str:
+        return f"ip:{ip_address}"
+
+    async def record_failure(self, email: str, ip_address: Optional[str] = None, at: Optional[float] = None) -> None:
+        """Count a failed login against the email and the client IP"""
+        now = at if at is not None else time.time()
+        await self.backend.hit(self._email_key(email), now, self.window_seconds, self.max_email_failures)
+        if ip_address:
+            await self.backend.hit(self._ip_key(ip_address), now, self.window_seconds, self.max_ip_failures)
+
+    async def claim(self, email: str, ip_address: Optional[str] = None) -> Optional[LoginClaim]:
+        """
+        Count an attempt as failed up front, unless the email or IP is locked
+
+        Returns None when locked. The claim stands as the failure if the
+        login fails; call release() when it succeeds.
+        """
+        now = time.time()
+        email_key = self._email_key(email)
+        email_token = await self.backend.claim(email_key, now, self.window_seconds, self.max_email_failures)
+        if email_token is None:
+            return None
+
+        ip_token = None
+        if ip_address:
+            ip_token = await self.backend.claim(
+                self._ip_key(ip_address), now, self.window_seconds, self.max_ip_failures,
+            )
+            if ip_token is None:
+                await self.backend.release(email_key, email_token)
+                return None
+
+        return LoginClaim(email, ip_address, email_token, ip_token)
+
+    async def release(self, claim: LoginClaim) -> None:
+        """Give back the slots of an attempt that did not fail"""
+        await self.backend.release(self._email_key(claim.email), claim.email_token)
+        if claim.ip_token is not None:
+            await self.backend.release(self._ip_key(claim.ip_address), claim.ip_token)
+
+    async def record_success(self, email: str) -> None:
+        """A successful login clears the email's failure window"""
+        await self.backend.reset(self._email_key(email))
+
+    async def get_failed_attempts(self, email: str) -> int:
+        """Failed logins for an email inside the window"""
+        return await self.backend.count(self._email_key(email), time.time(), self.window_seconds)
+
+    async def is_locked(self, email: str, ip_address: Optional[str] = None) -> bool:
+        """Check whether the email or client IP has too many recent failures"""
+        now = time.time()
+        if await self.backend.count(self._email_key(email), now, self.window_seconds) >= self.max_email_failures:
+            return True
+        if ip_address:
+            ip_failures = await self.backend.count(self._ip_key(ip_address), now, self.window_seconds)
+            if ip_failures >= self.max_ip_failures:
+                return True
+        return False
+
+    async def rebuild(self, db: AsyncSession) -> int:
+        """
+        Replay the current window from login_attempts into an in-process backend
+
+        Only needed after a restart with the memory backend; the shared
+        backend keeps its own state. Uses the attempted_at index; on a
+        partitioned login_attempts only the current partition is scanned.
+        """
+        if not self.backend.is_local:
+            return 0
+
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=self.window_seconds)
+        result = await db.stream(
+            select(
+                LoginAttempt.email,
+                LoginAttempt.ip_address,
+                LoginAttempt.success,
+                LoginAttempt.attempted_at,
+            )
+            .where(LoginAttempt.attempted_at >= cutoff)
+            .order_by(LoginAttempt.attempted_at)
+            .execution_options(yield_per=1000)
+        )
+
+        replayed = 0
+        async for email, ip_address, success, attempted_at in result:
+            if attempted_at.tzinfo is None:
+                attempted_at = attempted_at.replace(tzinfo=timezone.utc)
+            if success:
+                await self.record_success(email)
+            else:
+                # Rows without a client address must not share one IP bucket
+                ip_address = None if ip_address == UNKNOWN_IP else ip_address
+                await self.record_failure(email, ip_address, at=attempted_at.timestamp())
+            replayed += 1
+
+        logger.info("lockout_counters_rebuilt", attempts=replayed, window_seconds=self.window_seconds)
+
+        return replayed
+
+
+def create_lockout_backend():
+    """Build the configured lockout counter backend"""
+    if settings.LOCKOUT_BACKEND.lower() == "redis":
+        return RedisLockoutBackend(settings.REDIS_URL)
+    return InMemoryLockoutBackend()
+
+
+# Global lockout engine instance
+lockout_engine = LockoutEngine(
+    backend=create_lockout_backend(),
+    window_seconds=settings.LOCKOUT_WINDOW_SECONDS,
+    max_email_failures=settings.LOCKOUT_MAX_FAILED_ATTEMPTS,
+    max_ip_failures=settings.LOCKOUT_MAX_FAILED_ATTEMPTS_PER_IP,
+)
@@ -0,0 +1,158 @@
+"""
+TaskFlow AI - Login Audit Writer
+
+Following Backend Template Epic 1: Authentication & Security Foundation
+- Login attempt audit logging off the request path
+- In-memory buffering; each batch is one auth.record_login_attempts job
+- Bounded memory under overload
+"""
+
+import asyncio
+import uuid
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, Optional
+
+import structlog
+
+from app.core.config import settings
+from app.jobs.queue import job_queue
+from app.models.user import UNKNOWN_IP
+
+logger = structlog.get_logger(__name__)
+
+
+class LoginAuditWriter:
+    """
+    Buffered writer for LoginAttempt rows
+
+    record() only appends to an in-memory buffer. A background task hands
+    the buffer to the auth.record_login_attempts job (one bulk insert per
+    batch) when it reaches batch_size or every flush_interval seconds,
+    whichever comes first. When the buffer is full,
+    new rows are spilled to the structured log instead of the database.
+    """
+
+    def __init__(self, batch_size: int, flush_interval: float, max_queue_size: int):
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.max_queue_size = max(self.batch_size, max_queue_size)
+
+        self._buffer: Deque[Dict[str, Any]] = deque()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+        self.recorded = 0
+        self.written = 0
+        self.batches = 0
+        self.spilled = 0
+        self.failed = 0
+
+    def record(
+        self,
+        email: str,
+        success: bool,
+        ip_address: Optional[str] = None,
+        user_agent: Optional[str] = None,
+        failure_reason: Optional[str] = None,
+    ) -> None:
+        """Queue a login attempt row without touching the database"""
+        row = {
+            "id": uuid.uuid4(),
+            "email": email.lower(),
+            "ip_address": ip_address or UNKNOWN_IP,
+            "user_agent": user_agent,
+            "success": success,
+            "failure_reason": None if success else failure_reason,
+            # Captured now so batching does not shift the attempt time
+            "attempted_at": datetime.now(timezone.utc),
+        }
+        self.recorded += 1
+
+        if len(self._buffer) >= self.max_queue_size:
+            self.spilled += 1
+            logger.warning(
+                "login_attempt_spilled",
+                email=row["email"],
+                ip_address=row["ip_address"],
+                success=success,
+                failure_reason=row["failure_reason"],
+            )
+            return
+
+        self._buffer.append(row)
+
+        if len(self._buffer) >= self.batch_size and self._wakeup is not None:
+            self._wakeup.set()
+
+    async def start(self) -> None:
+        """Start the background flush task"""
+        if self._task is not None:
+            return
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+        logger.info(
+            "login_audit_writer_started",
+            batch_size=self.batch_size,
+            flush_interval=self.flush_interval,
+        )
+
+    async def stop(self) -> None:
+        """Stop the background task and flush everything still buffered"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        await self.flush()
+        logger.info("login_audit_writer_stopped", written=self.written, spilled=self.spilled)
+
+    async def _run(self) -> None:
+        """Flush on size or time, whichever comes first"""
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Bulk-insert buffered rows in batches"""
+        while self._buffer:
+            batch = [
+                self._buffer.popleft()
+                for _ in range(min(self.batch_size, len(self._buffer)))
+            ]
+            try:
+                await job_queue.submit("auth.record_login_attempts", rows=batch)
+            except Exception as e:
+                self.failed += len(batch)
+                logger.error("login_audit_flush_failed", rows=len(batch), error=str(e))
+                continue
+
+            self.written += len(batch)
+            self.batches += 1
+
+    def metrics(self) -> Dict[str, Any]:
+        """Snapshot of writer metrics for monitoring"""
+        return {
+            "buffered": len(self._buffer),
+            "max_queue_size": self.max_queue_size,
+            "recorded": self.recorded,
+            "written": self.written,
+            "batches": self.batches,
+            "spilled": self.spilled,
+            "failed": self.failed,
+        }
+
+
+# Global login audit writer instance
+login_audit_writer = LoginAuditWriter(
+    batch_size=settings.LOGIN_AUDIT_BATCH_SIZE,
+    flush_interval=settings.LOGIN_AUDIT_FLUSH_INTERVAL_SECONDS,
+    max_queue_size=settings.LOGIN_AUDIT_MAX_QUEUE_SIZE,
+)
@@ -0,0 +1,420 @@
+"""
+TaskFlow AI - Outbound Mail Delivery
+
+Following Backend Template Epic 4: Advanced Business Logic
+- Delivery worker draining the persistent email outbox
+- Pool of reused SMTP connections (one TLS handshake per connection, not per message)
+- Retry with exponential backoff; permanent failures finalized
+"""
+
+import asyncio
+import random
+import smtplib
+import ssl
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email.message import EmailMessage
+from email.utils import make_msgid
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import or_, select, update
+import structlog
+
+from app.core.config import settings
+from app.db.database import AsyncSessionLocal
+from app.models.email import OutboundEmail
+
+logger = structlog.get_logger(__name__)
+
+
+class SMTPConnectionPool:
+    """
+    Up to size SMTP sessions kept open and reused across messages
+
+    smtplib is blocking, so each session is driven from a worker thread;
+    a session is only ever used by one thread at a time. Sessions idle for
+    longer than max_idle are checked with NOOP before reuse.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        use_tls: bool = True,
+        use_ssl: bool = False,
+        timeout: float = 10.0,
+        size: int = 4,
+        max_idle: float = 60.0,
+    ):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.use_ssl = use_ssl
+        self.timeout = timeout
+        self.size = max(1, size)
+        self.max_idle = max_idle
+
+        self._idle: List[tuple] = []  # (connection, last_used)
+        self._lock = threading.Lock()
+
+        self.connects = 0
+        self.sent = 0
+        self.errors = 0
+
+    def _connect(self) -> smtplib.SMTP:
+        if self.use_ssl:
+            conn = smtplib.SMTP_SSL(self.host, self.port, timeout=self.timeout, context=ssl.create_default_context())
+        else:
+            conn = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+            if self.use_tls:
+                conn.starttls(context=ssl.create_default_context())
+        if self.username:
+            conn.login(self.username, self.password or "")
+        self.connects += 1
+        return conn
+
+    def _checkout(self) -> smtplib.SMTP:
+        with self._lock:
+            conn, last_used = self._idle.pop() if self._idle else (None, 0.0)
+        if conn is not None and time.monotonic() - last_used > self.max_idle:
+            try:
+                conn.noop()
+            except smtplib.SMTPException:
+                self._discard(conn)
+                conn = None
+        return conn or self._connect()
+
+    def _checkin(self, conn: smtplib.SMTP) -> None:
+        with self._lock:
+            if len(self._idle) < self.size:
+                self._idle.append((conn, time.monotonic()))
+                return
+        self._discard(conn)
+
+    @staticmethod
+    def _discard(conn: smtplib.SMTP) -> None:
+        try:
+            conn.quit()
+        except Exception:
+            conn.close()
+
+    def _send_chunk(self, messages: Sequence[EmailMessage]) -> List[Optional[Exception]]:
+        """Send messages over one session, reconnecting once if the server drops it"""
+        results: List[Optional[Exception]] = []
+        try:
+            conn = self._checkout()
+        except Exception as e:
+            self.errors += len(messages)
+            return [e] * len(messages)
+
+        for message in messages:
+            for retry in (False, True):
+                try:
+                    conn.send_message(message)
+                    results.append(None)
+                    self.sent += 1
+                    break
+                except smtplib.SMTPServerDisconnected as e:
+                    if retry:
+                        results.append(e)
+                        self.errors += 1
+                        break
+                    try:
+                        conn = self._connect()
+                    except Exception as connect_error:
+                        # Server unreachable: fail the rest of the chunk without retrying each
+                        remaining = len(messages) - len(results)
+                        self.errors += remaining
+                        return results + [connect_error] * remaining
+                except Exception as e:
+                    results.append(e)
+                    self.errors += 1
+                    try:
+                        conn.rset()  # clear the failed transaction, keep the session
+                    except Exception:
+                        conn.close()
+                        try:
+                            conn = self._connect()
+                        except Exception as connect_error:
+                            remaining = len(messages) - len(results)
+                            self.errors += remaining
+                            return results + [connect_error] * remaining
+                    break
+
+        self._checkin(conn)
+        return results
+
+    async def send(self, messages: Sequence[EmailMessage]) -> List[Optional[Exception]]:
+        """Send messages over up to size sessions in parallel; one result per message (None = sent)"""
+        if not messages:
+            return []
+        lanes = min(self.size, len(messages))
+        chunks = [list(messages[i::lanes]) for i in range(lanes)]
+        chunk_results = await asyncio.gather(*(asyncio.to_thread(self._send_chunk, chunk) for chunk in chunks))
+
+        # Undo the round-robin split
+        results: List[Optional[Exception]] = [None] * len(messages)
+        for lane, lane_results in enumerate(chunk_results):
+            for j, result in enumerate(lane_results):
+                results[lane + j * lanes] = result
+        return results
+
+    def close(self) -> None:
+        """Close idle sessions"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn, _ in idle:
+            self._discard(conn)
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "size": self.size,
+            "idle": len(self._idle),
+            "connects": self.connects,
+            "sent": self.sent,
+            "errors": self.errors,
+        }
+
+
+def is_permanent_failure(error: Exception) -> bool:
+    """5xx replies (bad recipient, rejected content) will not succeed on retry"""
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return all(code >= 500 for code, _ in error.recipients.values())
+    if isinstance(error, smtplib.SMTPResponseException):
+        return error.smtp_code >= 500
+    return False
+
+
+class MailDeliveryWorker:
+    """
+    Drains the email outbox through an SMTP connection pool
+
+    Each round claims up to batch_size due rows with one UPDATE ... RETURNING
+    (SKIP LOCKED on PostgreSQL, so several workers can share the outbox),
+    sends them over the pool and records all outcomes with one bulk UPDATE.
+    A claim is a lease: rows left in "sending" by a crashed worker become
+    due again after lease seconds. The claim itself counts the attempt, so a
+    message that keeps crashing or hanging the worker still runs out of
+    attempts. Transient failures are retried with exponential backoff and
+    jitter until max_attempts.
+    """
+
+    def __init__(
+        self,
+        pool: SMTPConnectionPool,
+        from_address: str,
+        batch_size: int,
+        poll_interval: float,
+        max_attempts: int,
+        retry_base: float,
+        retry_max: float,
+        lease: float = 300.0,
+    ):
+        self.pool = pool
+        self.from_address = from_address
+        self.batch_size = max(1, batch_size)
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.retry_base = retry_base
+        self.retry_max = retry_max
+        self.lease = lease
+
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+        self.rounds = 0
+        self.delivered = 0
+        self.retried = 0
+        self.failed = 0
+
+    def notify(self) -> None:
+        """Wake the worker after new mail was queued"""
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def start(self) -> None:
+        """Start the delivery task"""
+        if self._task is None:
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the delivery task; undelivered mail stays queued"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self.pool.close()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                claimed = await self.deliver_due()
+            except Exception as e:
+                logger.error("mail_delivery_round_failed", error=str(e))
+                claimed = 0
+
+            # A full batch means more is probably due; otherwise sleep until notified
+            if claimed < self.batch_size:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
+
+    def _backoff(self, attempts: int) -> float:
+        delay = min(self.retry_max, self.retry_base * 2 ** (attempts - 1))
+        return delay * random.uniform(0.5, 1.0)
+
+    def _build(self, row) -> EmailMessage:
+        message = EmailMessage()
+        message["From"] = self.from_address
+        message["To"] = row.to_address
+        message["Subject"] = row.subject
+        message["Message-ID"] = make_msgid(idstring=str(row.id))
+        message.set_content(row.body_text)
+        if row.body_html:
+            message.add_alternative(row.body_html, subtype="html")
+        return message
+
+    async def _claim(self) -> list:
+        now = datetime.now(timezone.utc)
+        due = (
+            select(OutboundEmail.id)
+            .where(
+                or_(OutboundEmail.status == "pending", OutboundEmail.status == "sending"),
+                OutboundEmail.next_attempt_at <= now,
+            )
+            .order_by(OutboundEmail.next_attempt_at)
+            .limit(self.batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                update(OutboundEmail)
+                .where(OutboundEmail.id.in_(due.scalar_subquery()))
+                .values(
+                    status="sending",
+                    attempts=OutboundEmail.attempts + 1,
+                    next_attempt_at=now + timedelta(seconds=self.lease),
+                )
+                .returning(
+                    OutboundEmail.id,
+                    OutboundEmail.to_address,
+                    OutboundEmail.subject,
+                    OutboundEmail.body_text,
+                    OutboundEmail.body_html,
+                    OutboundEmail.attempts,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            rows = result.all()
+            await db.commit()
+        return rows
+
+    async def deliver_due(self) -> int:
+        """Claim, send and record one batch; returns the number of rows claimed"""
+        rows = await self._claim()
+        if not rows:
+            return 0
+
+        self.rounds += 1
+        now = datetime.now(timezone.utc)
+        outcomes = []
+
+        # Reclaimed after the lease of its last allowed attempt expired: give up without sending again
+        exhausted = [row for row in rows if row.attempts > self.max_attempts]
+        for row in exhausted:
+            outcomes.append({
+                "id": row.id,
+                "attempts": row.attempts - 1,
+                "status": "failed",
+                "next_attempt_at": now,
+                "sent_at": None,
+                "last_error": "Delivery lease expired on the last attempt",
+            })
+            self.failed += 1
+            logger.warning(
+                "email_delivery_failed", email_id=str(row.id), attempts=row.attempts - 1, error="lease expired"
+            )
+
+        due = [row for row in rows if row.attempts <= self.max_attempts]
+        errors = await self.pool.send([self._build(row) for row in due])
+
+        now = datetime.now(timezone.utc)
+        for row, error in zip(due, errors):
+            attempts = row.attempts
+            outcome = {
+                "id": row.id,
+                "attempts": attempts,
+                "status": "sent",
+                "next_attempt_at": now,
+                "sent_at": now,
+                "last_error": None,
+            }
+            if error is not None:
+                outcome["sent_at"] = None
+                outcome["last_error"] = f"{type(error).__name__}: {error}"[:1000]
+                if is_permanent_failure(error) or attempts >= self.max_attempts:
+                    outcome["status"] = "failed"
+                    self.failed += 1
+                    logger.warning("email_delivery_failed", email_id=str(row.id), attempts=attempts, error=str(error))
+                else:
+                    outcome["status"] = "pending"
+                    outcome["next_attempt_at"] = now + timedelta(seconds=self._backoff(attempts))
+                    self.retried += 1
+            else:
+                self.delivered += 1
+            outcomes.append(outcome)
+
+        async with AsyncSessionLocal() as db:
+            await db.execute(update(OutboundEmail), outcomes)
+            await db.commit()
+
+        return len(rows)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Snapshot of delivery metrics for monitoring"""
+        return {
+            "running": self._task is not None,
+            "rounds": self.rounds,
+            "delivered": self.delivered,
+            "retried": self.retried,
+            "failed": self.failed,
+            "pool": self.pool.metrics(),
+        }
+
+
+def create_mail_delivery_worker() -> MailDeliveryWorker:
+    """Delivery worker for the configured SMTP server"""
+    return MailDeliveryWorker(
+        pool=SMTPConnectionPool(
+            host=settings.SMTP_HOST or "localhost",
+            port=settings.SMTP_PORT,
+            username=settings.SMTP_USERNAME,
+            password=settings.SMTP_PASSWORD,
+            use_tls=settings.SMTP_USE_TLS,
+            use_ssl=settings.SMTP_USE_SSL,
+            timeout=settings.SMTP_TIMEOUT_SECONDS,
+            size=settings.SMTP_POOL_SIZE,
+            max_idle=settings.SMTP_MAX_IDLE_SECONDS,
+        ),
+        from_address=settings.SMTP_FROM_EMAIL or "noreply@localhost",
+        batch_size=settings.EMAIL_BATCH_SIZE,
+        poll_interval=settings.EMAIL_POLL_INTERVAL_SECONDS,
+        max_attempts=settings.EMAIL_MAX_ATTEMPTS,
+        retry_base=settings.EMAIL_RETRY_BASE_SECONDS,
+        retry_max=settings.EMAIL_RETRY_MAX_SECONDS,
+    )
+
+
+# Global mail delivery worker instance
+mail_delivery_worker = create_mail_delivery_worker()
@@ -0,0 +1,241 @@
+"""
+TaskFlow AI - Data Retention Sweeper
+
+Following Backend Template Epic 1: Authentication & Security Foundation
+- Per-table retention policies for auth audit and token tables
+- Keyset-ordered batched deletes, one short transaction per batch
+- Throttled between batches and bounded per sweep; rows purged and time spent reported
+- Partitioned tables (login_attempts on PostgreSQL) drop whole expired partitions instead
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import delete, select, tuple_
+import structlog
+
+from app.core.config import settings
+from app.db.database import AsyncSessionLocal
+from app.db.partitioning import RangePartitions
+from app.models.user import LoginAttempt, PasswordResetToken, UserSession, login_attempt_partitions
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    """Rows of model whose column is older than retention are purged"""
+    name: str
+    model: Any
+    column: str
+    retention: timedelta
+    partitions: Optional[RangePartitions] = None  # drop partitions instead, where enabled
+
+    def cutoff(self, now: datetime) -> datetime:
+        return now - self.retention
+
+
+def default_policies() -> List[RetentionPolicy]:
+    """Retention policies from settings"""
+    return [
+        RetentionPolicy(
+            name="login_attempts",
+            model=LoginAttempt,
+            column="attempted_at",
+            retention=timedelta(days=settings.LOGIN_ATTEMPT_RETENTION_DAYS),
+            partitions=login_attempt_partitions,
+        ),
+        RetentionPolicy(
+            name="user_sessions",
+            model=UserSession,
+            column="expires_at",
+            retention=timedelta(days=settings.SESSION_RETENTION_DAYS),
+        ),
+        RetentionPolicy(
+            name="password_reset_tokens",
+            model=PasswordResetToken,
+            column="expires_at",
+            retention=timedelta(days=settings.PASSWORD_RESET_TOKEN_RETENTION_DAYS),
+        ),
+    ]
+
+
+class RetentionSweeper:
+    """
+    Purges rows past their retention, batch by batch
+
+    Each batch selects the next batch_size primary keys past the cutoff in
+    (timestamp, id) order, starting after the last batch, and deletes them
+    by primary key in their own transaction. Walking the index forward
+    instead of re-reading it from the start skips index entries of rows
+    deleted earlier but not yet vacuumed, and keeps every lock short.
+    Between batches the sweeper sleeps batch_pause, and a sweep stops after
+    max_runtime; the rest is picked up by the next sweep.
+
+    A policy over a partitioned table instead creates upcoming partitions
+    and drops every partition lying wholly before the cutoff, so rows live
+    up to one partition width past their retention but are never deleted
+    one by one.
+    """
+
+    def __init__(
+        self,
+        policies: List[RetentionPolicy],
+        interval: float,
+        batch_size: int,
+        batch_pause: float,
+        max_runtime: float,
+    ):
+        self.policies = policies
+        self.interval = interval
+        self.batch_size = max(1, batch_size)
+        self.batch_pause = batch_pause
+        self.max_runtime = max_runtime
+        self._task: Optional[asyncio.Task] = None
+
+        self.sweeps = 0
+        self.purged: Dict[str, int] = {policy.name: 0 for policy in policies}
+        self.last_report: Optional[Dict[str, Any]] = None
+        self.last_error: Optional[str] = None
+
+    async def start(self) -> None:
+        """Start sweeping every interval seconds"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop sweeping; an interrupted sweep resumes from scratch next time"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.sweep()
+            except Exception as e:
+                self.last_error = str(e)
+                logger.error("retention_sweep_failed", error=str(e))
+            await asyncio.sleep(self.interval)
+
+    async def sweep(self, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """Run every policy once; returns rows purged and seconds spent per table"""
+        now = now or datetime.now(timezone.utc)
+        started = time.perf_counter()
+        deadline = started + self.max_runtime
+        report: Dict[str, Any] = {"tables": {}}
+        errors: List[str] = []
+
+        for policy in self.policies:
+            table_started = time.perf_counter()
+            try:
+                table_report = await self._sweep_policy(policy, now, deadline)
+            except Exception as e:
+                # One failing table must not keep the others from being purged
+                errors.append(f"{policy.name}: {e}")
+                logger.error("retention_policy_failed", table=policy.name, error=str(e))
+                table_report = {"purged": 0, "batches": 0, "complete": False, "error": str(e)}
+            table_report["seconds"] = round(time.perf_counter() - table_started, 3)
+            report["tables"][policy.name] = table_report
+
+        report["seconds"] = round(time.perf_counter() - started, 3)
+        report["purged"] = sum(table["purged"] for table in report["tables"].values())
+        self.sweeps += 1
+        self.last_report = report
+        self.last_error = "; ".join(errors) or None
+        logger.info("retention_sweep_completed", **report)
+        return report
+
+    async def _sweep_policy(self, policy: RetentionPolicy, now: datetime, deadline: float) -> Dict[str, Any]:
+        """Purge one table; partitions are dropped only if the table really is partitioned"""
+        if policy.partitions is not None and await policy.partitions.enabled():
+            dropped, complete = await self._drop_partitions(policy.partitions, policy.cutoff(now), now, deadline)
+            return {"purged": 0, "batches": 0, "partitions_dropped": dropped, "complete": complete}
+
+        purged, batches, complete = await self._purge(policy, policy.cutoff(now), deadline)
+        self.purged[policy.name] += purged
+        return {"purged": purged, "batches": batches, "complete": complete}
+
+    async def _drop_partitions(
+        self, partitions: RangePartitions, cutoff: datetime, now: datetime, deadline: float
+    ):
+        """Create upcoming partitions, drop expired ones; returns (dropped names, finished)"""
+        await partitions.ensure(now)
+        dropped = []
+        for name in await partitions.expired(cutoff):
+            if time.perf_counter() >= deadline:
+                return dropped, False
+            try:
+                await partitions.drop(name)
+            except Exception as e:
+                # Usually lock_timeout behind a long query; retried next sweep
+                logger.warning("partition_drop_failed", partition=name, error=str(e))
+                return dropped, False
+            dropped.append(name)
+        return dropped, True
+
+    async def _purge(self, policy: RetentionPolicy, cutoff: datetime, deadline: float):
+        """Delete policy rows older than cutoff; returns (rows, batches, finished)"""
+        model = policy.model
+        column = getattr(model, policy.column)
+        after = None  # (timestamp, id) of the last row deleted
+        purged = batches = 0
+
+        while True:
+            if time.perf_counter() >= deadline:
+                return purged, batches, False
+
+            stmt = (
+                select(column, model.id)
+                .where(column < cutoff)
+                .order_by(column, model.id)
+                .limit(self.batch_size)
+            )
+            if after is not None:
+                stmt = stmt.where(tuple_(column, model.id) > tuple_(*after))
+
+            async with AsyncSessionLocal() as db:
+                keys = (await db.execute(stmt)).all()
+                if not keys:
+                    return purged, batches, True
+                await db.execute(
+                    delete(model)
+                    .where(model.id.in_([key.id for key in keys]))
+                    .execution_options(synchronize_session=False)
+                )
+                await db.commit()
+
+            purged += len(keys)
+            batches += 1
+            after = tuple(keys[-1])
+
+            if len(keys) < self.batch_size:
+                return purged, batches, True
+            await asyncio.sleep(self.batch_pause)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Snapshot of sweeper metrics for monitoring"""
+        return {
+            "running": self._task is not None,
+            "sweeps": self.sweeps,
+            "purged": dict(self.purged),
+            "last_report": self.last_report,
+            "last_error": self.last_error,
+        }
+
+
+# Global retention sweeper instance
+retention_sweeper = RetentionSweeper(
+    policies=default_policies(),
+    interval=settings.RETENTION_INTERVAL_SECONDS,
+    batch_size=settings.RETENTION_BATCH_SIZE,
+    batch_pause=settings.RETENTION_BATCH_PAUSE_SECONDS,
+    max_runtime=settings.RETENTION_MAX_RUNTIME_SECONDS,
+)
@@ -0,0 +1,440 @@
+"""
+TaskFlow AI - Session Service
+
+Following Backend Template Epic 1: Authentication & Security Foundation
+- UserSession rows behind refresh tokens, with refresh token rotation and reuse detection
+- Read-through cache of active sessions
+- Coalesced last_activity stamps written in bulk
+- Revocations propagated to every process's in-memory revocation filter
+"""
+
+import asyncio
+import hashlib
+import hmac
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+import structlog
+
+from app.core.config import settings
+from app.core.session_revocation import revoked_sessions
+from app.db.database import AsyncSessionLocal
+from app.jobs.queue import job_queue
+from app.models.user import UserSession
+
+logger = structlog.get_logger(__name__)
+
+REVOCATION_SYNC_OVERLAP = timedelta(seconds=30)
+
+
+def hash_refresh_token(token: str) -> str:
+    """Refresh tokens are high-entropy JWTs, so a plain SHA-256 is enough"""
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+def _aware(value: datetime) -> datetime:
+    # SQLite hands back naive datetimes; everything stored here is UTC
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+@dataclass(frozen=True)
+class SessionSnapshot:
+    """Read-only copy of an active UserSession row"""
+    id: UUID
+    user_id: UUID
+    refresh_token_hash: Optional[str]
+    expires_at: datetime
+
+    @classmethod
+    def from_row(cls, row) -> "SessionSnapshot":
+        return cls(
+            id=row.id,
+            user_id=row.user_id,
+            refresh_token_hash=row.refresh_token_hash,
+            expires_at=_aware(row.expires_at),
+        )
+
+
+class SessionCache:
+    """
+    TTL + LRU cache of active SessionSnapshots keyed by session id
+
+    Each process has its own cache; revocation is enforced by the
+    revocation filter, and a refresh token that does not match a cached
+    hash is re-checked against the database, so staleness never lets a
+    revoked or rotated-out token through.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[UUID, tuple[SessionSnapshot, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, session_id: UUID) -> Optional[SessionSnapshot]:
+        """Return a cached session, or None"""
+        with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is None or entry[1] <= time.monotonic():
+                self._entries.pop(session_id, None)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(session_id)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, snapshot: SessionSnapshot) -> None:
+        """Cache a session for ttl_seconds"""
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[snapshot.id] = (snapshot, time.monotonic() + self.ttl_seconds)
+            self._entries.move_to_end(snapshot.id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, session_id: UUID) -> None:
+        """Drop a session after it was revoked"""
+        with self._lock:
+            self._entries.pop(session_id, None)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Snapshot of cache metrics for monitoring"""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+class SessionActivityTracker:
+    """
+    Buffers last_activity stamps and writes them as one auth.touch_sessions job
+
+    Requests on the same session between flushes collapse into one row
+    update carrying the latest time. last_activity is informational, so
+    losing at most flush_interval seconds of it on a crash is acceptable;
+    a clean shutdown flushes everything.
+    """
+
+    def __init__(self, flush_interval: float, max_pending: int = 50_000):
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._pending: Dict[UUID, datetime] = {}
+        self._task: Optional[asyncio.Task] = None
+
+        self.touched = 0
+        self.written = 0
+        self.failed = 0
+
+    def touch(self, session_id: UUID) -> None:
+        """Record activity on a session for the next flush"""
+        self._pending[session_id] = datetime.now(timezone.utc)
+        self.touched += 1
+
+        # Don't let a stalled flush grow the buffer forever
+        if len(self._pending) > self.max_pending:
+            self._pending.pop(next(iter(self._pending)))
+            self.failed += 1
+
+    async def start(self) -> None:
+        """Start the periodic flush task"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the flush task and write all pending stamps"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        await self.flush()
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Write pending stamps as one bulk UPDATE by primary key"""
+        if not self._pending:
+            return
+
+        pending, self._pending = self._pending, {}
+        rows = [{"id": session_id, "last_activity": at} for session_id, at in pending.items()]
+
+        try:
+            await job_queue.submit("auth.touch_sessions", stamps=rows)
+        except Exception as e:
+            self.failed += len(rows)
+            logger.error("session_activity_flush_failed", rows=len(rows), error=str(e))
+            return
+
+        self.written += len(rows)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Snapshot of tracker metrics for monitoring"""
+        return {
+            "pending": len(self._pending),
+            "touched": self.touched,
+            "written": self.written,
+            "failed": self.failed,
+        }
+
+
+class SessionRevocationSync:
+    """
+    Loads revocations into this process's revocation filter
+
+    Until a revocation has been seen, every revoked, unexpired session is
+    loaded; afterwards only sessions revoked since the newest one seen, so
+    each poll is one indexed range query. Revocations made in this process
+    apply immediately; ones made by other processes within interval seconds.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._watermark: Optional[datetime] = None
+        self._task: Optional[asyncio.Task] = None
+
+        self.syncs = 0
+        self.loaded = 0
+        self.failed = 0
+
+    async def start(self) -> None:
+        """Load current revocations and start polling"""
+        if self._task is None:
+            try:
+                await self.sync()
+            except Exception as e:
+                self.failed += 1
+                logger.error("session_revocation_sync_failed", error=str(e))
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop polling"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.sync()
+            except Exception as e:
+                self.failed += 1
+                logger.error("session_revocation_sync_failed", error=str(e))
+
+    async def sync(self) -> int:
+        """Apply revocations since the last sync; returns how many were loaded"""
+        stmt = select(UserSession.id, UserSession.expires_at, UserSession.revoked_at)
+        if self._watermark is None:
+            stmt = stmt.where(
+                UserSession.revoked_at.is_not(None),
+                UserSession.expires_at > datetime.now(timezone.utc),
+            )
+        else:
+            # revoked_at comes from each host's clock; overlap polls to absorb skew
+            stmt = stmt.where(UserSession.revoked_at >= self._watermark - REVOCATION_SYNC_OVERLAP)
+
+        async with AsyncSessionLocal() as db:
+            rows = (await db.execute(stmt)).all()
+
+        for session_id, expires_at, revoked_at in rows:
+            revoked_sessions.revoke(session_id, _aware(expires_at).timestamp())
+            revoked_at = _aware(revoked_at)
+            if self._watermark is None or revoked_at > self._watermark:
+                self._watermark = revoked_at
+
+        revoked_sessions.prune()
+        self.syncs += 1
+        self.loaded += len(rows)
+        return len(rows)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Snapshot of sync metrics for monitoring"""
+        return {
+            "running": self._task is not None,
+            "syncs": self.syncs,
+            "loaded": self.loaded,
+            "failed": self.failed,
+            "filter": revoked_sessions.metrics(),
+        }
+
+
+class AsyncSessionService:
+    """
+    Session lifecycle for refresh tokens
+
+    Following Epic 1 - JWT/Session token management
+    - One UserSession per login; its id is the sid claim of both tokens
+    - Refresh rotates the stored refresh token hash with a compare-and-set
+    - Presenting an already rotated refresh token revokes the session
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def open(
+        self,
+        session_id: UUID,
+        user_id: UUID,
+        refresh_token: str,
+        ip_address: Optional[str] = None,
+        user_agent: Optional[str] = None,
+    ) -> SessionSnapshot:
+        """Record a new session at login"""
+        expires_at = datetime.now(timezone.utc) + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+        snapshot = SessionSnapshot(
+            id=session_id,
+            user_id=user_id,
+            refresh_token_hash=hash_refresh_token(refresh_token),
+            expires_at=expires_at,
+        )
+        await self.db.execute(
+            insert(UserSession).values(
+                id=session_id,
+                user_id=user_id,
+                session_token=secrets.token_urlsafe(32),
+                refresh_token_hash=snapshot.refresh_token_hash,
+                ip_address=ip_address,
+                user_agent=user_agent,
+                expires_at=expires_at,
+            )
+        )
+        await self.db.commit()
+        session_cache.put(snapshot)
+        return snapshot
+
+    async def get_active(self, session_id: UUID, use_cache: bool = True) -> Optional[SessionSnapshot]:
+        """Return an active, unexpired session, from the cache when possible"""
+        if revoked_sessions.is_revoked(session_id):
+            return None
+
+        snapshot = session_cache.get(session_id) if use_cache else None
+        if snapshot is None:
+            row = (
+                await self.db.execute(
+                    select(
+                        UserSession.id,
+                        UserSession.user_id,
+                        UserSession.refresh_token_hash,
+                        UserSession.expires_at,
+                    ).where(UserSession.id == session_id, UserSession.is_active.is_(True))
+                )
+            ).first()
+            if row is None:
+                return None
+            snapshot = SessionSnapshot.from_row(row)
+            session_cache.put(snapshot)
+
+        if snapshot.expires_at <= datetime.now(timezone.utc):
+            return None
+        return snapshot
+
+    async def rotate(self, session: SessionSnapshot, presented_token: str, new_token: str) -> bool:
+        """
+        Swap the session's refresh token for new_token
+
+        Returns False if presented_token is not the session's current
+        refresh token; that means it was already used, so the session is
+        revoked.
+        """
+        presented_hash = hash_refresh_token(presented_token)
+        if not hmac.compare_digest(session.refresh_token_hash or "", presented_hash):
+            # The cached hash may predate a rotation done by another process
+            session = await self.get_active(session.id, use_cache=False)
+            if session is None or not hmac.compare_digest(session.refresh_token_hash or "", presented_hash):
+                if session is not None:
+                    logger.warning("refresh_token_reuse_detected", session_id=str(session.id))
+                    await self.revoke(session.id)
+                return False
+
+        now = datetime.now(timezone.utc)
+        rotated = replace(
+            session,
+            refresh_token_hash=hash_refresh_token(new_token),
+            expires_at=now + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
+        )
+        result = await self.db.execute(
+            update(UserSession)
+            .where(
+                UserSession.id == session.id,
+                UserSession.refresh_token_hash == presented_hash,
+                UserSession.is_active.is_(True),
+            )
+            .values(
+                refresh_token_hash=rotated.refresh_token_hash,
+                expires_at=rotated.expires_at,
+                last_activity=now,
+            )
+        )
+        await self.db.commit()
+        if result.rowcount != 1:
+            # Lost a race with a concurrent refresh of the same token
+            session_cache.invalidate(session.id)
+            return False
+
+        session_cache.put(rotated)
+        return True
+
+    async def revoke(self, session_id: UUID) -> bool:
+        """Revoke one session (logout)"""
+        revoked = await self._revoke(UserSession.id == session_id)
+        return bool(revoked)
+
+    async def revoke_user_sessions(self, user_id: UUID) -> int:
+        """Revoke every active session of a user (password reset, deactivation)"""
+        return len(await self._revoke(UserSession.user_id == user_id))
+
+    async def _revoke(self, condition) -> List[UUID]:
+        result = await self.db.execute(
+            update(UserSession)
+            .where(condition, UserSession.is_active.is_(True))
+            .values(is_active=False, revoked_at=datetime.now(timezone.utc))
+            .returning(UserSession.id, UserSession.expires_at)
+            .execution_options(synchronize_session=False)
+        )
+        rows = result.all()
+        await self.db.commit()
+
+        for session_id, expires_at in rows:
+            revoked_sessions.revoke(session_id, _aware(expires_at).timestamp())
+            session_cache.invalidate(session_id)
+        return [session_id for session_id, _ in rows]
+
+
+# Global session cache instance
+session_cache = SessionCache(
+    max_size=settings.SESSION_CACHE_SIZE,
+    ttl_seconds=settings.SESSION_CACHE_TTL_SECONDS,
+)
+
+# Global session activity tracker instance
+session_activity = SessionActivityTracker(flush_interval=settings.SESSION_ACTIVITY_FLUSH_INTERVAL_SECONDS)
+
+# Global revocation sync instance
+session_revocation_sync = SessionRevocationSync(interval=settings.SESSION_REVOCATION_SYNC_SECONDS)
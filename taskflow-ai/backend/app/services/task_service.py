@@ -0,0 +1,241 @@
+"""
+TaskFlow AI - Task Service
+
+Following Backend Template Epic 3: Core Business Entities
+- Task CRUD operations scoped to the owning user
+- Keyset-paginated task listings
+"""
+
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, Optional
+from uuid import UUID, uuid4
+
+from sqlalchemy import Select, delete, func, insert, select, tuple_, union_all, update
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+import structlog
+
+from app.models.task import Task
+from app.schemas.task import TaskCreate, TaskUpdate
+from app.services.user_stats import AsyncUserStatsService
+from app.utils.pagination import InvalidCursor, decode_cursor, encode_cursor
+
+logger = structlog.get_logger(__name__)
+
+# Columns loaded for task listings (no description or timestamps)
+TASK_LISTING_COLUMNS = (
+    Task.id,
+    Task.title,
+    Task.status,
+    Task.priority,
+    Task.due_date,
+    Task.project_id,
+)
+
+
+class TaskListing:
+    """
+    One page of a user's tasks in (due_date NULLS LAST, id) order
+
+    Pages are addressed by an opaque cursor holding the last row's
+    (due_date, id). A page is at most two index range scans on
+    (user_id, [status,] due_date, id): the dated tasks past the cursor,
+    topped up by the undated tasks in id order. Each scan starts at the
+    cursor, so a page costs the same however deep it is. Cursors are bound
+    to the filters they were issued for.
+    """
+
+    def __init__(
+        self,
+        user_id: UUID,
+        status: Optional[str] = None,
+        project_id: Optional[UUID] = None,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+    ):
+        self.user_id = user_id
+        self.status = status
+        self.project_id = project_id
+        self.limit = limit
+        self.after_due_date: Optional[datetime] = None
+        self.after_id: Optional[UUID] = None
+
+        if cursor:
+            position = decode_cursor(cursor)
+            if position.get("f") != self._filters_key():
+                raise InvalidCursor("Cursor does not match the listing filters")
+            try:
+                self.after_id = UUID(position["i"])
+                self.after_due_date = datetime.fromisoformat(position["d"]) if position.get("d") else None
+            except (KeyError, TypeError, ValueError):
+                raise InvalidCursor("Invalid cursor")
+
+    def _filters_key(self) -> str:
+        return f"{self.status or ''}|{self.project_id or ''}"
+
+    def statement(self) -> Select:
+        """SELECT for this page, fetching one extra row to detect a next page"""
+        stmt = select(*TASK_LISTING_COLUMNS).where(Task.user_id == self.user_id)
+
+        if self.status:
+            stmt = stmt.where(Task.status == self.status)
+        if self.project_id:
+            stmt = stmt.where(Task.project_id == self.project_id)
+
+        fetch = self.limit + 1
+        undated = stmt.where(Task.due_date.is_(None))
+        if self.after_id is not None and self.after_due_date is None:
+            # Already in the trailing tasks without a due date
+            return undated.where(Task.id > self.after_id).order_by(Task.id.asc()).limit(fetch)
+
+        # A single OR of "past the cursor" and "no due date" can only seek on
+        # user_id; as two queries each one seeks to where its rows start
+        dated = stmt.where(Task.due_date.is_not(None))
+        if self.after_id is not None:
+            dated = dated.where(tuple_(Task.due_date, Task.id) > tuple_(self.after_due_date, self.after_id))
+        dated = dated.order_by(Task.due_date.asc(), Task.id.asc()).limit(fetch).subquery()
+        undated = undated.order_by(Task.id.asc()).limit(fetch).subquery()
+
+        page = union_all(select(dated), select(undated)).subquery()
+        return select(page).order_by(page.c.due_date.asc().nulls_last(), page.c.id.asc()).limit(fetch)
+
+    def next_cursor(self, last_row: Row) -> str:
+        """Cursor for the page after last_row"""
+        return encode_cursor({
+            "d": last_row.due_date.isoformat() if last_row.due_date else None,
+            "i": str(last_row.id),
+            "f": self._filters_key(),
+        })
+
+
+class AsyncTaskService:
+    """
+    Async task service for request handlers
+
+    Writes are single INSERT/UPDATE/DELETE ... RETURNING statements and
+    update the user's stats rollups in the same transaction.
+
+    Following Backend Epic 3 - Task Management
+    """
+
+    # Rows fetched per round-trip while streaming a listing
+    STREAM_BATCH_SIZE = 500
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def stream_listing(self, listing: TaskListing) -> AsyncIterator[Row]:
+        """
+        Yield the rows of a listing page without materializing the page
+
+        Yields up to limit + 1 rows; an extra row means there is a next page.
+        """
+        result = await self.db.stream(
+            listing.statement().execution_options(yield_per=self.STREAM_BATCH_SIZE)
+        )
+        async for row in result:
+            yield row
+
+    async def get_task(self, user_id: UUID, task_id: UUID) -> Optional[Task]:
+        """Get one of the user's tasks"""
+        return await self.db.scalar(
+            select(Task).where(Task.id == task_id, Task.user_id == user_id)
+        )
+
+    async def create_task(self, user_id: UUID, task_data: TaskCreate) -> Task:
+        """
+        Create a task for the user
+
+        Following Epic 3 - Task CRUD operations
+        """
+        values = task_data.dict()
+        values["status"] = task_data.status.value
+
+        task = await self.db.scalar(
+            insert(Task)
+            .values(
+                id=uuid4(),
+                user_id=user_id,
+                completed_at=datetime.utcnow() if values["status"] == "completed" else None,
+                **values,
+            )
+            .returning(Task)
+        )
+        await AsyncUserStatsService(self.db).task_created(user_id, task.status, task.project_id)
+        await self.db.commit()
+
+        logger.info("task_created", task_id=str(task.id), user_id=str(user_id))
+
+        return task
+
+    async def update_task(self, user_id: UUID, task_id: UUID, task_data: TaskUpdate) -> Optional[Task]:
+        """
+        Update one of the user's tasks
+
+        Following Epic 3 - Task CRUD operations
+        """
+        values: Dict[str, Any] = task_data.dict(exclude_unset=True)
+        if "status" in values:
+            values["status"] = values["status"].value
+            if values["status"] == "completed":
+                # Keep the original completion time if it was already completed
+                values["completed_at"] = func.coalesce(Task.completed_at, datetime.utcnow())
+            else:
+                values["completed_at"] = None
+        values["updated_at"] = datetime.utcnow()
+
+        # Stats need the previous status and project; lock the row while reading them
+        previous = None
+        if "status" in values or "project_id" in values:
+            previous = (
+                await self.db.execute(
+                    select(Task.status, Task.project_id)
+                    .where(Task.id == task_id, Task.user_id == user_id)
+                    .with_for_update()
+                )
+            ).first()
+            if previous is None:
+                return None
+
+        task = await self.db.scalar(
+            update(Task)
+            .where(Task.id == task_id, Task.user_id == user_id)
+            .values(**values)
+            .returning(Task)
+        )
+        if not task:
+            await self.db.rollback()
+            return None
+
+        if previous is not None:
+            await AsyncUserStatsService(self.db).task_changed(
+                user_id, previous.status, previous.project_id, task.status, task.project_id,
+            )
+        await self.db.commit()
+
+        logger.info("task_updated", task_id=str(task_id), user_id=str(user_id))
+
+        return task
+
+    async def delete_task(self, user_id: UUID, task_id: UUID) -> bool:
+        """
+        Delete one of the user's tasks
+
+        Following Epic 3 - Task CRUD operations
+        """
+        deleted = (
+            await self.db.execute(
+                delete(Task)
+                .where(Task.id == task_id, Task.user_id == user_id)
+                .returning(Task.status, Task.project_id)
+            )
+        ).first()
+        if deleted is None:
+            return False
+
+        await AsyncUserStatsService(self.db).task_deleted(user_id, deleted.status, deleted.project_id)
+        await self.db.commit()
+
+        logger.info("task_deleted", task_id=str(task_id), user_id=str(user_id))
+
+        return True
@@ -0,0 +1,137 @@
+"""
+TaskFlow AI - Token Usage Recording
+
+Following Backend Template Epic 4: Advanced Business Logic
+- Per-user LLM token usage aggregated in memory
+- Periodic batched upserts into llm_token_usage
+"""
+
+import asyncio
+from datetime import date, datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy.dialects import postgresql, sqlite
+import structlog
+
+from app.core.config import settings
+from app.db.database import AsyncSessionLocal, get_async_engine
+from app.models.llm_usage import LLMTokenUsage
+
+logger = structlog.get_logger(__name__)
+
+
+class TokenUsageRecorder:
+    """
+    Aggregates token usage and writes it in one executemany upsert per flush
+
+    Calls for the same user, day and endpoint between flushes collapse into
+    one row increment. Usage is for reporting, so losing at most
+    flush_interval seconds of it on a crash is acceptable; a clean shutdown
+    flushes everything.
+    """
+
+    def __init__(self, flush_interval: float, max_pending: int = 50_000):
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._pending: Dict[Tuple[UUID, date, str], List[int]] = {}
+        self._task: Optional[asyncio.Task] = None
+
+        self.recorded = 0
+        self.written = 0
+        self.failed = 0
+
+    def record(self, user_id: UUID, endpoint: str, prompt_tokens: int, completion_tokens: int) -> None:
+        """Add one LLM call to the next flush"""
+        key = (user_id, datetime.now(timezone.utc).date(), endpoint)
+        totals = self._pending.get(key)
+        if totals is None:
+            # Don't let a stalled flush grow the buffer forever
+            if len(self._pending) >= self.max_pending:
+                self.failed += 1
+                return
+            totals = self._pending[key] = [0, 0, 0]
+        totals[0] += prompt_tokens
+        totals[1] += completion_tokens
+        totals[2] += 1
+        self.recorded += 1
+
+    async def start(self) -> None:
+        """Start the periodic flush task"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the flush task and write all pending usage"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        await self.flush()
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    @staticmethod
+    def _upsert():
+        insert = postgresql.insert if get_async_engine().dialect.name == "postgresql" else sqlite.insert
+        stmt = insert(LLMTokenUsage)
+        return stmt.on_conflict_do_update(
+            index_elements=[LLMTokenUsage.user_id, LLMTokenUsage.usage_date, LLMTokenUsage.endpoint],
+            set_={
+                "prompt_tokens": LLMTokenUsage.prompt_tokens + stmt.excluded.prompt_tokens,
+                "completion_tokens": LLMTokenUsage.completion_tokens + stmt.excluded.completion_tokens,
+                "requests": LLMTokenUsage.requests + stmt.excluded.requests,
+                "updated_at": stmt.excluded.updated_at,
+            },
+        )
+
+    async def flush(self) -> None:
+        """Write pending usage as one batched upsert"""
+        if not self._pending:
+            return
+
+        pending, self._pending = self._pending, {}
+        now = datetime.now(timezone.utc)
+        rows = [
+            {
+                "user_id": user_id,
+                "usage_date": usage_date,
+                "endpoint": endpoint,
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "requests": requests,
+                "updated_at": now,
+            }
+            for (user_id, usage_date, endpoint), (prompt_tokens, completion_tokens, requests) in pending.items()
+        ]
+
+        try:
+            async with AsyncSessionLocal() as db:
+                await db.execute(self._upsert(), rows)
+                await db.commit()
+        except Exception as e:
+            self.failed += len(rows)
+            logger.error("token_usage_flush_failed", rows=len(rows), error=str(e))
+            return
+
+        self.written += len(rows)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Snapshot of recorder metrics for monitoring"""
+        return {
+            "pending": len(self._pending),
+            "recorded": self.recorded,
+            "written": self.written,
+            "failed": self.failed,
+        }
+
+
+# Global token usage recorder instance
+token_usage_recorder = TokenUsageRecorder(flush_interval=settings.TOKEN_USAGE_FLUSH_INTERVAL_SECONDS)
@@ -0,0 +1,191 @@
+"""
+TaskFlow AI - User Cache
+
+Following Backend Template Epic 3: Core Business Entities
+- Cross-request cache of detached user snapshots
+- Lookup by id and by email
+- TTL expiry, LRU eviction and write invalidation
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from app.core.config import settings
+
+
+@dataclass(frozen=True)
+class UserSnapshot:
+    """
+    Read-only copy of a User row, safe to share across requests and sessions
+
+    Exposes the same attributes as the User model for read paths, except
+    hashed_password: credentials are always checked against the database,
+    since another worker's cached copy may predate a password change.
+    """
+    id: UUID
+    email: str
+    first_name: Optional[str] = None
+    last_name: Optional[str] = None
+    avatar_url: Optional[str] = None
+    bio: Optional[str] = None
+    is_active: bool = True
+    is_verified: bool = False
+    is_superuser: bool = False
+    preferences: Dict[str, Any] = field(default_factory=dict)
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    last_login: Optional[datetime] = None
+    email_verified_at: Optional[datetime] = None
+
+    @classmethod
+    def from_user(cls, user) -> "UserSnapshot":
+        """Copy the loaded column values of a User"""
+        return cls(
+            id=user.id,
+            email=user.email,
+            first_name=user.first_name,
+            last_name=user.last_name,
+            avatar_url=user.avatar_url,
+            bio=user.bio,
+            is_active=user.is_active,
+            is_verified=user.is_verified,
+            is_superuser=user.is_superuser,
+            preferences=dict(user.preferences or {}),
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+            last_login=user.last_login,
+            email_verified_at=user.email_verified_at,
+        )
+
+    @property
+    def full_name(self) -> str:
+        """Get user's full name"""
+        if self.first_name and self.last_name:
+            return f"{self.first_name} {self.last_name}"
+        elif self.first_name:
+            return self.first_name
+        else:
+            return self.email.split("@")[0]
+
+    @property
+    def is_email_verified(self) -> bool:
+        """Check if email is verified"""
+        return self.email_verified_at is not None
+
+
+class UserCache:
+    """
+    TTL + LRU cache of UserSnapshots keyed by id, with an email index
+
+    Each process has its own cache, so the TTL bounds how long another
+    worker can serve a snapshot that this worker has invalidated. Logins
+    read credentials and is_active from the database, and deactivation
+    revokes the user's sessions (synced to every worker), so neither
+    depends on that TTL.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._by_id: "OrderedDict[UUID, tuple[UserSnapshot, float]]" = OrderedDict()
+        self._id_by_email: Dict[str, UUID] = {}
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get_by_id(self, user_id: UUID) -> Optional[UserSnapshot]:
+        """Return a cached snapshot by id, or None"""
+        with self._lock:
+            return self._get(user_id)
+
+    def get_by_email(self, email: str) -> Optional[UserSnapshot]:
+        """Return a cached snapshot by email, or None"""
+        with self._lock:
+            user_id = self._id_by_email.get(email.lower())
+            if user_id is None:
+                self.misses += 1
+                return None
+            return self._get(user_id)
+
+    def put(self, snapshot: UserSnapshot) -> None:
+        """Cache a snapshot for ttl_seconds"""
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._remove(snapshot.id)
+            self._by_id[snapshot.id] = (snapshot, time.monotonic() + self.ttl_seconds)
+            self._id_by_email[snapshot.email.lower()] = snapshot.id
+            while len(self._by_id) > self.max_size:
+                oldest_id = next(iter(self._by_id))
+                self._remove(oldest_id)
+
+    def update(self, user_id: UUID, **changes: Any) -> None:
+        """Apply a known column change to a cached snapshot, keeping its expiry"""
+        with self._lock:
+            entry = self._by_id.get(user_id)
+            if entry is not None:
+                snapshot, expires_at = entry
+                self._by_id[user_id] = (replace(snapshot, **changes), expires_at)
+
+    def invalidate(self, user_id: UUID) -> None:
+        """Drop a user after a write"""
+        with self._lock:
+            if self._remove(user_id):
+                self.invalidations += 1
+
+    def clear(self) -> None:
+        """Drop all cached users"""
+        with self._lock:
+            self._by_id.clear()
+            self._id_by_email.clear()
+
+    def metrics(self) -> Dict[str, Any]:
+        """Snapshot of cache metrics for monitoring"""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._by_id),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "invalidations": self.invalidations,
+        }
+
+    def _get(self, user_id: UUID) -> Optional[UserSnapshot]:
+        entry = self._by_id.get(user_id)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        snapshot, expires_at = entry
+        if expires_at <= time.monotonic():
+            self._remove(user_id)
+            self.misses += 1
+            return None
+
+        self._by_id.move_to_end(user_id)
+        self.hits += 1
+        return snapshot
+
+    def _remove(self, user_id: UUID) -> bool:
+        entry = self._by_id.pop(user_id, None)
+        if entry is None:
+            return False
+        email = entry[0].email.lower()
+        if self._id_by_email.get(email) == user_id:
+            del self._id_by_email[email]
+        return True
+
+
+# Global user cache instance
+user_cache = UserCache(
+    max_size=settings.USER_CACHE_MAX_SIZE,
+    ttl_seconds=settings.USER_CACHE_TTL_SECONDS,
+)
@@ -0,0 +1,360 @@
+"""
+TaskFlow AI - Bulk User Provisioning
+
+Following Backend Template Epic 3: Core Business Entities
+- Streamed CSV / NDJSON account uploads
+- Set-based email dedupe and batched inserts (COPY on PostgreSQL)
+- Password hashing spread across the hashing pool
+"""
+
+import asyncio
+import codecs
+import csv
+import json
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple
+from uuid import uuid4
+
+from pydantic import ValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+import structlog
+
+from app.core.config import settings
+from app.core.hashing import HashingPoolSaturated, hashing_executor
+from app.core.security import get_password_hashes
+from app.models.user import User
+from app.schemas.user import BulkProvisioningResponse, ProvisioningRowError, UserProvisionRow
+
+logger = structlog.get_logger(__name__)
+
+# Upload formats by media type
+UPLOAD_FORMATS = {
+    "text/csv": "csv",
+    "application/csv": "csv",
+    "application/x-ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+    "application/json-lines": "ndjson",
+}
+
+# Columns written per provisioned user, in COPY order
+COPY_COLUMNS = (
+    "id",
+    "email",
+    "hashed_password",
+    "first_name",
+    "last_name",
+    "is_active",
+    "is_verified",
+    "is_superuser",
+    "preferences",
+)
+
+# (row number, parsed fields, parse error)
+UploadRow = Tuple[int, Optional[Dict[str, Any]], Optional[str]]
+
+
+class ProvisioningFormatError(ValueError):
+    """Raised when an upload cannot be parsed at all (bad header, encoding)"""
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Split a byte stream into text lines without buffering the whole body"""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+
+    try:
+        async for chunk in chunks:
+            pending += decoder.decode(chunk)
+            *lines, pending = pending.split("\n")
+            for line in lines:
+                yield line.rstrip("\r")
+        pending += decoder.decode(b"", final=True)
+    except UnicodeDecodeError:
+        raise ProvisioningFormatError("Upload must be UTF-8 encoded")
+
+    if pending:
+        yield pending.rstrip("\r")
+
+
+async def iter_csv_rows(chunks: AsyncIterator[bytes]) -> AsyncIterator[UploadRow]:
+    """
+    Parse a streamed CSV upload with a header row
+
+    Quoted fields may contain newlines: physical lines are joined until the
+    quotes balance, then the record is parsed on its own.
+    """
+    header: Optional[List[str]] = None
+    record = ""
+    row_number = 0
+
+    async for line in iter_lines(chunks):
+        record = f"{record}\n{line}" if record else line
+        if record.count('"') % 2:
+            continue  # inside a quoted field
+        if not record.strip():
+            record = ""
+            continue
+
+        values = next(csv.reader([record]))
+        record = ""
+
+        if header is None:
+            header = [name.strip().lower() for name in values]
+            missing = {"email", "password"} - set(header)
+            if missing:
+                raise ProvisioningFormatError(f"CSV header is missing: {', '.join(sorted(missing))}")
+            continue
+
+        row_number += 1
+        if len(values) != len(header):
+            yield row_number, None, f"Expected {len(header)} columns, got {len(values)}"
+            continue
+        yield row_number, dict(zip(header, values)), None
+
+    if record:
+        yield row_number + 1, None, "Unterminated quoted field"
+
+
+async def iter_ndjson_rows(chunks: AsyncIterator[bytes]) -> AsyncIterator[UploadRow]:
+    """Parse a streamed newline-delimited JSON upload, one object per line"""
+    row_number = 0
+
+    async for line in iter_lines(chunks):
+        if not line.strip():
+            continue
+
+        row_number += 1
+        try:
+            data = json.loads(line)
+        except ValueError:
+            yield row_number, None, "Invalid JSON"
+            continue
+
+        if not isinstance(data, dict):
+            yield row_number, None, "Expected a JSON object"
+            continue
+        yield row_number, data, None
+
+
+def parse_upload(upload_format: str, chunks: AsyncIterator[bytes]) -> AsyncIterator[UploadRow]:
+    """Row iterator for an upload format ("csv" or "ndjson")"""
+    if upload_format == "csv":
+        return iter_csv_rows(chunks)
+    return iter_ndjson_rows(chunks)
+
+
+class AsyncUserProvisioningService:
+    """
+    Creates accounts in bulk from a row stream
+
+    Rows are validated and collected into batches. Each batch costs one
+    SELECT to find already-registered emails, a parallel hashing pass and
+    one bulk insert, committed per batch so a failed batch does not undo
+    earlier ones.
+
+    Following Backend Epic 3 - User Management
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        batch_size: Optional[int] = None,
+        max_rows: Optional[int] = None,
+    ):
+        self.db = db
+        self.batch_size = batch_size or settings.PROVISIONING_BATCH_SIZE
+        self.max_rows = max_rows or settings.PROVISIONING_MAX_ROWS
+        self.max_reported_errors = settings.PROVISIONING_MAX_REPORTED_ERRORS
+
+    async def provision(self, rows: AsyncIterator[UploadRow]) -> BulkProvisioningResponse:
+        """Create accounts for every valid, new row and report the outcome"""
+        report = BulkProvisioningResponse()
+        started = time.perf_counter()
+        seen_emails: Set[str] = set()
+        batch: List[Tuple[int, UserProvisionRow]] = []
+
+        async for row_number, data, error in rows:
+            if report.total_rows >= self.max_rows:
+                self._reject(report, row_number, None, f"Upload exceeds {self.max_rows} rows; remaining rows ignored")
+                break
+            report.total_rows += 1
+
+            if error:
+                self._reject(report, row_number, None, error)
+                continue
+
+            try:
+                row = UserProvisionRow.model_validate(data)
+            except ValidationError as e:
+                email = data.get("email")
+                self._reject(report, row_number, email if isinstance(email, str) else None, _format_validation_error(e))
+                continue
+
+            row.email = row.email.lower()
+            if row.email in seen_emails:
+                self._reject(report, row_number, row.email, "Duplicate email in upload", duplicate=True)
+                continue
+            seen_emails.add(row.email)
+
+            batch.append((row_number, row))
+            if len(batch) >= self.batch_size:
+                await self._provision_batch(batch, report)
+                batch = []
+
+        if batch:
+            await self._provision_batch(batch, report)
+
+        report.errors.sort(key=lambda row_error: row_error.row)
+        report.elapsed_seconds = round(time.perf_counter() - started, 3)
+        if report.elapsed_seconds:
+            report.rows_per_second = round(report.total_rows / report.elapsed_seconds, 1)
+
+        logger.info(
+            "bulk_provisioning_completed",
+            total_rows=report.total_rows,
+            created=report.created,
+            duplicates=report.duplicates,
+            failed=report.failed,
+            rows_per_second=report.rows_per_second,
+        )
+
+        return report
+
+    async def _provision_batch(self, batch: List[Tuple[int, UserProvisionRow]], report: BulkProvisioningResponse) -> None:
+        batch = await self._drop_registered(batch, report)
+        if not batch:
+            return
+
+        hashed_passwords = await self._hash_passwords([row.password for _, row in batch])
+        values = [
+            {
+                "id": uuid4(),
+                "email": row.email,
+                "hashed_password": hashed_password,
+                "first_name": row.first_name,
+                "last_name": row.last_name,
+                "is_active": True,
+                "is_verified": False,
+                "is_superuser": False,
+                "preferences": {},
+            }
+            for (_, row), hashed_password in zip(batch, hashed_passwords)
+        ]
+
+        try:
+            await self._insert(values)
+            await self.db.commit()
+        except IntegrityError:
+            # Someone registered one of these emails since the dedupe query
+            await self.db.rollback()
+            batch = await self._drop_registered(batch, report)
+            kept_emails = {row.email for _, row in batch}
+            values = [value for value in values if value["email"] in kept_emails]
+            if not values:
+                return
+            try:
+                await self._insert(values)
+                await self.db.commit()
+            except Exception as e:
+                await self._fail_batch(batch, report, e)
+                return
+        except Exception as e:
+            await self._fail_batch(batch, report, e)
+            return
+
+        report.created += len(values)
+
+    async def _drop_registered(
+        self, batch: List[Tuple[int, UserProvisionRow]], report: BulkProvisioningResponse
+    ) -> List[Tuple[int, UserProvisionRow]]:
+        """Remove rows whose email already has an account (one query per batch)"""
+        registered = await self._registered_emails([row.email for _, row in batch])
+        if not registered:
+            return batch
+
+        kept = []
+        for row_number, row in batch:
+            if row.email in registered:
+                self._reject(report, row_number, row.email, "Email already registered", duplicate=True)
+            else:
+                kept.append((row_number, row))
+        return kept
+
+    async def _registered_emails(self, emails: List[str]) -> Set[str]:
+        result = await self.db.scalars(select(User.email).where(User.email.in_(emails)))
+        return set(result)
+
+    async def _hash_passwords(self, passwords: List[str]) -> List[str]:
+        """
+        Hash passwords in chunks across the hashing pool
+
+        At most workers - 1 chunks are in flight, so interactive logins and
+        registrations always find a free worker while an upload runs.
+        """
+        chunk_size = settings.PROVISIONING_HASH_CHUNK_SIZE
+        chunks = [passwords[i:i + chunk_size] for i in range(0, len(passwords), chunk_size)]
+        in_flight = asyncio.Semaphore(max(1, hashing_executor.max_workers - 1))
+
+        async def hash_chunk(chunk: List[str]) -> List[str]:
+            async with in_flight:
+                while True:
+                    try:
+                        return await hashing_executor.run(get_password_hashes, chunk)
+                    except HashingPoolSaturated:
+                        # Yield the pool to interactive traffic and retry
+                        await asyncio.sleep(0.05)
+
+        hashed_chunks = await asyncio.gather(*(hash_chunk(chunk) for chunk in chunks))
+        return [hashed for chunk in hashed_chunks for hashed in chunk]
+
+    async def _insert(self, values: List[Dict[str, Any]]) -> None:
+        """Bulk insert with COPY on asyncpg, executemany elsewhere"""
+        connection = await self.db.connection()
+        if connection.dialect.name == "postgresql" and connection.dialect.driver == "asyncpg":
+            raw_connection = await connection.get_raw_connection()
+            await raw_connection.driver_connection.copy_records_to_table(
+                User.__tablename__,
+                columns=COPY_COLUMNS,
+                records=[
+                    tuple(json.dumps(value[c]) if c == "preferences" else value[c] for c in COPY_COLUMNS)
+                    for value in values
+                ],
+            )
+            return
+
+        await self.db.execute(insert(User), values)
+
+    async def _fail_batch(
+        self, batch: List[Tuple[int, UserProvisionRow]], report: BulkProvisioningResponse, error: Exception
+    ) -> None:
+        await self.db.rollback()
+        logger.error("bulk_provisioning_batch_failed", rows=len(batch), error=str(error))
+        for row_number, row in batch:
+            self._reject(report, row_number, row.email, "Failed to create account")
+
+    def _reject(
+        self,
+        report: BulkProvisioningResponse,
+        row_number: int,
+        email: Optional[str],
+        error: str,
+        duplicate: bool = False,
+    ) -> None:
+        if duplicate:
+            report.duplicates += 1
+        else:
+            report.failed += 1
+
+        if len(report.errors) < self.max_reported_errors:
+            report.errors.append(ProvisioningRowError(row=row_number, email=email, error=error))
+        else:
+            report.errors_truncated = True
+
+
+def _format_validation_error(error: ValidationError) -> str:
+    """Compact one-line summary of a row validation error"""
+    return "; ".join(
+        f"{'.'.join(str(part) for part in item['loc'])}: {item['msg']}" for item in error.errors()
+    )
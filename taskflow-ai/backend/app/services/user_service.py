@@ -7,16 +7,29 @@ Following Backend Template Epic 3: Core Business Entities
 - Authentication and authorization logic
 """
 
-from datetime import datetime
-from typing import Optional
-from uuid import UUID
+from datetime import datetime, timedelta
+from typing import Optional, Union
+from uuid import UUID, uuid4
 
+from sqlalchemy import insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 import structlog
 
-from app.core.security import verify_password, get_password_hash
+from app.core.config import settings
+from app.core.security import (
+    verify_password,
+    get_password_hash,
+    averify_password,
+    aget_password_hash,
+)
 from app.models.user import User, LoginAttempt
 from app.schemas.auth import UserCreate, UserUpdate
+from app.services.last_login import last_login_stamper
+from app.services.lockout import LoginClaim, lockout_engine
+from app.services.login_audit import login_audit_writer
+from app.services.session_service import AsyncSessionService
+from app.services.user_cache import UserSnapshot, user_cache
 
 logger = structlog.get_logger(__name__)
 
@@ -86,35 +99,43 @@ class UserService:
         
         self.db.commit()
         self.db.refresh(user)
+        user_cache.invalidate(user.id)
         
         logger.info("user_updated", user_id=str(user.id))
         
         return user
     
-    def authenticate_user(self, email: str, password: str) -> Optional[User]:
+    def authenticate_user(
+        self,
+        email: str,
+        password: str,
+        ip_address: str = None,
+        user_agent: str = None,
+    ) -> Optional[User]:
         """
         Authenticate user with email and password
         
+        Logs exactly one login attempt row with the actual outcome.
+        
         Following Epic 1 - User authentication system
         """
-        # Log the login attempt
-        self._log_login_attempt(email, success=False)  # Default to failed, update if successful
-        
         user = self.get_user_by_email(email)
         if not user:
             logger.warning("authentication_failed_user_not_found", email=email)
+            self._log_login_attempt(email, False, ip_address, user_agent, "user_not_found")
             return None
         
         if not verify_password(password, user.hashed_password):
             logger.warning("authentication_failed_invalid_password", email=email)
+            self._log_login_attempt(email, False, ip_address, user_agent, "invalid_password")
             return None
         
         if not user.is_active:
             logger.warning("authentication_failed_inactive_user", email=email)
+            self._log_login_attempt(email, False, ip_address, user_agent, "inactive_user")
             return None
         
-        # Update successful login attempt
-        self._log_login_attempt(email, success=True)
+        self._log_login_attempt(email, True, ip_address, user_agent)
         
         logger.info("user_authenticated", user_id=str(user.id), email=email)
         
@@ -126,6 +147,7 @@ class UserService:
         if user:
             user.last_login = datetime.utcnow()
             self.db.commit()
+            user_cache.invalidate(user.id)
     
     def update_password(self, user_id: UUID, new_password: str) -> bool:
         """
@@ -143,6 +165,7 @@ class UserService:
         user.updated_at = datetime.utcnow()
         
         self.db.commit()
+        user_cache.invalidate(user.id)
         
         logger.info("password_updated", user_id=str(user.id))
         
@@ -159,6 +182,7 @@ class UserService:
         user.updated_at = datetime.utcnow()
         
         self.db.commit()
+        user_cache.invalidate(user.id)
         
         logger.info("email_verified", user_id=str(user.id))
         
@@ -178,6 +202,7 @@ class UserService:
         user.updated_at = datetime.utcnow()
         
         self.db.commit()
+        user_cache.invalidate(user.id)
         
         logger.info("user_deactivated", user_id=str(user.id))
         
@@ -222,12 +247,20 @@ class UserService:
         user.updated_at = datetime.utcnow()
         
         self.db.commit()
+        user_cache.invalidate(user.id)
         
         logger.info("user_preferences_updated", user_id=str(user.id))
         
         return True
     
-    def _log_login_attempt(self, email: str, success: bool, ip_address: str = None, user_agent: str = None) -> None:
+    def _log_login_attempt(
+        self,
+        email: str,
+        success: bool,
+        ip_address: str = None,
+        user_agent: str = None,
+        failure_reason: str = None,
+    ) -> None:
         """
         Log login attempt for security tracking
         
@@ -235,10 +268,10 @@ class UserService:
         """
         login_attempt = LoginAttempt(
             email=email.lower(),
-            ip_address=ip_address,
+            ip_address=ip_address or "unknown",
             user_agent=user_agent,
             success=success,
-            failure_reason=None if success else "authentication_failed"
+            failure_reason=None if success else failure_reason
         )
         
         self.db.add(login_attempt)
@@ -250,8 +283,6 @@ class UserService:
     
     def get_failed_login_attempts(self, email: str, hours: int = 1) -> int:
         """Get number of failed login attempts in the last N hours"""
-        from datetime import timedelta
-        
         cutoff_time = datetime.utcnow() - timedelta(hours=hours)
         
         count = (
@@ -270,3 +301,344 @@ class UserService:
         """Check if account is locked due to too many failed attempts"""
         failed_attempts = self.get_failed_login_attempts(email)
         return failed_attempts >= max_attempts
+
+
+class AsyncUserService:
+    """
+    Async user service for request handlers
+    
+    Mirrors UserService on an AsyncSession so database round-trips and
+    password hashing never block the event loop. UserService remains the
+    sync path for scripts and maintenance jobs.
+    
+    Following Backend Epic 3 - User Management
+    """
+    
+    def __init__(self, db: AsyncSession):
+        self.db = db
+    
+    async def get_user_by_id(self, user_id: UUID) -> Optional[Union[User, UserSnapshot]]:
+        """
+        Get user by ID
+        
+        Served from the user cache when possible; otherwise from the
+        session identity map or a single SELECT.
+        """
+        cached_user = user_cache.get_by_id(user_id)
+        if cached_user is not None:
+            return cached_user
+        
+        user = await self._load_user(user_id)
+        if user:
+            user_cache.put(UserSnapshot.from_user(user))
+        return user
+    
+    async def get_user_by_email(self, email: str) -> Optional[Union[User, UserSnapshot]]:
+        """
+        Get user by email address
+        
+        Served from the user cache when possible.
+        """
+        cached_user = user_cache.get_by_email(email)
+        if cached_user is not None:
+            return cached_user
+        
+        user = await self.db.scalar(select(User).where(User.email == email.lower()))
+        if user:
+            user_cache.put(UserSnapshot.from_user(user))
+        return user
+    
+    async def _load_user(self, user_id: UUID) -> Optional[User]:
+        """Load the ORM user for a write (identity map first, then one SELECT)"""
+        return await self.db.get(User, user_id)
+    
+    async def create_user(self, user_data: UserCreate) -> User:
+        """
+        Create a new user
+        
+        Single INSERT ... RETURNING, so server defaults come back without
+        a refresh SELECT.
+        
+        Following Epic 3 - User profile CRUD operations
+        """
+        # Hash the password in the hashing pool
+        hashed_password = await aget_password_hash(user_data.password)
+        
+        db_user = await self.db.scalar(
+            insert(User)
+            .values(
+                id=uuid4(),
+                email=user_data.email.lower(),
+                hashed_password=hashed_password,
+                first_name=user_data.first_name,
+                last_name=user_data.last_name,
+                is_active=True,
+                is_verified=False,  # Email verification required
+                preferences={},
+            )
+            .returning(User)
+        )
+        await self.db.commit()
+        
+        # Prime the cache for the login that usually follows registration
+        user_cache.put(UserSnapshot.from_user(db_user))
+        
+        logger.info("user_created", user_id=str(db_user.id), email=db_user.email)
+        
+        return db_user
+    
+    async def update_user(self, user_id: UUID, user_data: UserUpdate) -> Optional[User]:
+        """
+        Update user profile
+        
+        Single UPDATE ... RETURNING; no load or refresh round-trips.
+        
+        Following Epic 3 - User profile CRUD operations
+        """
+        update_data = user_data.dict(exclude_unset=True)
+        update_data["updated_at"] = datetime.utcnow()
+        
+        user = await self.db.scalar(
+            update(User)
+            .where(User.id == user_id)
+            .values(**update_data)
+            .returning(User)
+        )
+        if not user:
+            return None
+        
+        await self.db.commit()
+        user_cache.invalidate(user_id)
+        
+        logger.info("user_updated", user_id=str(user_id))
+        
+        return user
+    
+    async def _update_columns(self, user_id: UUID, **values) -> bool:
+        """
+        Write columns with one UPDATE ... WHERE id RETURNING id and commit
+        
+        Returns False when the user does not exist.
+        """
+        updated_id = await self.db.scalar(
+            update(User)
+            .where(User.id == user_id)
+            .values(**values)
+            .returning(User.id)
+        )
+        if updated_id is None:
+            return False
+        
+        await self.db.commit()
+        return True
+    
+    async def authenticate_user(
+        self,
+        email: str,
+        password: str,
+        ip_address: str = None,
+        user_agent: str = None,
+        claim: Optional[LoginClaim] = None,
+    ) -> Optional[User]:
+        """
+        Authenticate user with email and password
+        
+        Queues exactly one login attempt row with the actual outcome on the
+        login audit writer and updates the lockout counters; no audit
+        transaction runs on the request path. With a claim from
+        claim_login_attempt() the failure is already counted, and the
+        claim is released if the login succeeds. The user row is always read
+        from the database (not the user cache), so a password reset or
+        deactivation on another worker takes effect immediately.
+        
+        Following Epic 1 - User authentication system
+        """
+        user = await self.db.scalar(select(User).where(User.email == email.lower()))
+        if not user:
+            logger.warning("authentication_failed_user_not_found", email=email)
+            await self._record_attempt(email, False, ip_address, user_agent, "user_not_found", claim)
+            return None
+        
+        user_cache.put(UserSnapshot.from_user(user))
+        
+        if not await averify_password(password, user.hashed_password):
+            logger.warning("authentication_failed_invalid_password", email=email)
+            await self._record_attempt(email, False, ip_address, user_agent, "invalid_password", claim)
+            return None
+        
+        if not user.is_active:
+            logger.warning("authentication_failed_inactive_user", email=email)
+            await self._record_attempt(email, False, ip_address, user_agent, "inactive_user", claim)
+            return None
+        
+        await self._record_attempt(email, True, ip_address, user_agent, claim=claim)
+        
+        logger.info("user_authenticated", user_id=str(user.id), email=email)
+        
+        return user
+    
+    async def update_last_login(self, user_id: UUID, defer: Optional[bool] = None) -> None:
+        """
+        Update user's last login timestamp
+        
+        Deferred by default (LAST_LOGIN_STAMP_DEFERRED): the stamp is
+        coalesced by the last-login stamper and written in a bulk UPDATE,
+        so the login path does no write at all. Otherwise one UPDATE.
+        """
+        if defer is None:
+            defer = settings.LAST_LOGIN_STAMP_DEFERRED
+        
+        now = datetime.utcnow()
+        if defer:
+            last_login_stamper.stamp(user_id, now)
+        elif not await self._update_columns(user_id, last_login=now):
+            return
+        
+        # Only last_login changed, so patch the snapshot instead of dropping it
+        user_cache.update(user_id, last_login=now)
+    
+    async def update_password(self, user_id: UUID, new_password: str) -> bool:
+        """
+        Update user password
+        
+        Following Epic 1 - Password reset functionality
+        """
+        # Hash new password in the hashing pool
+        hashed_password = await aget_password_hash(new_password)
+        
+        if not await self._update_columns(
+            user_id,
+            hashed_password=hashed_password,
+            updated_at=datetime.utcnow(),
+        ):
+            return False
+        
+        user_cache.invalidate(user_id)
+        
+        logger.info("password_updated", user_id=str(user_id))
+        
+        return True
+    
+    async def verify_email(self, user_id: UUID) -> bool:
+        """Mark user email as verified"""
+        now = datetime.utcnow()
+        if not await self._update_columns(
+            user_id,
+            is_verified=True,
+            email_verified_at=now,
+            updated_at=now,
+        ):
+            return False
+        
+        user_cache.invalidate(user_id)
+        
+        logger.info("email_verified", user_id=str(user_id))
+        
+        return True
+    
+    async def deactivate_user(self, user_id: UUID) -> bool:
+        """
+        Deactivate user account
+        
+        Following Epic 3 - Account deactivation
+        """
+        if not await self._update_columns(user_id, is_active=False, updated_at=datetime.utcnow()):
+            return False
+        
+        user_cache.invalidate(user_id)
+        # Other workers may still hold the active snapshot; revoked sessions
+        # reach them through the revocation sync and reject the user's tokens
+        revoked = await AsyncSessionService(self.db).revoke_user_sessions(user_id)
+        
+        logger.info("user_deactivated", user_id=str(user_id), sessions_revoked=revoked)
+        
+        return True
+    
+    async def delete_user(self, user_id: UUID) -> bool:
+        """
+        Delete user account (soft delete by deactivation)
+        
+        Following Epic 3 - Account deletion and data export
+        """
+        return await self.deactivate_user(user_id)
+    
+    async def get_user_preferences(self, user_id: UUID) -> dict:
+        """
+        Get user preferences
+        
+        Following Epic 3 - User preferences and settings management
+        """
+        user = await self.get_user_by_id(user_id)
+        if not user:
+            return {}
+        
+        return dict(user.preferences or {})
+    
+    async def update_user_preferences(self, user_id: UUID, preferences: dict) -> bool:
+        """Update user preferences"""
+        user = await self._load_user(user_id)
+        if not user:
+            return False
+        
+        # Merge with existing preferences (new dict so the JSON change is detected)
+        current_prefs = dict(user.preferences or {})
+        current_prefs.update(preferences)
+        
+        user.preferences = current_prefs
+        user.updated_at = datetime.utcnow()
+        
+        await self.db.commit()
+        user_cache.invalidate(user.id)
+        
+        logger.info("user_preferences_updated", user_id=str(user.id))
+        
+        return True
+    
+    async def _record_attempt(
+        self,
+        email: str,
+        success: bool,
+        ip_address: str = None,
+        user_agent: str = None,
+        failure_reason: str = None,
+        claim: Optional[LoginClaim] = None,
+    ) -> None:
+        """
+        Record a login attempt for auditing and lockout
+        
+        Following Epic 1 - Login attempts and security logging
+        """
+        login_audit_writer.record(email, success, ip_address, user_agent, failure_reason)
+        
+        if success:
+            if claim is not None:
+                await lockout_engine.release(claim)
+            await lockout_engine.record_success(email)
+        elif claim is None:
+            await lockout_engine.record_failure(email, ip_address)
+    
+    async def get_failed_login_attempts(self, email: str) -> int:
+        """Get number of failed login attempts inside the lockout window"""
+        return await lockout_engine.get_failed_attempts(email)
+    
+    async def claim_login_attempt(self, email: str, ip_address: str = None) -> Optional[LoginClaim]:
+        """
+        Count a login attempt against the lockout limits before verifying it
+        
+        Returns None if the account or client IP is locked. Pass the claim
+        to authenticate_user(), or to release_login_attempt() if the
+        attempt is abandoned.
+        """
+        return await lockout_engine.claim(email, ip_address)
+    
+    async def release_login_attempt(self, claim: LoginClaim) -> None:
+        """Give back a claimed attempt that did not fail"""
+        await lockout_engine.release(claim)
+    
+    async def is_account_locked(self, email: str, ip_address: str = None) -> bool:
+        """
+        Check if account is locked due to too many failed attempts
+        
+        Served from the lockout engine's sliding-window counters, not the database.
+        """
+        return await lockout_engine.is_locked(email, ip_address)
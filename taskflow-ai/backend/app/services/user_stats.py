@@ -0,0 +1,376 @@
+"""
+TaskFlow AI - User Statistics Service
+
+Following Backend Template Epic 3: Core Business Entities
+- Incremental per-user task rollups, updated inside task write transactions
+- Bulk rebuild job to reconcile drift
+"""
+
+import asyncio
+import time
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import case, delete, func, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+import structlog
+
+from app.core.config import settings
+from app.db.database import AsyncSessionLocal
+from app.models.task import Task
+from app.models.user import User
+from app.models.user_stats import UserProjectStatistics, UserStatistics
+from app.schemas.auth import UserStats
+
+logger = structlog.get_logger(__name__)
+
+# Statuses that count towards a project being active
+OPEN_TASK_STATUSES = ("pending", "in_progress")
+
+
+def _is_open(status: Optional[str]) -> bool:
+    return status in OPEN_TASK_STATUSES
+
+
+def _current_streak(streak_days: int, last_completed_on: Optional[date], today: date) -> int:
+    """A streak survives until the end of the day after its last completion"""
+    if last_completed_on is None or last_completed_on < today - timedelta(days=1):
+        return 0
+    return streak_days
+
+
+def productivity_score(completion_rate: float, streak_days: int) -> float:
+    """
+    0-100 score from the completion rate (70%) and the streak (30%)
+
+    The streak part saturates at 30 days.
+    """
+    return round(completion_rate * 70 + min(streak_days, 30) / 30 * 30, 1)
+
+
+class AsyncUserStatsService:
+    """
+    Maintains user_stats and user_project_stats alongside task writes
+
+    The task_* hooks must run in the same transaction as the task write
+    they describe; each one is one or two upserts, never a scan of tasks.
+    Un-completing a task cannot shorten a streak incrementally, so the
+    rebuild job corrects streaks along with any other drift.
+
+    Following Backend Epic 3 - User statistics and dashboards
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    def _insert(self, model):
+        """Dialect insert supporting ON CONFLICT (PostgreSQL or SQLite)"""
+        if self.db.bind.dialect.name == "postgresql":
+            return postgresql.insert(model)
+        return sqlite.insert(model)
+
+    async def task_created(self, user_id: UUID, status: str, project_id: Optional[UUID]) -> None:
+        """Account for a new task"""
+        completed = status == "completed"
+        await self._apply(
+            user_id,
+            total=1,
+            completed=int(completed),
+            completed_on=datetime.utcnow().date() if completed else None,
+            project_deltas={project_id: 1} if project_id and _is_open(status) else {},
+        )
+
+    async def task_changed(
+        self,
+        user_id: UUID,
+        old_status: str,
+        old_project_id: Optional[UUID],
+        new_status: str,
+        new_project_id: Optional[UUID],
+    ) -> None:
+        """Account for a status and/or project change of an existing task"""
+        was_completed = old_status == "completed"
+        is_completed = new_status == "completed"
+
+        project_deltas: Dict[UUID, int] = defaultdict(int)
+        if old_project_id and _is_open(old_status):
+            project_deltas[old_project_id] -= 1
+        if new_project_id and _is_open(new_status):
+            project_deltas[new_project_id] += 1
+
+        await self._apply(
+            user_id,
+            completed=int(is_completed) - int(was_completed),
+            completed_on=datetime.utcnow().date() if is_completed and not was_completed else None,
+            project_deltas=project_deltas,
+        )
+
+    async def task_deleted(self, user_id: UUID, status: str, project_id: Optional[UUID]) -> None:
+        """Account for a deleted task"""
+        await self._apply(
+            user_id,
+            total=-1,
+            completed=-int(status == "completed"),
+            project_deltas={project_id: -1} if project_id and _is_open(status) else {},
+        )
+
+    async def _apply(
+        self,
+        user_id: UUID,
+        total: int = 0,
+        completed: int = 0,
+        completed_on: Optional[date] = None,
+        project_deltas: Optional[Dict[UUID, int]] = None,
+    ) -> None:
+        # Projects crossing between zero and non-zero open tasks change active_projects
+        active_delta = 0
+        for project_id, delta in (project_deltas or {}).items():
+            if delta == 0:
+                continue
+            stmt = self._insert(UserProjectStatistics).values(
+                user_id=user_id, project_id=project_id, open_tasks=delta,
+            )
+            open_tasks = await self.db.scalar(
+                stmt.on_conflict_do_update(
+                    index_elements=[UserProjectStatistics.user_id, UserProjectStatistics.project_id],
+                    set_={"open_tasks": UserProjectStatistics.open_tasks + delta},
+                ).returning(UserProjectStatistics.open_tasks)
+            )
+            if delta > 0 and open_tasks == delta:
+                active_delta += 1
+            elif delta < 0 and open_tasks == 0:
+                active_delta -= 1
+
+        if not (total or completed or completed_on or active_delta):
+            return
+
+        stmt = self._insert(UserStatistics).values(
+            user_id=user_id,
+            total_tasks=total,
+            completed_tasks=completed,
+            active_projects=active_delta,
+            streak_days=1 if completed_on else 0,
+            last_completed_on=completed_on,
+        )
+        changes: Dict[str, Any] = {
+            "total_tasks": UserStatistics.total_tasks + total,
+            "completed_tasks": UserStatistics.completed_tasks + completed,
+            "active_projects": UserStatistics.active_projects + active_delta,
+            "updated_at": func.now(),
+        }
+        if completed_on:
+            # Right-hand sides see the old row, so both columns update consistently
+            changes["streak_days"] = case(
+                (UserStatistics.last_completed_on == completed_on, UserStatistics.streak_days),
+                (UserStatistics.last_completed_on == completed_on - timedelta(days=1), UserStatistics.streak_days + 1),
+                else_=1,
+            )
+            changes["last_completed_on"] = completed_on
+
+        await self.db.execute(
+            stmt.on_conflict_do_update(index_elements=[UserStatistics.user_id], set_=changes)
+        )
+
+    async def get_stats(self, user_id: UUID) -> UserStats:
+        """Dashboard statistics from a single primary-key read"""
+        row = await self.db.get(UserStatistics, user_id)
+        if row is None:
+            return UserStats()
+
+        completion_rate = row.completed_tasks / row.total_tasks if row.total_tasks > 0 else 0.0
+        streak_days = _current_streak(row.streak_days, row.last_completed_on, datetime.utcnow().date())
+
+        return UserStats(
+            total_tasks=row.total_tasks,
+            completed_tasks=row.completed_tasks,
+            active_projects=row.active_projects,
+            completion_rate=round(completion_rate, 4),
+            streak_days=streak_days,
+            productivity_score=productivity_score(completion_rate, streak_days),
+        )
+
+    async def rebuild(self, chunk_size: Optional[int] = None) -> int:
+        """
+        Recompute every user's rollups from tasks, one chunk of users at a time
+
+        Each chunk costs three grouped aggregates over the chunk's tasks and
+        is written in its own transaction. The chunk's user_stats rows are
+        locked first, so task writes racing with the rebuild block and then
+        apply their delta on top of the rebuilt values.
+        """
+        chunk_size = chunk_size or settings.USER_STATS_REBUILD_CHUNK_SIZE
+        rebuilt = 0
+        last_id = None
+
+        while True:
+            stmt = select(User.id).order_by(User.id).limit(chunk_size)
+            if last_id is not None:
+                stmt = stmt.where(User.id > last_id)
+            user_ids = list(await self.db.scalars(stmt))
+            if not user_ids:
+                break
+
+            await self._rebuild_chunk(user_ids)
+            rebuilt += len(user_ids)
+            last_id = user_ids[-1]
+
+        return rebuilt
+
+    async def _rebuild_chunk(self, user_ids: List[UUID]) -> None:
+        await self.db.execute(
+            select(UserStatistics.user_id)
+            .where(UserStatistics.user_id.in_(user_ids))
+            .with_for_update()
+        )
+
+        counts = {
+            user_id: (total, completed or 0)
+            for user_id, total, completed in await self.db.execute(
+                select(
+                    Task.user_id,
+                    func.count(),
+                    func.sum(case((Task.status == "completed", 1), else_=0)),
+                )
+                .where(Task.user_id.in_(user_ids))
+                .group_by(Task.user_id)
+            )
+        }
+
+        open_by_project = (
+            await self.db.execute(
+                select(Task.user_id, Task.project_id, func.count())
+                .where(
+                    Task.user_id.in_(user_ids),
+                    Task.project_id.is_not(None),
+                    Task.status.in_(OPEN_TASK_STATUSES),
+                )
+                .group_by(Task.user_id, Task.project_id)
+            )
+        ).all()
+
+        completion_day = func.date(Task.completed_at)
+        completion_days: Dict[UUID, List[date]] = defaultdict(list)
+        for user_id, day in await self.db.execute(
+            select(Task.user_id, completion_day)
+            .where(
+                Task.user_id.in_(user_ids),
+                Task.status == "completed",
+                Task.completed_at.is_not(None),
+            )
+            .distinct()
+            .order_by(Task.user_id, completion_day.desc())
+        ):
+            # SQLite returns date() as text
+            completion_days[user_id].append(date.fromisoformat(day) if isinstance(day, str) else day)
+
+        active_projects: Dict[UUID, int] = defaultdict(int)
+        for user_id, _, _ in open_by_project:
+            active_projects[user_id] += 1
+
+        stats_rows = []
+        for user_id in user_ids:
+            total, completed = counts.get(user_id, (0, 0))
+            days = completion_days.get(user_id, [])
+            streak = 0
+            for day in days:
+                if streak and day != days[0] - timedelta(days=streak):
+                    break
+                streak += 1
+            stats_rows.append({
+                "user_id": user_id,
+                "total_tasks": total,
+                "completed_tasks": completed,
+                "active_projects": active_projects.get(user_id, 0),
+                "streak_days": streak,
+                "last_completed_on": days[0] if days else None,
+            })
+
+        stmt = self._insert(UserStatistics)
+        await self.db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[UserStatistics.user_id],
+                set_={
+                    "total_tasks": stmt.excluded.total_tasks,
+                    "completed_tasks": stmt.excluded.completed_tasks,
+                    "active_projects": stmt.excluded.active_projects,
+                    "streak_days": stmt.excluded.streak_days,
+                    "last_completed_on": stmt.excluded.last_completed_on,
+                    "updated_at": func.now(),
+                },
+            ),
+            stats_rows,
+        )
+
+        await self.db.execute(
+            delete(UserProjectStatistics).where(UserProjectStatistics.user_id.in_(user_ids))
+        )
+        if open_by_project:
+            await self.db.execute(
+                insert(UserProjectStatistics),
+                [
+                    {"user_id": user_id, "project_id": project_id, "open_tasks": open_tasks}
+                    for user_id, project_id, open_tasks in open_by_project
+                ],
+            )
+
+        await self.db.commit()
+
+
+class UserStatsRebuilder:
+    """Runs the rollup rebuild in the background, one run at a time"""
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+        self.last_started_at: Optional[datetime] = None
+        self.last_duration_seconds: Optional[float] = None
+        self.last_users_rebuilt = 0
+        self.last_error: Optional[str] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> bool:
+        """Start a rebuild; returns False if one is already running"""
+        if self.running:
+            return False
+        self._task = asyncio.create_task(self._run())
+        return True
+
+    async def _run(self) -> None:
+        self.last_started_at = datetime.utcnow()
+        started = time.perf_counter()
+        self.last_error = None
+
+        try:
+            async with AsyncSessionLocal() as db:
+                self.last_users_rebuilt = await AsyncUserStatsService(db).rebuild()
+        except Exception as e:
+            self.last_error = str(e)
+            logger.error("user_stats_rebuild_failed", error=str(e))
+            return
+        finally:
+            self.last_duration_seconds = round(time.perf_counter() - started, 3)
+
+        logger.info(
+            "user_stats_rebuilt",
+            users=self.last_users_rebuilt,
+            duration_seconds=self.last_duration_seconds,
+        )
+
+    def metrics(self) -> Dict[str, Any]:
+        """Snapshot of rebuild state for monitoring"""
+        return {
+            "running": self.running,
+            "last_started_at": self.last_started_at.isoformat() if self.last_started_at else None,
+            "last_duration_seconds": self.last_duration_seconds,
+            "last_users_rebuilt": self.last_users_rebuilt,
+            "last_error": self.last_error,
+        }
+
+
+# Global user stats rebuild runner
+user_stats_rebuilder = UserStatsRebuilder()
@@ -0,0 +1,404 @@
+"""
+TaskFlow AI - Weekly Digest Service
+
+Following Backend Template Epic 4: Advanced Business Logic
+- Weekly task digest for users with weekly_digest and email_notifications on
+- Users streamed in chunks; task aggregates computed per chunk, not per user
+- Rendering in a process pool; emails queued in the outbox with a resumable checkpoint
+"""
+
+import asyncio
+import html
+import time
+import uuid
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, time as dt_time, timedelta, timezone
+from string import Template
+from typing import Any, AsyncIterator, Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import and_, case, func, insert, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+import structlog
+
+from app.core.config import settings
+from app.db.database import AsyncSessionLocal, get_async_engine
+from app.jobs.queue import job_queue
+from app.models.digest import DigestRun
+from app.models.email import OutboundEmail
+from app.models.task import Task
+from app.models.user import User
+from app.services.user_stats import OPEN_TASK_STATUSES
+
+logger = structlog.get_logger(__name__)
+
+DIGEST_SUBJECT = Template("Your TaskFlow AI week: $completed done, $open open")
+
+DIGEST_TEXT = Template(
+    "Hi $name,\n\n"
+    "Here is your week of $period in TaskFlow AI:\n\n"
+    "- Completed: $completed\n"
+    "- Created: $created\n"
+    "- Open: $open ($overdue overdue)\n"
+    "- Due in the next 7 days: $due_soon\n"
+    "$upcoming\n"
+    "Manage digest emails in your settings: $settings_url\n"
+)
+
+DIGEST_HTML = Template(
+    "<p>Hi $name,</p>"
+    "<p>Here is your week of $period in TaskFlow AI:</p>"
+    "<ul><li>Completed: <b>$completed</b></li><li>Created: $created</li>"
+    "<li>Open: $open ($overdue overdue)</li><li>Due in the next 7 days: $due_soon</li></ul>"
+    "$upcoming"
+    "<p><a href=\"$settings_url\">Manage digest emails</a></p>"
+)
+
+
+def digest_period(today: Optional[date] = None) -> date:
+    """Monday of the last complete week (UTC)"""
+    today = today or datetime.now(timezone.utc).date()
+    return today - timedelta(days=today.weekday() + 7)
+
+
+def wants_digest(preferences: Optional[Dict[str, Any]]) -> bool:
+    """Both preferences default to on, matching the UserPreferences schema"""
+    preferences = preferences or {}
+    return bool(preferences.get("weekly_digest", True)) and bool(preferences.get("email_notifications", True))
+
+
+def render_digests(entries: List[Dict[str, Any]], period: str, settings_url: str) -> List[Dict[str, Any]]:
+    """
+    Render digest entries into email_outbox rows
+
+    Runs in a worker process, so it only takes and returns plain data.
+    """
+    rows = []
+    for entry in entries:
+        values = {
+            "name": entry["first_name"] or "there",
+            "period": period,
+            "settings_url": settings_url,
+            "completed": entry["completed"],
+            "created": entry["created"],
+            "open": entry["open"],
+            "overdue": entry["overdue"],
+            "due_soon": entry["due_soon"],
+        }
+
+        upcoming = entry["upcoming"]
+        text_upcoming = html_upcoming = ""
+        if upcoming:
+            text_upcoming = "\nComing up:\n" + "".join(
+                f"- {title} ({due:%a %d %b})\n" for title, due in upcoming
+            )
+            html_upcoming = "<p>Coming up:</p><ul>" + "".join(
+                f"<li>{html.escape(title)} ({due:%a %d %b})</li>" for title, due in upcoming
+            ) + "</ul>"
+
+        rows.append({
+            "id": uuid.uuid4(),
+            "to_address": entry["email"],
+            "subject": DIGEST_SUBJECT.substitute(values),
+            "body_text": DIGEST_TEXT.substitute(values, upcoming=text_upcoming),
+            "body_html": DIGEST_HTML.substitute({**values, "name": html.escape(values["name"])}, upcoming=html_upcoming),
+            "kind": "weekly_digest",
+        })
+    return rows
+
+
+class WeeklyDigestService:
+    """
+    Queues one digest email per opted-in user for a week
+
+    Users are read in id order (a server-side cursor on PostgreSQL) and
+    handled chunk_size at a time: two grouped queries cover the chunk's tasks,
+    rendering is split across the process pool, and the chunk's emails
+    are inserted together with the advanced checkpoint in one transaction.
+    Memory is bounded by one chunk, and a restarted run resumes after the
+    last committed chunk. The checkpoint advance is a compare-and-set, so
+    a second runner for the same week stops instead of sending twice.
+    """
+
+    def __init__(self, chunk_size: int, render_workers: int, max_listed: int = 5):
+        self.chunk_size = max(1, chunk_size)
+        self.render_workers = max(0, render_workers)
+        self.max_listed = max_listed
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _insert(self, model):
+        if get_async_engine().dialect.name == "postgresql":
+            return postgresql.insert(model)
+        return sqlite.insert(model)
+
+    async def _checkpoint(self, period_start: date) -> DigestRun:
+        async with AsyncSessionLocal() as db:
+            await db.execute(
+                self._insert(DigestRun)
+                .values(period_start=period_start)
+                .on_conflict_do_nothing(index_elements=[DigestRun.period_start])
+            )
+            await db.commit()
+            return await db.get(DigestRun, period_start)
+
+    async def run(self, period_start: Optional[date] = None) -> Dict[str, Any]:
+        """Generate (or resume) the digest for the week starting period_start"""
+        period_start = period_start or digest_period()
+        run = await self._checkpoint(period_start)
+        summary = {
+            "period_start": period_start.isoformat(),
+            "users_scanned": run.users_scanned,
+            "emails_queued": run.emails_queued,
+            "resumed": run.last_user_id is not None,
+        }
+        if run.status == "completed":
+            summary["status"] = "completed"
+            return summary
+
+        period_from = datetime.combine(period_start, dt_time.min, tzinfo=timezone.utc)
+        period_to = period_from + timedelta(days=7)
+        period_label = f"{period_start:%d %b} - {period_to.date() - timedelta(days=1):%d %b %Y}"
+
+        cursor = run.last_user_id
+        status = "completed"
+        try:
+            async for chunk in self._user_chunks(cursor):
+                last_id = chunk[-1].id
+                recipients = [row for row in chunk if wants_digest(row.preferences)]
+
+                entries = await self._aggregate(recipients, period_from, period_to)
+                rows = await self._render(entries, period_label)
+                if not await self._commit_chunk(period_start, cursor, last_id, len(chunk), rows):
+                    status = "superseded"
+                    logger.warning("weekly_digest_superseded", period_start=period_start.isoformat())
+                    break
+
+                cursor = last_id
+                summary["users_scanned"] += len(chunk)
+                summary["emails_queued"] += len(rows)
+                if rows:
+                    job_queue.enqueue("email.deliver_outbox", key="email.deliver_outbox")
+        finally:
+            self._shutdown_executor()
+
+        if status == "completed":
+            async with AsyncSessionLocal() as db:
+                await db.execute(
+                    update(DigestRun)
+                    .where(DigestRun.period_start == period_start)
+                    .values(status="completed", completed_at=func.now())
+                )
+                await db.commit()
+
+        summary["status"] = status
+        return summary
+
+    async def _user_chunks(self, after: Optional[UUID]) -> AsyncIterator[List[Any]]:
+        """
+        Active users in id order after the checkpoint, chunk_size at a time
+
+        PostgreSQL reads them through one server-side cursor. SQLite cannot
+        commit the chunk writes while a read cursor is open on the same
+        file, so there each chunk is its own keyset query.
+        """
+        users = (
+            select(User.id, User.email, User.first_name, User.preferences)
+            .where(User.is_active.is_(True))
+            .order_by(User.id)
+        )
+
+        if get_async_engine().dialect.name == "postgresql":
+            if after is not None:
+                users = users.where(User.id > after)
+            async with AsyncSessionLocal() as db:
+                result = await db.stream(users.execution_options(yield_per=self.chunk_size))
+                async for chunk in result.partitions(self.chunk_size):
+                    yield chunk
+            return
+
+        while True:
+            page = users.limit(self.chunk_size)
+            if after is not None:
+                page = page.where(User.id > after)
+            async with AsyncSessionLocal() as db:
+                chunk = (await db.execute(page)).all()
+            if not chunk:
+                return
+            yield chunk
+            after = chunk[-1].id
+
+    async def _aggregate(
+        self, recipients: List[Any], period_from: datetime, period_to: datetime
+    ) -> List[Dict[str, Any]]:
+        """Digest figures for a chunk of users with two grouped queries"""
+        if not recipients:
+            return []
+        user_ids = [row.id for row in recipients]
+        is_open = Task.status.in_(OPEN_TASK_STATUSES)
+        soon = period_to + timedelta(days=7)
+
+        async with AsyncSessionLocal() as db:
+            counts = {
+                user_id: (completed or 0, created or 0, open_ or 0, overdue or 0, due_soon or 0)
+                for user_id, completed, created, open_, overdue, due_soon in await db.execute(
+                    select(
+                        Task.user_id,
+                        func.sum(case((and_(
+                            Task.status == "completed",
+                            Task.completed_at >= period_from,
+                            Task.completed_at < period_to,
+                        ), 1), else_=0)),
+                        func.sum(case((and_(Task.created_at >= period_from, Task.created_at < period_to), 1), else_=0)),
+                        func.sum(case((is_open, 1), else_=0)),
+                        func.sum(case((and_(is_open, Task.due_date < period_to), 1), else_=0)),
+                        func.sum(case((and_(is_open, Task.due_date >= period_to, Task.due_date < soon), 1), else_=0)),
+                    )
+                    .where(Task.user_id.in_(user_ids))
+                    .group_by(Task.user_id)
+                )
+            }
+
+            # Earliest open tasks due before the end of next week, max_listed per user
+            rank = func.row_number().over(partition_by=Task.user_id, order_by=(Task.due_date, Task.id))
+            ranked = (
+                select(Task.user_id, Task.title, Task.due_date, rank.label("rank"))
+                .where(Task.user_id.in_(user_ids), is_open, Task.due_date < soon)
+                .subquery()
+            )
+            upcoming: Dict[UUID, List[tuple]] = defaultdict(list)
+            for user_id, title, due_date in await db.execute(
+                select(ranked.c.user_id, ranked.c.title, ranked.c.due_date)
+                .where(ranked.c.rank <= self.max_listed)
+                .order_by(ranked.c.user_id, ranked.c.rank)
+            ):
+                upcoming[user_id].append((title, due_date))
+
+        entries = []
+        for row in recipients:
+            completed, created, open_, overdue, due_soon = counts.get(row.id, (0, 0, 0, 0, 0))
+            if not (completed or created or open_):
+                continue  # nothing to report
+            entries.append({
+                "email": row.email,
+                "first_name": row.first_name,
+                "completed": completed,
+                "created": created,
+                "open": open_,
+                "overdue": overdue,
+                "due_soon": due_soon,
+                "upcoming": upcoming.get(row.id, []),
+            })
+        return entries
+
+    async def _render(self, entries: List[Dict[str, Any]], period_label: str) -> List[Dict[str, Any]]:
+        settings_url = f"{settings.FRONTEND_URL}/settings/notifications"
+        if not entries:
+            return []
+        if self.render_workers == 0:
+            return render_digests(entries, period_label, settings_url)
+
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.render_workers)
+        loop = asyncio.get_running_loop()
+        lanes = min(self.render_workers, len(entries))
+        parts = await asyncio.gather(*(
+            loop.run_in_executor(self._executor, render_digests, entries[i::lanes], period_label, settings_url)
+            for i in range(lanes)
+        ))
+        return [row for part in parts for row in part]
+
+    async def _commit_chunk(
+        self,
+        period_start: date,
+        cursor: Optional[UUID],
+        last_id: UUID,
+        scanned: int,
+        rows: List[Dict[str, Any]],
+    ) -> bool:
+        """Queue a chunk's emails and advance the checkpoint atomically; False if another run moved it"""
+        async with AsyncSessionLocal() as db:
+            advanced = await db.execute(
+                update(DigestRun)
+                .where(
+                    DigestRun.period_start == period_start,
+                    DigestRun.last_user_id.is_not_distinct_from(cursor),
+                )
+                .values(
+                    last_user_id=last_id,
+                    users_scanned=DigestRun.users_scanned + scanned,
+                    emails_queued=DigestRun.emails_queued + len(rows),
+                )
+            )
+            if advanced.rowcount != 1:
+                await db.rollback()
+                return False
+
+            if rows:
+                now = datetime.now(timezone.utc)
+                await db.execute(insert(OutboundEmail), [{**row, "next_attempt_at": now} for row in rows])
+            await db.commit()
+        return True
+
+    def _shutdown_executor(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+class WeeklyDigestRunner:
+    """Runs the weekly digest in the background, one run at a time"""
+
+    def __init__(self, service: WeeklyDigestService):
+        self.service = service
+        self._task: Optional[asyncio.Task] = None
+        self.last_started_at: Optional[datetime] = None
+        self.last_duration_seconds: Optional[float] = None
+        self.last_summary: Optional[Dict[str, Any]] = None
+        self.last_error: Optional[str] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self, period_start: Optional[date] = None) -> bool:
+        """Start (or resume) a digest run; returns False if one is already running"""
+        if self.running:
+            return False
+        self._task = asyncio.create_task(self._run(period_start))
+        return True
+
+    async def _run(self, period_start: Optional[date]) -> None:
+        self.last_started_at = datetime.utcnow()
+        started = time.perf_counter()
+        self.last_error = None
+
+        try:
+            self.last_summary = await self.service.run(period_start)
+        except Exception as e:
+            self.last_error = str(e)
+            logger.error("weekly_digest_failed", error=str(e))
+            return
+        finally:
+            self.last_duration_seconds = round(time.perf_counter() - started, 3)
+
+        logger.info("weekly_digest_completed", duration_seconds=self.last_duration_seconds, **self.last_summary)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Snapshot of digest run state for monitoring"""
+        return {
+            "running": self.running,
+            "last_started_at": self.last_started_at.isoformat() if self.last_started_at else None,
+            "last_duration_seconds": self.last_duration_seconds,
+            "last_summary": self.last_summary,
+            "last_error": self.last_error,
+        }
+
+
+# Global weekly digest runner
+weekly_digest_runner = WeeklyDigestRunner(
+    WeeklyDigestService(
+        chunk_size=settings.DIGEST_CHUNK_SIZE,
+        render_workers=settings.DIGEST_RENDER_WORKERS,
+    )
+)
@@ -0,0 +1,33 @@
+"""
+TaskFlow AI - Pagination Utilities
+
+Following Backend Template Epic 2: Core API Framework
+- Opaque keyset cursors
+"""
+
+import base64
+import json
+from typing import Any, Dict
+
+
+class InvalidCursor(ValueError):
+    """Raised when a client sends a cursor that was not issued for this listing"""
+
+
+def encode_cursor(position: Dict[str, Any]) -> str:
+    """Encode a keyset position as an opaque URL-safe token"""
+    raw = json.dumps(position, separators=(",", ":"), default=str).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """Decode a cursor produced by encode_cursor"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        position = json.loads(raw)
+    except (ValueError, TypeError):
+        raise InvalidCursor("Invalid cursor")
+
+    if not isinstance(position, dict):
+        raise InvalidCursor("Invalid cursor")
+    return position
@@ -0,0 +1,135 @@
+"""
+TaskFlow AI - LLM Dispatcher Benchmark
+
+Drives the LLM dispatcher against the local stand-in provider with
+simulated latency and reports its queueing metrics: peak concurrency seen
+by the provider, queue wait, coalesced requests, batched classification
+calls and queue timeouts.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_llm_dispatcher [--users 50] [--requests 4] [--latency-ms 50]
+
+No network or API key is needed.
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key-benchmark-secret-key")
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")  # settings require one; unused
+os.environ.setdefault("LLM_PROVIDER", "local")
+os.environ.setdefault("LLM_CACHE_BACKEND", "none")
+
+from app.ai.llm_client import LocalLLMBackend  # noqa: E402
+from app.ai.llm_dispatcher import LLMDispatcher, LLMQueueTimeout  # noqa: E402
+
+MODEL = "bench-model"
+
+
+def dispatcher(latency: float, max_concurrency: int = 8, per_user: int = 2, queue_timeout: float = 30.0):
+    return LLMDispatcher(
+        backend=LocalLLMBackend(latency=latency),
+        max_concurrency=max_concurrency,
+        per_user_concurrency=per_user,
+        queue_timeout=queue_timeout,
+        batch_window=0.02,
+        max_batch_size=16,
+    )
+
+
+def report(title: str, d: LLMDispatcher, elapsed: float) -> None:
+    m = d.metrics()
+    print(f"\n{title}  ({elapsed * 1000:.0f} ms wall)")
+    print(f"  provider calls {d.backend.calls}, provider peak concurrency {d.backend.peak_active} "
+          f"(limit {d.max_concurrency})")
+    print(f"  queue wait p50 {m['wait_ms_p50']} ms, p95 {m['wait_ms_p95']} ms")
+    print(f"  coalesced {m['coalesced']}, batches {m['batches']} ({m['batched_items']} items), "
+          f"batch fallbacks {m['batch_fallbacks']}, rejected {m['rejected']}")
+
+
+async def burst(users: int, per_user_requests: int, latency: float) -> None:
+    """Distinct prompts from many users at once"""
+    d = dispatcher(latency)
+    started = time.perf_counter()
+    await asyncio.gather(*(
+        d.complete(MODEL, [{"role": "user", "content": f"user {u} request {r}"}], user_id=u)
+        for u in range(users)
+        for r in range(per_user_requests)
+    ))
+    report(f"burst: {users} users x {per_user_requests} distinct requests", d, time.perf_counter() - started)
+
+
+async def hot_user(latency: float) -> None:
+    """One user flooding requests next to a light user"""
+    d = dispatcher(latency)
+    started = time.perf_counter()
+    light_done = []
+
+    async def light():
+        await d.complete(MODEL, [{"role": "user", "content": "light user"}], user_id="light")
+        light_done.append(time.perf_counter() - started)
+
+    await asyncio.gather(
+        *(d.complete(MODEL, [{"role": "user", "content": f"hot {i}"}], user_id="hot") for i in range(40)),
+        light(),
+    )
+    report("hot user: 40 requests from one user, 1 from another", d, time.perf_counter() - started)
+    print(f"  light user answered after {light_done[0] * 1000:.0f} ms")
+
+
+async def coalescing(copies: int, latency: float) -> None:
+    """The same prompt requested concurrently"""
+    d = dispatcher(latency)
+    started = time.perf_counter()
+    await asyncio.gather(*(
+        d.complete(MODEL, [{"role": "user", "content": "same prompt"}], user_id=i) for i in range(copies)
+    ))
+    report(f"coalescing: {copies} identical requests", d, time.perf_counter() - started)
+
+
+async def batching(items: int, latency: float) -> None:
+    """Short classification prompts"""
+    d = dispatcher(latency)
+    started = time.perf_counter()
+    await asyncio.gather(*(
+        d.classify(MODEL, "Label the task as work or personal.", f"task number {i}", user_id=i % 8)
+        for i in range(items)
+    ))
+    report(f"batching: {items} classification prompts", d, time.perf_counter() - started)
+
+
+async def saturation(latency: float) -> None:
+    """More demand than slots with a short queue timeout"""
+    d = dispatcher(latency, max_concurrency=2, queue_timeout=latency / 2)
+    started = time.perf_counter()
+    results = await asyncio.gather(*(
+        d.complete(MODEL, [{"role": "user", "content": f"request {i}"}], user_id=i) for i in range(10)
+    ), return_exceptions=True)
+    report("saturation: 10 requests, 2 slots, queue timeout latency/2", d, time.perf_counter() - started)
+    print(f"  LLMQueueTimeout raised {sum(isinstance(r, LLMQueueTimeout) for r in results)} times")
+
+
+async def run(users: int, per_user_requests: int, latency: float) -> None:
+    await burst(users, per_user_requests, latency)
+    await hot_user(latency)
+    await coalescing(100, latency)
+    await batching(64, latency)
+    await saturation(latency)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=4)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    args = parser.parse_args()
+    asyncio.run(run(args.users, args.requests, args.latency_ms / 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+TaskFlow AI - Login Attempt Partitioning Benchmark
+
+Grows login_attempts step by step (attempts spread over --days of history)
+and times the two lockout queries at each size: the window replay run by
+LockoutEngine.rebuild() and a per-email failure count. On PostgreSQL the
+table is range-partitioned by attempted_at and the number of partitions
+each query touches is read from EXPLAIN; both should stay flat as the
+table grows.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_login_partitions [--sizes 10000,100000,300000] [--days 90]
+
+Defaults to a throwaway SQLite file (a plain, unpartitioned table); set
+DATABASE_URL to a scratch PostgreSQL database to measure partition pruning.
+The tables are dropped and recreated.
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import re
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+_tmp_db = os.path.join(tempfile.mkdtemp(prefix="taskflow-bench-"), "bench.db")
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key-benchmark-secret-key")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{_tmp_db}")
+os.environ.setdefault("DEBUG", "false")  # no SQL echo
+
+from sqlalchemy import func, insert, select, text  # noqa: E402
+
+from app.db.database import AsyncSessionLocal, Base, async_engine  # noqa: E402
+from app.models.user import LoginAttempt, login_attempt_partitions  # noqa: E402
+from app.services.lockout import lockout_engine  # noqa: E402
+
+INSERT_CHUNK = 10000
+
+
+def window_query(cutoff: datetime):
+    """The LockoutEngine.rebuild() replay query"""
+    return (
+        select(LoginAttempt.email, LoginAttempt.ip_address, LoginAttempt.success, LoginAttempt.attempted_at)
+        .where(LoginAttempt.attempted_at >= cutoff)
+        .order_by(LoginAttempt.attempted_at)
+    )
+
+
+def failures_query(email: str, cutoff: datetime):
+    """Failed attempts for one email inside the lockout window"""
+    return select(func.count()).select_from(LoginAttempt).where(
+        LoginAttempt.email == email,
+        LoginAttempt.success.is_(False),
+        LoginAttempt.attempted_at >= cutoff,
+    )
+
+
+async def grow(target: int, current: int, now: datetime, days: int, emails: int) -> None:
+    """Insert attempts until the table holds target rows"""
+    span = days * 86400
+    while current < target:
+        batch = min(INSERT_CHUNK, target - current)
+        rows = [
+            {
+                "id": uuid.uuid4(),
+                "email": f"user{random.randrange(emails)}@example.com",
+                "ip_address": f"10.0.{random.randrange(256)}.{random.randrange(256)}",
+                "success": random.random() < 0.8,
+                "failure_reason": None,
+                "attempted_at": now - timedelta(seconds=random.uniform(0, span)),
+            }
+            for _ in range(batch)
+        ]
+        async with AsyncSessionLocal() as db:
+            await db.execute(insert(LoginAttempt), rows)
+            await db.commit()
+        current += batch
+
+
+async def partitions_scanned(stmt) -> str:
+    """Partitions named in the plan of stmt (PostgreSQL only)"""
+    if not await login_attempt_partitions.enabled():
+        return "-"
+    compiled = stmt.compile(async_engine.sync_engine, compile_kwargs={"literal_binds": True})
+    async with async_engine.connect() as conn:
+        plan = (await conn.execute(text(f"EXPLAIN {compiled}"))).scalars().all()
+    scanned = re.compile(rf"Scan(?: Backward)?(?: using \S+)? on ({login_attempt_partitions.table}_\w+)")
+    return str(len({match[1] for line in plan if "Bitmap Index Scan" not in line for match in scanned.finditer(line)}))
+
+
+async def time_query(make_stmt, iterations: int):
+    timings = []
+    for i in range(iterations):
+        stmt = make_stmt(i)
+        async with AsyncSessionLocal() as db:
+            started = time.perf_counter()
+            (await db.execute(stmt)).all()
+            timings.append((time.perf_counter() - started) * 1000)
+    p95 = statistics.quantiles(timings, n=20)[18] if len(timings) >= 20 else max(timings)
+    return statistics.median(timings), p95
+
+
+async def run(sizes, days: int, emails: int, iterations: int) -> None:
+    now = datetime.now(timezone.utc)
+    cutoff = now - timedelta(seconds=lockout_engine.window_seconds)
+
+    async with async_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    # Partitions for the whole generated history, not just the coming weeks
+    created = await login_attempt_partitions.ensure(now, since=now - timedelta(days=days))
+    partitioned = await login_attempt_partitions.enabled()
+
+    print(f"dialect: {async_engine.dialect.name}, partitions: "
+          f"{len(created) if partitioned else 'none (plain table)'}, "
+          f"lockout window: {lockout_engine.window_seconds}s, history: {days} days\n")
+    print(f"{'rows':>10} {'query':18} {'partitions':>10} {'p50 ms':>8} {'p95 ms':>8}")
+
+    current = 0
+    for size in sizes:
+        await grow(size, current, now, days, emails)
+        current = size
+        if partitioned:
+            async with async_engine.begin() as conn:
+                await conn.execute(text(f"ANALYZE {login_attempt_partitions.table}"))
+
+        cases = [
+            ("lockout window", lambda i: window_query(cutoff)),
+            ("email failures", lambda i: failures_query(f"user{i % emails}@example.com", cutoff)),
+        ]
+        for name, make_stmt in cases:
+            scanned = await partitions_scanned(make_stmt(0))
+            p50, p95 = await time_query(make_stmt, iterations)
+            print(f"{size:>10} {name:18} {scanned:>10} {p50:8.3f} {p95:8.3f}")
+
+    await async_engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="10000,100000,300000", help="Comma-separated table sizes")
+    parser.add_argument("--days", type=int, default=90, help="Days of history the attempts are spread over")
+    parser.add_argument("--emails", type=int, default=1000)
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+    sizes = sorted(int(size) for size in args.sizes.split(","))
+    asyncio.run(run(sizes, args.days, args.emails, args.iterations))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+TaskFlow AI - Mail Delivery Benchmark
+
+Runs the email outbox end to end against a local SMTP sink: request-path
+enqueue latency, then delivery throughput of the pooled worker next to
+one SMTP connection per message. The sink can delay its greeting to stand
+in for TCP + TLS handshake cost.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_mail_delivery [--emails 500] [--connect-delay-ms 50]
+
+Uses a throwaway SQLite file unless DATABASE_URL is set; the tables are
+dropped and recreated.
+"""
+
+import argparse
+import asyncio
+import os
+import smtplib
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+_tmp_db = os.path.join(tempfile.mkdtemp(prefix="taskflow-bench-"), "bench.db")
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key-benchmark-secret-key")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{_tmp_db}")
+os.environ.setdefault("DEBUG", "false")  # no SQL echo
+os.environ.setdefault("SMTP_HOST", "127.0.0.1")  # enables EmailService
+
+from sqlalchemy import func, select  # noqa: E402
+
+from app.db.database import AsyncSessionLocal, Base, async_engine  # noqa: E402
+from app.models.email import OutboundEmail  # noqa: E402
+from app.services.email_service import EmailService  # noqa: E402
+from app.services.mail_delivery import MailDeliveryWorker, SMTPConnectionPool  # noqa: E402
+
+
+class SMTPSink:
+    """Minimal SMTP server that accepts and counts every message"""
+
+    def __init__(self, connect_delay: float = 0.0):
+        self.connect_delay = connect_delay
+        self.connections = 0
+        self.messages = 0
+        self.server = None
+
+    async def start(self) -> int:
+        self.server = await asyncio.start_server(self._session, "127.0.0.1", 0)
+        return self.server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def _session(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        await asyncio.sleep(self.connect_delay)
+        writer.write(b"220 sink ESMTP\r\n")
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                command = line[:4].upper()
+                if command == b"EHLO":
+                    writer.write(b"250-sink\r\n250 8BITMIME\r\n")
+                elif command == b"DATA":
+                    writer.write(b"354 end with .\r\n")
+                    await writer.drain()
+                    await reader.readuntil(b"\r\n.\r\n")
+                    self.messages += 1
+                    writer.write(b"250 queued\r\n")
+                elif command == b"QUIT":
+                    writer.write(b"221 bye\r\n")
+                    break
+                else:  # HELO, MAIL, RCPT, RSET, NOOP
+                    writer.write(b"250 ok\r\n")
+                await writer.drain()
+        finally:
+            writer.close()
+
+
+async def reset_outbox() -> None:
+    async with async_engine.begin() as conn:
+        await conn.run_sync(lambda c: OutboundEmail.__table__.drop(c, checkfirst=True))
+        await conn.run_sync(lambda c: Base.metadata.create_all(c, tables=[OutboundEmail.__table__]))
+
+
+async def enqueue(count: int) -> list:
+    service = EmailService()
+    timings = []
+    for i in range(count):
+        started = time.perf_counter()
+        await service.enqueue(f"user{i}@example.com", "Benchmark", f"Message {i}\n", kind="benchmark")
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+async def run(count: int, connect_delay: float, pool_size: int) -> None:
+    sink = SMTPSink(connect_delay)
+    port = await sink.start()
+
+    await reset_outbox()
+    timings = await enqueue(count)
+    p95 = statistics.quantiles(timings, n=20)[18]
+    print(f"enqueue (request path): p50 {statistics.median(timings):.3f} ms, p95 {p95:.3f} ms\n")
+
+    worker = MailDeliveryWorker(
+        pool=SMTPConnectionPool("127.0.0.1", port, use_tls=False, size=pool_size),
+        from_address="bench@example.com",
+        batch_size=100,
+        poll_interval=1.0,
+        max_attempts=3,
+        retry_base=1.0,
+        retry_max=10.0,
+    )
+    started = time.perf_counter()
+    while await worker.deliver_due():
+        pass
+    pooled = time.perf_counter() - started
+    async with AsyncSessionLocal() as db:
+        sent = await db.scalar(select(func.count()).where(OutboundEmail.status == "sent"))
+    worker.pool.close()
+    print(f"pooled worker ({pool_size} connections): {sent} sent in {pooled * 1000:.0f} ms "
+          f"({sent / pooled:.0f}/s), {sink.connections} SMTP connections")
+
+    # Baseline: connect (and greet) for every message
+    connections_before, messages_before = sink.connections, sink.messages
+
+    def send_one(i: int) -> None:
+        with smtplib.SMTP("127.0.0.1", port) as conn:
+            conn.sendmail("bench@example.com", [f"user{i}@example.com"], f"Subject: Benchmark\r\n\r\nMessage {i}\r\n")
+
+    started = time.perf_counter()
+    baseline_count = min(count, 200)
+    for i in range(0, baseline_count, pool_size):
+        await asyncio.gather(*(asyncio.to_thread(send_one, j) for j in range(i, min(i + pool_size, baseline_count))))
+    baseline = time.perf_counter() - started
+    print(f"connection per message ({pool_size} in parallel): {sink.messages - messages_before} sent in "
+          f"{baseline * 1000:.0f} ms ({baseline_count / baseline:.0f}/s), "
+          f"{sink.connections - connections_before} SMTP connections")
+
+    await sink.stop()
+    await async_engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--emails", type=int, default=500)
+    parser.add_argument("--connect-delay-ms", type=float, default=50.0)
+    parser.add_argument("--pool-size", type=int, default=4)
+    args = parser.parse_args()
+    asyncio.run(run(args.emails, args.connect_delay_ms / 1000, args.pool_size))
+
+
+if __name__ == "__main__":
+    main()
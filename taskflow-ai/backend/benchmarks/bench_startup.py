@@ -0,0 +1,139 @@
+"""
+TaskFlow AI - Startup Import Profile and Budget
+
+Imports the API entry point in fresh interpreters and reports what that
+costs: the median wall time of the import, the modules with the highest
+self and cumulative import time (from python -X importtime) and the self
+time per package. Also checks that heavy optional dependencies (NumPy, the
+OpenAI client, tiktoken, Celery, database drivers) are not loaded and no
+SQLAlchemy engine is created by the import; both happen on first use.
+tests/test_startup_budget.py runs the same checks under pytest.
+
+Exits non-zero when the median import time exceeds --budget-ms or a
+deferred module was loaded, so CI can run it as a check.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_startup [--module main] [--runs 5] [--top 15] [--budget-ms 2000]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, List, Sequence, Tuple
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Must stay out of a plain import of the API; each is imported where it is used
+DEFERRED_MODULES = ("numpy", "openai", "tiktoken", "celery", "redis", "asyncpg", "psycopg2", "aiosqlite")
+
+# Engines app.db.database creates on first use, reported like deferred modules
+DEFERRED_ENGINES = ("_engine", "_async_engine")
+
+DEFAULT_BUDGET_MS = 2000.0
+
+_PROBE = """
+import sys, time
+started = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - started
+print(elapsed)
+database = sys.modules.get("app.db.database")
+engines = [f"app.db.database.{{name}}" for name in {engines!r} if getattr(database, name, None) is not None]
+print(",".join([name for name in {deferred!r} if name in sys.modules] + engines))
+"""
+
+
+@dataclass
+class ImportTiming:
+    """One line of -X importtime output"""
+    module: str
+    self_us: int
+    cumulative_us: int
+
+
+def parse_importtime(stderr: str) -> List[ImportTiming]:
+    timings = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:"):].split("|")
+        timings.append(ImportTiming(module.strip(), int(self_us), int(cumulative_us)))
+    return timings
+
+
+def probe(module: str, profile: bool) -> Tuple[float, List[str], List[ImportTiming]]:
+    """Import module in a fresh interpreter; returns (seconds, deferred modules or engines loaded, timings)"""
+    env = dict(os.environ)
+    env.setdefault("SECRET_KEY", "benchmark-secret-key-benchmark-secret-key")
+    env.setdefault("DATABASE_URL", f"sqlite:///{os.path.join(tempfile.gettempdir(), 'taskflow-bench-startup.db')}")
+    env.setdefault("DEBUG", "false")
+    command = [sys.executable, *(["-X", "importtime"] if profile else []),
+               "-c", _PROBE.format(module=module, deferred=DEFERRED_MODULES, engines=DEFERRED_ENGINES)]
+    result = subprocess.run(command, cwd=BACKEND_DIR, env=env, capture_output=True, text=True)
+    if result.returncode != 0:
+        sys.exit(f"import {module} failed:\n{result.stderr}")
+
+    # Startup logging may print too; the probe's two lines come last
+    elapsed, loaded = result.stdout.splitlines()[-2:]
+    return float(elapsed), [name for name in loaded.split(",") if name], parse_importtime(result.stderr)
+
+
+def package_of(module: str) -> str:
+    """Top-level package; app modules are grouped one level deeper"""
+    parts = module.split(".")
+    return ".".join(parts[:2]) if parts[0] == "app" else parts[0]
+
+
+def print_table(title: str, rows: Sequence[Tuple[str, float]]) -> None:
+    print(f"\n{title}")
+    for name, ms in rows:
+        print(f"  {ms:9.1f} ms  {name}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default="main", help="Module to import (main, app.jobs.celery_app, ...)")
+    parser.add_argument("--runs", type=int, default=5, help="Timed imports; the budget applies to their median")
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    args = parser.parse_args()
+
+    _, loaded, timings = probe(args.module, profile=True)
+    runs = [probe(args.module, profile=False)[0] * 1000 for _ in range(max(1, args.runs))]
+    median = statistics.median(runs)
+
+    by_self = sorted(timings, key=lambda t: t.self_us, reverse=True)[:args.top]
+    print_table("slowest modules (self)", [(t.module, t.self_us / 1000) for t in by_self])
+
+    app_modules = [t for t in timings if t.module == "main" or t.module.startswith("app.")]
+    by_cumulative = sorted(app_modules, key=lambda t: t.cumulative_us, reverse=True)[:args.top]
+    print_table("slowest app modules (cumulative)", [(t.module, t.cumulative_us / 1000) for t in by_cumulative])
+
+    packages: Dict[str, int] = defaultdict(int)
+    for t in timings:
+        packages[package_of(t.module)] += t.self_us
+    by_package = sorted(packages.items(), key=lambda item: item[1], reverse=True)[:args.top]
+    print_table("self time per package", [(name, us / 1000) for name, us in by_package])
+
+    print(f"\nimport {args.module}: {len(timings)} modules, median {median:.1f} ms over {len(runs)} runs "
+          f"(min {min(runs):.1f}, max {max(runs):.1f}), budget {args.budget_ms:.0f} ms")
+
+    failures = []
+    if median > args.budget_ms:
+        failures.append(f"median import time {median:.1f} ms exceeds the {args.budget_ms:.0f} ms budget")
+    if loaded:
+        failures.append(f"deferred modules loaded at import: {', '.join(loaded)}")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    if failures:
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+TaskFlow AI - Task Parser Benchmark
+
+Measures local parser throughput and how much of a sample quick-add
+corpus would still be escalated to the LLM at the configured confidence
+threshold.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_task_parser [--repeat 2000] [--threshold 0.7] [--show-escalated]
+
+No database or network is needed.
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.ai.task_parser import TaskParser  # noqa: E402
+
+# Representative quick-add inputs, including ones that should escalate
+CORPUS = [
+    "review PR friday 3pm #backend !high",
+    "Call mom tomorrow at 5",
+    "pay rent every month on the 1st",
+    "standup every weekday 9:30 @team",
+    "remind me to buy milk tonight",
+    "submit report by 10/11 p1",
+    "submit expenses by 25/10",
+    "dentist next tuesday 2:30pm",
+    "water plants every other sunday",
+    "finish slides in 3 days #work",
+    "book flights sometime after the conference",
+    "lunch with Sam dec 5th at noon",
+    "deploy hotfix in 2 hours !!!",
+    "file taxes 2027-04-15 #finance",
+    "weekly sync +ops",
+    "clean garage this weekend",
+    "the 5th of june party planning",
+    "read chapter 4",
+    "renew passport before march",
+    "update dependencies every 2 weeks #maintenance",
+    "send invoice eom !high @billing",
+    "prepare quarterly review next month",
+    "check on the server later",
+    "gym tomorrow morning",
+    "write blog post about caching #writing",
+    "team retro thu 4pm @team",
+    "fix login bug asap #backend",
+    "call plumber when I get home",
+    "pick up dry cleaning today 6pm",
+    "1:1 with manager every monday 10am",
+    "migrate database jan 15 #infra !!",
+    "buy birthday gift for Alex",
+    "draft roadmap eow @product",
+    "order new laptop in a week",
+    "follow up with client on 3/4",
+    "organise offsite someday",
+    "cancel subscription before the 20th",
+    "yoga every tue and thu 7am",
+    "backup photos daily",
+    "prepare demo for monday p2 #sales",
+]
+
+
+def run(repeat: int, threshold: float, show_escalated: bool) -> None:
+    parser = TaskParser()
+    now = datetime.now(timezone.utc)
+
+    results = [parser.parse(text, now=now, tz="Europe/Berlin") for text in CORPUS]
+
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for text in CORPUS:
+            parser.parse(text, now=now, tz="Europe/Berlin")
+        timings.append((time.perf_counter() - started) / len(CORPUS) * 1_000_000)
+
+    escalated = [(text, r.confidence) for text, r in zip(CORPUS, results) if r.confidence < threshold]
+    p95 = statistics.quantiles(timings, n=20)[18] if len(timings) >= 20 else max(timings)
+
+    print(f"corpus: {len(CORPUS)} inputs x {repeat} runs\n")
+    print(f"{'per parse p50':20} {statistics.median(timings):8.1f} us")
+    print(f"{'per parse p95':20} {p95:8.1f} us")
+    print(f"{'throughput':20} {1_000_000 / statistics.median(timings):8.0f} parses/s (one core)")
+    print(f"{'escalation rate':20} {len(escalated) / len(CORPUS):8.1%} "
+          f"({len(escalated)}/{len(CORPUS)} below {threshold})")
+
+    if show_escalated:
+        print()
+        for text, confidence in escalated:
+            print(f"  {confidence:4.2f}  {text}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=2000)
+    parser.add_argument("--threshold", type=float, default=0.7)
+    parser.add_argument("--show-escalated", action="store_true")
+    args = parser.parse_args()
+    run(args.repeat, args.threshold, args.show_escalated)
+
+
+if __name__ == "__main__":
+    main()
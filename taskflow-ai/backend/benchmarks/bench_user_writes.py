@@ -0,0 +1,157 @@
+"""
+TaskFlow AI - User Write Path Benchmark
+
+Compares round-trips and latency of the single-statement AsyncUserService
+write paths against the previous load -> mutate -> commit (-> refresh)
+implementations.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_user_writes [--users 200]
+
+Defaults to a throwaway SQLite file; set DATABASE_URL to a scratch
+PostgreSQL database to measure real network round-trips. The tables are
+dropped and recreated.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+_tmp_db = os.path.join(tempfile.mkdtemp(prefix="taskflow-bench-"), "bench.db")
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key-benchmark-secret-key")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{_tmp_db}")
+os.environ.setdefault("DEBUG", "false")  # no SQL echo
+
+from sqlalchemy import event  # noqa: E402
+
+from app.db.database import AsyncSessionLocal, Base, async_engine  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.schemas.auth import UserUpdate  # noqa: E402
+from app.services.last_login import last_login_stamper  # noqa: E402
+from app.services.user_cache import user_cache  # noqa: E402
+from app.services.user_service import AsyncUserService  # noqa: E402
+
+
+class LegacyWrites:
+    """The previous ORM write paths, kept here only for comparison"""
+
+    def __init__(self, db):
+        self.db = db
+
+    async def update_last_login(self, user_id):
+        user = await self.db.get(User, user_id)
+        if user:
+            user.last_login = datetime.utcnow()
+            await self.db.commit()
+
+    async def verify_email(self, user_id):
+        user = await self.db.get(User, user_id)
+        if not user:
+            return False
+        user.is_verified = True
+        user.email_verified_at = datetime.utcnow()
+        user.updated_at = datetime.utcnow()
+        await self.db.commit()
+        return True
+
+    async def deactivate_user(self, user_id):
+        user = await self.db.get(User, user_id)
+        if not user:
+            return False
+        user.is_active = False
+        user.updated_at = datetime.utcnow()
+        await self.db.commit()
+        return True
+
+    async def update_user(self, user_id, user_data):
+        user = await self.db.get(User, user_id)
+        if not user:
+            return None
+        for field, value in user_data.dict(exclude_unset=True).items():
+            setattr(user, field, value)
+        user.updated_at = datetime.utcnow()
+        await self.db.commit()
+        await self.db.refresh(user)
+        return user
+
+
+async def run(users: int) -> None:
+    engine = async_engine
+    session_factory = AsyncSessionLocal
+
+    statements = []
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with session_factory() as db:
+        rows = [
+            User(email=f"bench{i}@example.com", hashed_password="x", is_active=True, preferences={})
+            for i in range(users)
+        ]
+        db.add_all(rows)
+        await db.commit()
+        user_ids = [row.id for row in rows]
+
+    profile = UserUpdate(first_name="Bench", last_name="User")
+    cases = [
+        ("update_last_login", lambda s, uid: s.update_last_login(uid),
+         lambda s, uid: s.update_last_login(uid, defer=False)),
+        ("update_last_login (deferred)", None,
+         lambda s, uid: s.update_last_login(uid, defer=True)),
+        ("verify_email", lambda s, uid: s.verify_email(uid), lambda s, uid: s.verify_email(uid)),
+        ("update_user", lambda s, uid: s.update_user(uid, profile), lambda s, uid: s.update_user(uid, profile)),
+        ("deactivate_user", lambda s, uid: s.deactivate_user(uid), lambda s, uid: s.deactivate_user(uid)),
+    ]
+
+    print(f"{'operation':32} {'impl':8} {'stmts/op':>9} {'p50 ms':>8} {'p95 ms':>8}")
+    for name, legacy_call, new_call in cases:
+        for impl, call, service_cls in (("legacy", legacy_call, LegacyWrites), ("new", new_call, AsyncUserService)):
+            if call is None:
+                continue
+
+            user_cache.clear()
+            statements.clear()
+            timings = []
+            for user_id in user_ids:
+                # Fresh session per call, as in a request handler
+                async with session_factory() as db:
+                    started = time.perf_counter()
+                    await call(service_cls(db), user_id)
+                    timings.append((time.perf_counter() - started) * 1000)
+
+            per_op = len(statements) / len(user_ids)
+            p95 = statistics.quantiles(timings, n=20)[18] if len(timings) >= 20 else max(timings)
+            print(f"{name:32} {impl:8} {per_op:9.2f} {statistics.median(timings):8.3f} {p95:8.3f}")
+
+    # Deferred stamps are written by one executemany UPDATE per flush
+    statements.clear()
+    started = time.perf_counter()
+    await last_login_stamper.flush()
+    print(f"\ndeferred flush: {len(user_ids)} stamps, {len(statements)} statement(s), "
+          f"{(time.perf_counter() - started) * 1000:.3f} ms")
+
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(run(args.users))
+
+
+if __name__ == "__main__":
+    main()
@@ -13,9 +13,28 @@ from fastapi.responses import JSONResponse
 import structlog
 import time
 
-from app.core.config import settings
+from app.core.config import check_config, settings
+from app.ai.llm_cache import llm_cache
+from app.ai.llm_client import llm_client
+from app.ai.token_budget import token_counter
 from app.api.v1.api import api_router
-from app.core.logging import setup_logging
+from app.core.hashing import HashingPoolSaturated, hashing_executor
+from app.core.logging import get_logging_metrics, setup_logging, shutdown_logging
+from app.core.rate_limit import RateLimitMiddleware, rate_limiter
+from app.core.token_cache import verified_token_cache
+from app.db.database import AsyncSessionLocal, dispose_engines
+from app.jobs.queue import job_queue
+from app.models.user import login_attempt_partitions
+from app.services.lockout import lockout_engine
+from app.services.last_login import last_login_stamper
+from app.services.login_audit import login_audit_writer
+from app.services.mail_delivery import mail_delivery_worker
+from app.services.retention import retention_sweeper
+from app.services.session_service import session_activity, session_cache, session_revocation_sync
+from app.services.token_usage import token_usage_recorder
+from app.services.user_cache import user_cache
+from app.services.user_stats import user_stats_rebuilder
+from app.services.weekly_digest import weekly_digest_runner
 
 # Set up structured logging
 setup_logging()
@@ -30,6 +49,10 @@ app = FastAPI(
     redoc_url="/redoc" if settings.ENVIRONMENT != "production" else None,
 )
 
+# Rate limiting (inside CORS so 429 responses stay readable by browsers)
+if settings.RATE_LIMIT_ENABLED:
+    app.add_middleware(RateLimitMiddleware, limiter=rate_limiter)
+
 # CORS Configuration
 app.add_middleware(
     CORSMiddleware,
@@ -43,28 +66,30 @@ app.add_middleware(
 # Request logging middleware
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
-    """Log all HTTP requests with timing information"""
-    start_time = time.time()
-    
-    # Log request
-    logger.info(
-        "request_started",
-        method=request.method,
-        url=str(request.url),
-        client_ip=request.client.host if request.client else None,
-    )
+    """Log one completion event per HTTP request with timing information"""
+    start_time = time.perf_counter()
     
-    # Process request
-    response = await call_next(request)
+    try:
+        response = await call_next(request)
+    except Exception:
+        logger.error(
+            "request_failed",
+            method=request.method,
+            path=request.url.path,
+            client_ip=request.client.host if request.client else None,
+            process_time=round(time.perf_counter() - start_time, 4),
+        )
+        raise
     
     # Calculate processing time
-    process_time = time.time() - start_time
+    process_time = time.perf_counter() - start_time
     
-    # Log response
+    # Log response (successes are sampled, errors always logged)
     logger.info(
         "request_completed",
         method=request.method,
-        url=str(request.url),
+        path=request.url.path,
+        client_ip=request.client.host if request.client else None,
         status_code=response.status_code,
         process_time=round(process_time, 4),
     )
@@ -96,6 +121,23 @@ async def global_exception_handler(request: Request, exc: Exception):
     )
 
 
+# Hashing pool backpressure handler
+@app.exception_handler(HashingPoolSaturated)
+async def hashing_pool_saturated_handler(request: Request, exc: HashingPoolSaturated):
+    """Shed load when the password hashing pool is full"""
+    logger.warning(
+        "request_shed_hashing_pool_saturated",
+        url=str(request.url),
+        method=request.method,
+    )
+    
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Service temporarily overloaded, please retry"},
+        headers={"Retry-After": "1"},
+    )
+
+
 # Health check endpoint
 @app.get("/health")
 async def health_check():
@@ -108,6 +150,35 @@ async def health_check():
     }
 
 
+# Metrics endpoint
+@app.get("/metrics")
+async def metrics():
+    """In-process metrics for monitoring"""
+    return {
+        "hashing_pool": hashing_executor.metrics(),
+        "token_cache": verified_token_cache.metrics(),
+        "login_audit": login_audit_writer.metrics(),
+        "user_cache": user_cache.metrics(),
+        "sessions": {
+            "cache": session_cache.metrics(),
+            "activity": session_activity.metrics(),
+            "revocation": session_revocation_sync.metrics(),
+        },
+        "last_login": last_login_stamper.metrics(),
+        "user_stats_rebuild": user_stats_rebuilder.metrics(),
+        "rate_limit": rate_limiter.metrics(),
+        "llm_cache": llm_cache.metrics(),
+        "llm_dispatcher": llm_client.dispatcher.metrics(),
+        "token_counter": token_counter.metrics(),
+        "token_usage": token_usage_recorder.metrics(),
+        "jobs": job_queue.metrics(),
+        "mail_delivery": mail_delivery_worker.metrics(),
+        "retention": retention_sweeper.metrics(),
+        "weekly_digest": weekly_digest_runner.metrics(),
+        "log_writer": get_logging_metrics(),
+    }
+
+
 # Include API router
 app.include_router(api_router, prefix="/api/v1")
 
@@ -116,12 +187,42 @@ app.include_router(api_router, prefix="/api/v1")
 @app.on_event("startup")
 async def startup_event():
     """Application startup tasks"""
+    started = time.perf_counter()
+    check_config()
+    await job_queue.start()
+    await login_audit_writer.start()
+    await last_login_stamper.start()
+    await session_activity.start()
+    await session_revocation_sync.start()
+    await token_usage_recorder.start()
+    token_counter.warm_in_background()
+    # With Celery, workers drain the outbox (beat schedules retries) and sweep
+    if settings.JOBS_BACKEND.lower() == "memory":
+        if settings.SMTP_HOST:
+            await mail_delivery_worker.start()
+        if settings.RETENTION_ENABLED:
+            await retention_sweeper.start()
+    
+    # Partitions for the coming weeks exist before the first login is recorded
+    try:
+        await login_attempt_partitions.ensure()
+    except Exception as e:
+        logger.error("login_attempt_partitions_failed", error=str(e))
+    
+    # Restore in-process lockout counters lost on restart
+    try:
+        async with AsyncSessionLocal() as db:
+            await lockout_engine.rebuild(db)
+    except Exception as e:
+        logger.error("lockout_rebuild_failed", error=str(e))
+    
     logger.info(
         "application_startup",
         service="taskflow-ai-api",
         version="1.0.0",
         environment=settings.ENVIRONMENT,
         debug=settings.DEBUG,
+        startup_seconds=round(time.perf_counter() - started, 3),
     )
 
 
@@ -129,7 +230,19 @@ async def startup_event():
 @app.on_event("shutdown")
 async def shutdown_event():
     """Application shutdown tasks"""
+    await login_audit_writer.stop()
+    await last_login_stamper.stop()
+    await session_activity.stop()
+    await session_revocation_sync.stop()
+    await token_usage_recorder.stop()
+    await job_queue.stop()
+    await mail_delivery_worker.stop()
+    await retention_sweeper.stop()
+    hashing_executor.shutdown()
+    llm_cache.close()
+    await dispose_engines()
     logger.info("application_shutdown", service="taskflow-ai-api")
+    shutdown_logging()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,17 @@
+"""
+TaskFlow AI - Test Configuration
+
+Following Backend Template Epic 10: Testing
+- Settings for an offline test run (local LLM stand-in, no persistent LLM cache)
+- Must run before any app module is imported
+"""
+
+import os
+import tempfile
+
+os.environ.setdefault("SECRET_KEY", "test-secret-key-test-secret-key-test-secret")
+_tmp_db = os.path.join(tempfile.mkdtemp(prefix="taskflow-tests-"), "test.db")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{_tmp_db}")
+os.environ.setdefault("DEBUG", "false")
+os.environ["LLM_PROVIDER"] = "local"
+os.environ["LLM_CACHE_BACKEND"] = "none"
@@ -0,0 +1,143 @@
+"""
+TaskFlow AI - Background Job Queue Tests
+
+Following Backend Template Epic 10: Testing
+- The whole enqueue to handler pipeline in memory mode
+- Idempotent job keys and per-job publish outcomes on the Celery backend
+"""
+
+import asyncio
+
+import pytest
+
+from app.jobs.queue import JOB_KEY_PREFIX, CeleryJobBackend, JobQueue, MemoryJobBackend
+from app.jobs.tasks import JOBS, JobSpec
+
+
+@pytest.fixture
+def ran(monkeypatch):
+    """Registers test.<queue> jobs that record (queue, item) when they run"""
+    ran = []
+
+    def handler_for(queue):
+        async def handler(item):
+            ran.append((queue, item))
+        return handler
+
+    for queue in ("critical", "default", "bulk"):
+        monkeypatch.setitem(JOBS, f"test.{queue}", JobSpec(f"test.{queue}", handler_for(queue), queue))
+    return ran
+
+
+def test_memory_pipeline_runs_jobs_by_priority_and_drops_duplicate_keys(ran):
+    queue = JobQueue(MemoryJobBackend(), max_queue_size=100)
+
+    async def scenario():
+        await queue.start()
+        assert queue.enqueue("test.bulk", key="bulk-1", item=1)
+        assert queue.enqueue("test.default", key="default-1", item=2)
+        assert not queue.enqueue("test.bulk", key="bulk-1", item=3)  # still waiting
+        assert queue.enqueue("test.critical", item=4)
+        assert queue.enqueue("test.critical", item=5)
+        await queue.stop()
+
+    asyncio.run(scenario())
+
+    assert ran == [("critical", 4), ("critical", 5), ("default", 2), ("bulk", 1)]
+    metrics = queue.metrics()
+    assert (metrics["enqueued"], metrics["deduplicated"], metrics["dispatched"], metrics["failed"]) == (4, 1, 4, 0)
+
+
+def test_key_is_free_again_once_the_job_was_dispatched(ran):
+    queue = JobQueue(MemoryJobBackend(), max_queue_size=100)
+
+    async def scenario():
+        assert queue.enqueue("test.default", key="k", item=1)
+        await queue.drain()
+        assert queue.enqueue("test.default", key="k", item=2)
+        await queue.drain()
+        await queue.backend.join()
+
+    asyncio.run(scenario())
+
+    assert ran == [("default", 1), ("default", 2)]
+
+
+def test_full_buffer_drops_new_jobs(ran):
+    queue = JobQueue(MemoryJobBackend(), max_queue_size=2)
+
+    assert queue.enqueue("test.default", item=1)
+    assert queue.enqueue("test.default", item=2)
+    assert not queue.enqueue("test.default", item=3)
+    assert queue.metrics()["dropped"] == 1
+
+
+def test_unknown_job_is_rejected():
+    queue = JobQueue(MemoryJobBackend(), max_queue_size=10)
+
+    with pytest.raises(ValueError):
+        queue.enqueue("test.missing")
+
+
+class FakeRedis:
+    def __init__(self):
+        self.keys = {}
+
+    def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.keys:
+            return None
+        self.keys[key] = value
+        return True
+
+    def delete(self, key):
+        self.keys.pop(key, None)
+
+
+class FlakyCeleryApp:
+    """send_task fails for the items listed in fail"""
+
+    def __init__(self, fail):
+        self.fail = set(fail)
+        self.sent = []
+
+    def send_task(self, name, kwargs, queue, priority):
+        if kwargs["item"] in self.fail:
+            raise ConnectionError("broker unavailable")
+        self.sent.append((name, kwargs["item"]))
+
+
+def celery_backend(app: FlakyCeleryApp) -> CeleryJobBackend:
+    backend = CeleryJobBackend(broker_url="redis://unused", idempotency_ttl=3600)
+    backend._app, backend._redis = app, FakeRedis()
+    return backend
+
+
+def test_failed_publish_releases_its_key_and_counts_per_job(ran):
+    app = FlakyCeleryApp(fail={2})
+    queue = JobQueue(celery_backend(app), max_queue_size=100)
+
+    async def scenario():
+        queue.enqueue("test.default", key="a", item=1)
+        queue.enqueue("test.default", key="b", item=2)
+        queue.enqueue("test.default", item=3)
+        await queue.drain()
+
+    asyncio.run(scenario())
+
+    assert app.sent == [("test.default", 1), ("test.default", 3)]
+    assert set(queue.backend._redis.keys) == {JOB_KEY_PREFIX + "a"}
+    assert (queue.metrics()["dispatched"], queue.metrics()["failed"]) == (2, 1)
+
+    # The retry is published, not dropped as a duplicate of the lost job
+    app.fail.clear()
+    asyncio.run(queue.backend.dispatch([("test.default", "b", {"item": 2})]))
+    assert app.sent[-1] == ("test.default", 2)
+
+
+def test_key_held_by_a_waiting_job_is_a_duplicate_across_processes(ran):
+    backend = celery_backend(FlakyCeleryApp(fail=()))
+
+    first = asyncio.run(backend.dispatch([("test.default", "k", {"item": 1})]))
+    second = asyncio.run(backend.dispatch([("test.default", "k", {"item": 1})]))
+
+    assert (first, second) == (["dispatched"], ["duplicate"])
@@ -0,0 +1,353 @@
+"""
+TaskFlow AI - LLM Response Cache Tests
+
+Following Backend Template Epic 10: Testing
+- Cache keys, per-endpoint TTLs, LRU eviction in both tiers, promotion and metrics
+- LLM calls go to the local stand-in backend; no network or API key
+"""
+
+import asyncio
+
+import pytest
+
+from app.ai import llm_cache as llm_cache_module
+from app.ai.llm_cache import LLMResponseCache, MemoryCacheTier, SQLiteCacheTier, llm_cache_key
+from app.ai.llm_client import LLMClient, LocalLLMBackend
+from app.ai.llm_dispatcher import LLMDispatcher
+from app.ai.token_budget import token_counter
+
+MODEL = "test-model"
+PARAMS = {"temperature": 0.0, "max_tokens": 100}
+
+
+class FakeClock:
+    """Stands in for the time module inside the cache so expiry is deterministic"""
+
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def time(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(llm_cache_module, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def sqlite_tier(tmp_path):
+    tier = SQLiteCacheTier(str(tmp_path / "llm_cache.sqlite3"), max_entries=1000)
+    yield tier
+    tier.close()
+
+
+def make_cache(persistent=None, memory_size: int = 100, ttls=None) -> LLMResponseCache:
+    return LLMResponseCache(
+        memory=MemoryCacheTier(memory_size),
+        persistent=persistent,
+        ttls=ttls if ttls is not None else {"parse": 10, "suggest": 100, "uncached": 0},
+        default_ttl=50,
+    )
+
+
+def make_client(cache: LLMResponseCache) -> LLMClient:
+    return LLMClient(
+        dispatcher=LLMDispatcher(
+            backend=LocalLLMBackend(),
+            max_concurrency=4,
+            per_user_concurrency=2,
+            queue_timeout=5.0,
+            batch_window=0.001,
+            max_batch_size=8,
+        ),
+        cache=cache,
+        model=MODEL,
+        max_tokens=100,
+        context_window=8192,
+        counter=token_counter,
+    )
+
+
+def user_message(content: str):
+    return [{"role": "user", "content": content}]
+
+
+# Key normalization
+
+def test_key_ignores_whitespace_and_unicode_form():
+    key = llm_cache_key(MODEL, user_message("Plan the Sprint review"), PARAMS)
+
+    assert llm_cache_key(MODEL, user_message("  Plan the\n\tSprint   review "), PARAMS) == key
+    # NFKC folds the full-width letters and the non-breaking space
+    assert llm_cache_key(MODEL, user_message("Ｐlan the Sprint review"), PARAMS) == key
+
+
+@pytest.mark.parametrize(
+    "model, messages, params",
+    [
+        ("other-model", user_message("Plan the sprint review"), PARAMS),
+        (MODEL, user_message("Plan the sprint retro"), PARAMS),
+        (MODEL, user_message("plan the sprint review"), PARAMS),
+        (MODEL, user_message("Plan the sprint review for the US team"), PARAMS),
+        (MODEL, [{"role": "system", "content": "Plan the sprint review"}], PARAMS),
+        (MODEL, user_message("Plan the sprint review"), {**PARAMS, "temperature": 0.7}),
+    ],
+)
+def test_key_changes_with_model_content_role_and_params(model, messages, params):
+    key = llm_cache_key(MODEL, user_message("Plan the sprint review"), PARAMS)
+    assert llm_cache_key(model, messages, params) != key
+
+
+def test_key_ignores_param_order():
+    reordered = {"max_tokens": 100, "temperature": 0.0}
+    assert llm_cache_key(MODEL, user_message("x"), reordered) == llm_cache_key(MODEL, user_message("x"), PARAMS)
+
+
+def test_client_serves_equivalent_prompts_from_one_call():
+    client = make_client(make_cache())
+
+    async def scenario():
+        first = await client.complete("suggest", user_message("Write the Q3 report"))
+        second = await client.complete("suggest", user_message("  Write the Q3\n  report "))
+        return first, second
+
+    first, second = asyncio.run(scenario())
+
+    assert first == second
+    assert client.backend.calls == 1
+
+
+# Per-endpoint TTLs
+
+def test_entries_expire_after_their_endpoints_ttl(clock, sqlite_tier):
+    cache = make_cache(persistent=sqlite_tier)
+
+    async def scenario():
+        await cache.put("parse", "k-parse", "parsed")
+        await cache.put("suggest", "k-suggest", "suggested")
+        await cache.put("insights", "k-default", "insight")
+        clock.advance(11)
+        after_parse_ttl = (
+            await cache.get("parse", "k-parse"),
+            await cache.get("suggest", "k-suggest"),
+            await cache.get("insights", "k-default"),
+        )
+        clock.advance(40)
+        after_default_ttl = (await cache.get("suggest", "k-suggest"), await cache.get("insights", "k-default"))
+        return after_parse_ttl, after_default_ttl
+
+    after_parse_ttl, after_default_ttl = asyncio.run(scenario())
+
+    assert after_parse_ttl == (None, "suggested", "insight")
+    assert after_default_ttl == ("suggested", None)
+
+
+def test_expired_entries_miss_in_the_persistent_tier_too(clock, sqlite_tier):
+    cache = make_cache(persistent=sqlite_tier)
+
+    async def scenario():
+        await cache.put("parse", "k", "parsed")
+        cache.memory.clear()
+        clock.advance(11)
+        return await cache.get("parse", "k"), await sqlite_tier.get("k")
+
+    assert asyncio.run(scenario()) == (None, None)
+
+
+def test_ttl_zero_is_never_cached(sqlite_tier):
+    cache = make_cache(persistent=sqlite_tier)
+
+    async def scenario():
+        await cache.put("uncached", "k", "value")
+        return await cache.get("uncached", "k"), await sqlite_tier.get("k")
+
+    assert asyncio.run(scenario()) == (None, None)
+    assert len(cache.memory) == 0
+
+
+def test_client_calls_the_backend_every_time_for_ttl_zero_endpoints():
+    client = make_client(make_cache())
+
+    async def scenario():
+        for _ in range(3):
+            await client.complete("uncached", user_message("same prompt"))
+
+    asyncio.run(scenario())
+
+    assert client.backend.calls == 3
+
+
+def test_client_calls_the_backend_again_after_expiry(clock):
+    client = make_client(make_cache())
+
+    async def scenario():
+        await client.complete("parse", user_message("same prompt"))
+        await client.complete("parse", user_message("same prompt"))
+        clock.advance(11)
+        await client.complete("parse", user_message("same prompt"))
+
+    asyncio.run(scenario())
+
+    assert client.backend.calls == 2
+
+
+# LRU eviction
+
+def test_memory_tier_evicts_least_recently_used(clock):
+    memory = MemoryCacheTier(max_size=2)
+    expires_at = clock.now + 100
+
+    memory.put("a", "A", expires_at)
+    memory.put("b", "B", expires_at)
+    assert memory.get("a") == "A"  # b is now least recently used
+    memory.put("c", "C", expires_at)
+
+    assert len(memory) == 2
+    assert memory.get("b") is None
+    assert memory.get("a") == "A"
+    assert memory.get("c") == "C"
+
+
+def test_memory_tier_of_size_zero_stores_nothing(clock):
+    memory = MemoryCacheTier(max_size=0)
+    memory.put("a", "A", clock.now + 100)
+
+    assert len(memory) == 0
+    assert memory.get("a") is None
+
+
+def test_sqlite_tier_evicts_least_recently_used(clock, tmp_path):
+    tier = SQLiteCacheTier(str(tmp_path / "llm_cache.sqlite3"), max_entries=2)
+    tier.EVICT_EVERY = 1
+    expires_at = clock.now + 100
+
+    async def scenario():
+        await tier.put("a", "A", expires_at)
+        clock.advance(1)
+        await tier.put("b", "B", expires_at)
+        clock.advance(1)
+        assert await tier.get("a") == "A"  # b is now least recently used
+        clock.advance(1)
+        await tier.put("c", "C", expires_at)
+        return await tier.get("a"), await tier.get("b"), await tier.get("c")
+
+    try:
+        assert asyncio.run(scenario()) == ("A", None, "C")
+    finally:
+        tier.close()
+
+
+def test_sqlite_tier_is_shared_across_instances(clock, tmp_path):
+    path = str(tmp_path / "llm_cache.sqlite3")
+    writer, reader = SQLiteCacheTier(path, 100), SQLiteCacheTier(path, 100)
+
+    async def scenario():
+        await writer.put("k", "value", clock.now + 100)
+        return await reader.get("k")
+
+    try:
+        assert asyncio.run(scenario()) == "value"
+    finally:
+        writer.close()
+        reader.close()
+
+
+# Persistent-hit promotion
+
+def test_persistent_hits_are_promoted_to_memory(clock, sqlite_tier):
+    cache = make_cache(persistent=sqlite_tier)
+
+    async def scenario():
+        await cache.put("suggest", "k", "value")
+        cache.memory.clear()  # as seen by another worker
+        first = await cache.get("suggest", "k")
+        second = await cache.get("suggest", "k")
+        return first, second
+
+    assert asyncio.run(scenario()) == ("value", "value")
+    stats = cache.metrics()["endpoints"]["suggest"]
+    assert stats["persistent_hits"] == 1
+    assert stats["memory_hits"] == 1
+
+
+def test_promoted_entries_live_briefly_in_memory(clock, sqlite_tier):
+    cache = make_cache(persistent=sqlite_tier)
+
+    async def scenario():
+        await cache.put("suggest", "k", "value")
+        cache.memory.clear()
+        await cache.get("suggest", "k")  # promoted for min(ttl, 60s)
+        clock.advance(61)
+        promoted = cache.memory.get("k")
+        return promoted, await cache.get("suggest", "k")
+
+    assert asyncio.run(scenario()) == (None, "value")
+    assert cache.metrics()["endpoints"]["suggest"]["persistent_hits"] == 2
+
+
+class FailingTier:
+    async def get(self, key):
+        raise OSError("disk gone")
+
+    async def put(self, key, value, expires_at):
+        raise OSError("disk gone")
+
+    def close(self):
+        pass
+
+
+def test_failing_persistent_tier_is_a_miss():
+    cache = make_cache(persistent=FailingTier())
+
+    async def scenario():
+        await cache.put("suggest", "k", "value")
+        cache.memory.clear()
+        return await cache.get("suggest", "k")
+
+    assert asyncio.run(scenario()) is None
+    stats = cache.metrics()["endpoints"]["suggest"]
+    assert stats["errors"] == 2
+    assert stats["misses"] == 1
+
+
+# Metrics
+
+def test_hit_rate_metrics_per_endpoint(sqlite_tier):
+    cache = make_cache(persistent=sqlite_tier)
+
+    async def scenario():
+        assert await cache.get("suggest", "k") is None
+        await cache.put("suggest", "k", "value")
+        for _ in range(3):
+            await cache.get("suggest", "k")
+        assert await cache.get("parse", "other") is None
+
+    asyncio.run(scenario())
+    metrics = cache.metrics()
+
+    assert metrics["endpoints"]["suggest"] == {
+        "memory_hits": 3, "persistent_hits": 0, "misses": 1, "errors": 0, "hit_rate": 0.75,
+    }
+    assert metrics["endpoints"]["parse"]["hit_rate"] == 0.0
+    assert metrics["memory_size"] == 1
+    assert metrics["persistent_backend"] == "SQLiteCacheTier"
+
+
+def test_client_lookups_feed_the_metrics():
+    client = make_client(make_cache())
+
+    async def scenario():
+        for _ in range(4):
+            await client.complete("suggest", user_message("same prompt"))
+
+    asyncio.run(scenario())
+    stats = client.cache.metrics()["endpoints"]["suggest"]
+
+    assert client.backend.calls == 1
+    assert (stats["misses"], stats["memory_hits"], stats["hit_rate"]) == (1, 3, 0.75)
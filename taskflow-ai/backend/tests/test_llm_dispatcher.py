@@ -0,0 +1,186 @@
+"""
+TaskFlow AI - LLM Dispatcher Tests
+
+Following Backend Template Epic 10: Testing
+- Global and per-user concurrency limits, coalescing and micro-batching
+- Queueing metrics, including callers rejected by the queue timeout
+- Runs against the local stand-in backend with simulated latency
+"""
+
+import asyncio
+from collections import defaultdict
+
+from app.ai.llm_client import LocalLLMBackend
+from app.ai.llm_dispatcher import LLMDispatcher, LLMQueueTimeout
+
+MODEL = "test-model"
+LATENCY = 0.02
+
+
+class PerUserBackend(LocalLLMBackend):
+    """Local backend that also tracks peak concurrency per user (prompts start with '<user>:')"""
+
+    def __init__(self, latency: float):
+        super().__init__(latency)
+        self.user_active = defaultdict(int)
+        self.user_peak = defaultdict(int)
+
+    async def complete(self, model, messages, **params):
+        user = messages[-1]["content"].split(":", 1)[0]
+        self.user_active[user] += 1
+        self.user_peak[user] = max(self.user_peak[user], self.user_active[user])
+        try:
+            return await super().complete(model, messages, **params)
+        finally:
+            self.user_active[user] -= 1
+
+
+def make_dispatcher(
+    backend=None,
+    max_concurrency: int = 4,
+    per_user: int = 2,
+    queue_timeout: float = 5.0,
+    batch_window: float = 0.01,
+    max_batch_size: int = 8,
+) -> LLMDispatcher:
+    return LLMDispatcher(
+        backend=backend or LocalLLMBackend(latency=LATENCY),
+        max_concurrency=max_concurrency,
+        per_user_concurrency=per_user,
+        queue_timeout=queue_timeout,
+        batch_window=batch_window,
+        max_batch_size=max_batch_size,
+    )
+
+
+def prompt(content: str):
+    return [{"role": "user", "content": content}]
+
+
+def test_peak_concurrency_stays_within_the_global_limit():
+    dispatcher = make_dispatcher(max_concurrency=4)
+
+    async def scenario():
+        await asyncio.gather(*(
+            dispatcher.complete(MODEL, prompt(f"request {i}"), user_id=i) for i in range(20)
+        ))
+
+    asyncio.run(scenario())
+
+    assert dispatcher.backend.calls == 20
+    assert dispatcher.backend.peak_active == 4
+    assert dispatcher.metrics()["peak_active"] == 4
+
+
+def test_one_user_cannot_take_every_slot():
+    dispatcher = make_dispatcher(backend=PerUserBackend(LATENCY), max_concurrency=4, per_user=2)
+    light_done = []
+
+    async def light_user():
+        await asyncio.sleep(LATENCY / 4)  # arrives after the hot user's burst
+        await dispatcher.complete(MODEL, prompt("light: one request"), user_id="light")
+        light_done.append(asyncio.get_running_loop().time())
+
+    async def scenario():
+        started = asyncio.get_running_loop().time()
+        await asyncio.gather(
+            *(dispatcher.complete(MODEL, prompt(f"hot: request {i}"), user_id="hot") for i in range(20)),
+            light_user(),
+        )
+        return started
+
+    started = asyncio.run(scenario())
+
+    assert dispatcher.backend.user_peak["hot"] == 2
+    # Served next to the hot user's calls, not after its 10 rounds
+    assert light_done[0] - started < LATENCY * 4
+
+
+def test_identical_requests_share_one_call():
+    dispatcher = make_dispatcher()
+
+    async def scenario():
+        return await asyncio.gather(*(
+            dispatcher.complete(MODEL, prompt("same prompt"), user_id=i) for i in range(10)
+        ))
+
+    results = asyncio.run(scenario())
+
+    assert len(set(results)) == 1
+    assert dispatcher.backend.calls == 1
+    assert dispatcher.metrics()["coalesced"] == 9
+
+
+def test_classification_prompts_are_batched():
+    dispatcher = make_dispatcher(max_batch_size=8)
+
+    async def scenario():
+        return await asyncio.gather(*(
+            dispatcher.classify(MODEL, "Label the task as work or personal.", f"task {i}", user_id=i % 3)
+            for i in range(20)
+        ))
+
+    results = asyncio.run(scenario())
+    metrics = dispatcher.metrics()
+
+    assert [result.answer for result in results] == [f"[local {MODEL}] task {i}" for i in range(20)]
+    assert (metrics["batches"], metrics["batched_items"], metrics["batch_fallbacks"]) == (3, 20, 0)
+    assert dispatcher.backend.calls == 3
+    assert [result.calls[0].items for result in results] == [8] * 16 + [4] * 4
+
+
+def test_batch_waits_for_its_users_slots():
+    dispatcher = make_dispatcher(per_user=1)
+
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        busy = asyncio.ensure_future(dispatcher.complete(MODEL, prompt("long call"), user_id="a"))
+        await asyncio.sleep(0)
+        await asyncio.gather(*(
+            dispatcher.classify(MODEL, "label", f"t{i}", user_id=user) for i, user in enumerate("abc")
+        ))
+        elapsed = loop.time() - started
+        await busy
+        return elapsed
+
+    elapsed = asyncio.run(scenario())
+
+    # The batch holds a slot for user a, so it starts only after a's first call
+    assert elapsed >= LATENCY * 2
+    assert dispatcher.metrics()["batches"] == 1
+
+
+def test_every_caller_records_a_wait_sample():
+    dispatcher = make_dispatcher(max_concurrency=2)
+
+    async def scenario():
+        await asyncio.gather(
+            *(dispatcher.complete(MODEL, prompt(f"request {i}"), user_id=i) for i in range(6)),
+            *(dispatcher.complete(MODEL, prompt("shared"), user_id=i) for i in range(4)),
+            *(dispatcher.classify(MODEL, "label", f"t{i}") for i in range(5)),
+        )
+
+    asyncio.run(scenario())
+    metrics = dispatcher.metrics()
+
+    assert len(dispatcher._waits_ms) == 15
+    assert metrics["wait_ms_p95"] >= metrics["wait_ms_p50"] > 0
+
+
+def test_rejected_callers_record_their_wait():
+    queue_timeout = LATENCY / 2
+    dispatcher = make_dispatcher(max_concurrency=2, queue_timeout=queue_timeout)
+
+    async def scenario():
+        return await asyncio.gather(*(
+            dispatcher.complete(MODEL, prompt(f"request {i}"), user_id=i) for i in range(10)
+        ), return_exceptions=True)
+
+    results = asyncio.run(scenario())
+    metrics = dispatcher.metrics()
+
+    assert sum(isinstance(r, LLMQueueTimeout) for r in results) == 8
+    assert metrics["rejected"] == 8
+    assert len(dispatcher._waits_ms) == 10
+    assert metrics["wait_ms_p95"] >= queue_timeout * 1000
@@ -0,0 +1,101 @@
+"""
+TaskFlow AI - Account Lockout Tests
+
+Following Backend Template Epic 10: Testing
+- Atomic attempt claims against the in-process backend
+- Rebuild of the counters from login_attempts
+"""
+
+import asyncio
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, insert
+
+from app.db.database import AsyncSessionLocal, Base, get_engine
+from app.models.user import UNKNOWN_IP, LoginAttempt
+from app.services.lockout import InMemoryLockoutBackend, LockoutEngine
+
+
+def make_engine(max_email_failures: int = 5, max_ip_failures: int = 20) -> LockoutEngine:
+    return LockoutEngine(
+        backend=InMemoryLockoutBackend(),
+        window_seconds=900,
+        max_email_failures=max_email_failures,
+        max_ip_failures=max_ip_failures,
+    )
+
+
+def test_concurrent_claims_never_exceed_the_email_limit():
+    engine = make_engine(max_email_failures=5)
+
+    async def scenario():
+        return await asyncio.gather(*(engine.claim("a@example.com", f"10.0.0.{i}") for i in range(50)))
+
+    claims = asyncio.run(scenario())
+
+    assert sum(claim is not None for claim in claims) == 5
+
+
+def test_ip_limit_applies_across_emails():
+    engine = make_engine(max_ip_failures=3)
+
+    async def scenario():
+        return [await engine.claim(f"user{i}@example.com", "10.0.0.1") for i in range(5)]
+
+    claims = asyncio.run(scenario())
+
+    assert [claim is not None for claim in claims] == [True, True, True, False, False]
+
+
+def test_released_claims_do_not_count():
+    engine = make_engine(max_email_failures=2)
+
+    async def scenario():
+        for _ in range(5):
+            claim = await engine.claim("a@example.com", "10.0.0.1")
+            assert claim is not None
+            await engine.release(claim)
+        return await engine.get_failed_attempts("a@example.com")
+
+    assert asyncio.run(scenario()) == 0
+
+
+def test_ip_rejection_gives_back_the_email_claim():
+    engine = make_engine(max_email_failures=5, max_ip_failures=1)
+
+    async def scenario():
+        assert await engine.claim("a@example.com", "10.0.0.1") is not None
+        assert await engine.claim("b@example.com", "10.0.0.1") is None
+        return await engine.get_failed_attempts("b@example.com")
+
+    assert asyncio.run(scenario()) == 0
+
+
+def test_rebuild_skips_ip_accounting_for_unknown_addresses():
+    Base.metadata.create_all(bind=get_engine(), tables=[LoginAttempt.__table__])
+    engine = make_engine(max_email_failures=5, max_ip_failures=3)
+    now = datetime.now(timezone.utc)
+    rows = [
+        {
+            "id": uuid.uuid4(),
+            "email": f"user{i}@example.com",
+            "ip_address": UNKNOWN_IP,
+            "success": False,
+            "attempted_at": now - timedelta(seconds=i),
+        }
+        for i in range(10)
+    ]
+
+    async def scenario():
+        async with AsyncSessionLocal() as db:
+            await db.execute(delete(LoginAttempt))
+            await db.execute(insert(LoginAttempt), rows)
+            await db.commit()
+            replayed = await engine.rebuild(db)
+
+        assert replayed == 10
+        assert not await engine.is_locked("new@example.com", UNKNOWN_IP)
+        assert await engine.get_failed_attempts("user0@example.com") == 1
+
+    asyncio.run(scenario())
@@ -0,0 +1,233 @@
+"""
+TaskFlow AI - Mail Delivery Tests
+
+Following Backend Template Epic 10: Testing
+- Outbox delivery through the pooled worker against an in-process SMTP sink
+- 4xx replies retried with backoff, 5xx replies failed permanently
+- Attempts counted at claim time, so a message that never finishes still runs out
+"""
+
+import asyncio
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import delete, insert, select, update
+
+from app.db.database import AsyncSessionLocal, Base, get_engine
+from app.models.email import OutboundEmail
+from app.services.mail_delivery import MailDeliveryWorker, SMTPConnectionPool
+
+RETRY_BASE = 10.0
+MAX_ATTEMPTS = 3
+
+
+class SMTPSink:
+    """SMTP server that accepts every recipient except temp-fail@ (451) and reject@ (550)"""
+
+    REPLIES = {b"temp-fail@": b"451 try again later\r\n", b"reject@": b"550 no such user\r\n"}
+
+    def __init__(self):
+        self.connections = 0
+        self.delivered = []
+        self.server = None
+
+    async def start(self) -> int:
+        self.server = await asyncio.start_server(self._session, "127.0.0.1", 0)
+        return self.server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def _session(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        writer.write(b"220 sink ESMTP\r\n")
+        recipient = b""
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                command = line[:4].upper()
+                if command == b"EHLO":
+                    writer.write(b"250-sink\r\n250 8BITMIME\r\n")
+                elif command == b"RCPT":
+                    recipient = line
+                    reply = next((r for prefix, r in self.REPLIES.items() if b"<" + prefix in line), b"250 ok\r\n")
+                    writer.write(reply)
+                elif command == b"DATA":
+                    writer.write(b"354 end with .\r\n")
+                    await writer.drain()
+                    await reader.readuntil(b"\r\n.\r\n")
+                    self.delivered.append(recipient.decode().split("<", 1)[1].split(">", 1)[0])
+                    writer.write(b"250 queued\r\n")
+                elif command == b"QUIT":
+                    writer.write(b"221 bye\r\n")
+                    break
+                else:  # HELO, MAIL, RSET, NOOP
+                    writer.write(b"250 ok\r\n")
+                await writer.drain()
+        finally:
+            writer.close()
+
+
+@pytest.fixture(autouse=True)
+def outbox():
+    Base.metadata.create_all(bind=get_engine(), tables=[OutboundEmail.__table__])
+
+    async def clear():
+        async with AsyncSessionLocal() as db:
+            await db.execute(delete(OutboundEmail))
+            await db.commit()
+
+    asyncio.run(clear())
+
+
+def make_worker(port: int) -> MailDeliveryWorker:
+    return MailDeliveryWorker(
+        pool=SMTPConnectionPool("127.0.0.1", port, use_tls=False, size=2),
+        from_address="noreply@example.com",
+        batch_size=50,
+        poll_interval=1.0,
+        max_attempts=MAX_ATTEMPTS,
+        retry_base=RETRY_BASE,
+        retry_max=3600.0,
+        lease=60.0,
+    )
+
+
+async def queue(*addresses: str) -> None:
+    rows = [
+        {
+            "id": uuid.uuid4(),
+            "to_address": address,
+            "subject": "Hello",
+            "body_text": f"Message for {address}\n",
+            "kind": "test",
+            "next_attempt_at": datetime.now(timezone.utc) - timedelta(seconds=1),
+        }
+        for address in addresses
+    ]
+    async with AsyncSessionLocal() as db:
+        await db.execute(insert(OutboundEmail), rows)
+        await db.commit()
+
+
+async def make_due() -> None:
+    """Skip the backoff delay or lease of every queued row"""
+    async with AsyncSessionLocal() as db:
+        due_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+        await db.execute(update(OutboundEmail).values(next_attempt_at=due_at))
+        await db.commit()
+
+
+async def outbox_rows() -> dict:
+    async with AsyncSessionLocal() as db:
+        return {row.to_address: row for row in (await db.execute(select(OutboundEmail))).scalars()}
+
+
+def utc(value: datetime) -> datetime:
+    # SQLite hands timezone-aware columns back naive
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def run_with_sink(scenario):
+    async def main():
+        sink = SMTPSink()
+        worker = make_worker(await sink.start())
+        try:
+            return await scenario(sink, worker)
+        finally:
+            await asyncio.to_thread(worker.pool.close)  # QUIT needs the sink's loop to answer
+            await sink.stop()
+
+    return asyncio.run(main())
+
+
+def test_queued_mail_is_delivered_over_pooled_connections():
+    addresses = [f"user{i}@example.com" for i in range(10)]
+
+    async def scenario(sink, worker):
+        await queue(*addresses)
+        claimed = await worker.deliver_due()
+        return claimed, await worker.deliver_due(), await outbox_rows()
+
+    claimed, claimed_again, rows = run_with_sink(scenario)
+
+    assert (claimed, claimed_again) == (10, 0)
+    assert {row.status for row in rows.values()} == {"sent"}
+    assert {row.attempts for row in rows.values()} == {1}
+    assert all(row.sent_at is not None and row.last_error is None for row in rows.values())
+
+
+def test_pool_reuses_connections():
+    async def scenario(sink, worker):
+        await queue(*(f"user{i}@example.com" for i in range(10)))
+        await worker.deliver_due()
+        return sink
+
+    sink = run_with_sink(scenario)
+
+    assert sorted(sink.delivered) == sorted(f"user{i}@example.com" for i in range(10))
+    assert sink.connections == 2
+
+
+def test_temporary_failure_is_retried_with_backoff_until_max_attempts():
+    async def scenario(sink, worker):
+        await queue("temp-fail@example.com", "ok@example.com")
+        delays = []
+        for _ in range(MAX_ATTEMPTS):
+            started = datetime.now(timezone.utc)
+            await worker.deliver_due()
+            row = (await outbox_rows())["temp-fail@example.com"]
+            delays.append((row.status, row.attempts, (utc(row.next_attempt_at) - started).total_seconds()))
+            await make_due()
+        return sink, worker, delays, await outbox_rows()
+
+    sink, worker, delays, rows = run_with_sink(scenario)
+
+    # Backoff doubles per attempt, with jitter between half and the full delay
+    (first, second, last) = delays
+    assert first[:2] == ("pending", 1) and RETRY_BASE * 0.5 <= first[2] <= RETRY_BASE + 1
+    assert second[:2] == ("pending", 2) and RETRY_BASE <= second[2] <= RETRY_BASE * 2 + 1
+    assert last[:2] == ("failed", MAX_ATTEMPTS)
+    assert "451" in rows["temp-fail@example.com"].last_error
+    assert rows["ok@example.com"].status == "sent"
+    assert sink.delivered == ["ok@example.com"]
+    assert (worker.retried, worker.failed, worker.delivered) == (2, 1, 1)
+
+
+def test_permanent_failure_is_not_retried():
+    async def scenario(sink, worker):
+        await queue("reject@example.com")
+        await worker.deliver_due()
+        await make_due()
+        return sink, worker, await worker.deliver_due(), await outbox_rows()
+
+    sink, worker, claimed_again, rows = run_with_sink(scenario)
+
+    row = rows["reject@example.com"]
+    assert (row.status, row.attempts, claimed_again) == ("failed", 1, 0)
+    assert "550" in row.last_error
+    assert sink.delivered == []
+    assert (worker.retried, worker.failed) == (0, 1)
+
+
+def test_message_whose_lease_keeps_expiring_runs_out_of_attempts():
+    async def scenario(sink, worker):
+        await queue("stuck@example.com")
+        # A worker that claims the row and dies before recording the outcome
+        for attempt in range(1, MAX_ATTEMPTS + 1):
+            rows = await worker._claim()
+            assert [row.attempts for row in rows] == [attempt]
+            await make_due()
+        await worker.deliver_due()
+        return sink, worker, await outbox_rows()
+
+    sink, worker, rows = run_with_sink(scenario)
+
+    row = rows["stuck@example.com"]
+    assert (row.status, row.attempts) == ("failed", MAX_ATTEMPTS)
+    assert sink.delivered == []
+    assert worker.failed == 1
@@ -0,0 +1,102 @@
+"""
+TaskFlow AI - Password Reset Tests
+
+Following Backend Template Epic 10: Testing
+- Forgot-password to reset-password round trip through the API
+- Reset tokens and access tokens are not interchangeable
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.security import verify_token
+from app.db.database import create_tables
+from app.services.email_service import EmailService
+
+PASSWORD = "Secret123!"
+NEW_PASSWORD = "Changed456!"
+
+
+@pytest.fixture
+def client():
+    import main
+
+    create_tables()
+    with TestClient(main.app) as client:
+        yield client
+
+
+@pytest.fixture
+def sent_tokens(monkeypatch):
+    """Reset tokens that would have been emailed"""
+    tokens = []
+
+    async def capture(self, user, reset_token):
+        tokens.append(reset_token)
+
+    monkeypatch.setattr(EmailService, "send_password_reset_email", capture)
+    return tokens
+
+
+def register(client: TestClient, email: str) -> None:
+    response = client.post(
+        "/api/v1/auth/register",
+        json={"email": email, "password": PASSWORD, "confirm_password": PASSWORD},
+    )
+    assert response.status_code in (200, 201), response.text
+
+
+def login(client: TestClient, email: str, password: str):
+    return client.post("/api/v1/auth/login", data={"username": email, "password": password})
+
+
+def test_forgot_then_reset_password_round_trip(client, sent_tokens):
+    email = "reset-round-trip@example.com"
+    register(client, email)
+
+    response = client.post("/api/v1/auth/forgot-password", json={"email": email})
+    assert response.status_code == 200
+    assert len(sent_tokens) == 1
+    assert verify_token(sent_tokens[0])["type"] == "password_reset"
+
+    response = client.post(
+        "/api/v1/auth/reset-password",
+        json={"token": sent_tokens[0], "new_password": NEW_PASSWORD, "confirm_password": NEW_PASSWORD},
+    )
+    assert response.status_code == 200, response.text
+
+    assert login(client, email, PASSWORD).status_code == 401
+    assert login(client, email, NEW_PASSWORD).status_code == 200
+
+
+def test_unknown_email_sends_nothing(client, sent_tokens):
+    response = client.post("/api/v1/auth/forgot-password", json={"email": "nobody@example.com"})
+
+    assert response.status_code == 200
+    assert sent_tokens == []
+
+
+def test_access_token_cannot_reset_a_password(client):
+    email = "reset-access-token@example.com"
+    register(client, email)
+    access_token = login(client, email, PASSWORD).json()["access_token"]
+
+    response = client.post(
+        "/api/v1/auth/reset-password",
+        json={"token": access_token, "new_password": NEW_PASSWORD, "confirm_password": NEW_PASSWORD},
+    )
+
+    assert response.status_code == 400
+    assert login(client, email, PASSWORD).status_code == 200
+
+
+def test_reset_token_is_not_an_access_token(client, sent_tokens):
+    email = "reset-as-access@example.com"
+    register(client, email)
+    client.post("/api/v1/auth/forgot-password", json={"email": email})
+
+    response = client.get(
+        "/api/v1/users/me/stats", headers={"Authorization": f"Bearer {sent_tokens[0]}"},
+    )
+
+    assert response.status_code == 401
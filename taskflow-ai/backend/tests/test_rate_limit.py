@@ -0,0 +1,60 @@
+"""
+TaskFlow AI - Rate Limiting Tests
+
+Following Backend Template Epic 10: Testing
+- Token buckets refill over time
+- A shard at its cap evicts full buckets before draining ones
+"""
+
+from app.core.rate_limit import LocalBucketStore
+
+CAPACITY = 2
+REFILL = 1.0  # tokens per second
+
+
+def make_store(max_buckets: int = 3) -> LocalBucketStore:
+    return LocalBucketStore(shards=1, max_buckets_per_shard=max_buckets)
+
+
+def take(store: LocalBucketStore, key: str, now: float):
+    return store._take(key, CAPACITY, REFILL, now)
+
+
+def keys(store: LocalBucketStore) -> list:
+    return list(store._shards[0][1])
+
+
+def test_bucket_rejects_when_empty_and_refills():
+    store = make_store()
+
+    assert take(store, "a", 0.0) == (True, 0.0)
+    assert take(store, "a", 0.0) == (True, 0.0)
+    assert take(store, "a", 0.0) == (False, 1.0)
+    assert take(store, "a", 1.0) == (True, 0.0)
+
+
+def test_full_bucket_is_evicted_before_a_draining_one():
+    store = make_store(max_buckets=3)
+    take(store, "drained", 0.0)
+    take(store, "drained", 0.0)  # full again at 2.0
+    take(store, "light", 0.0)  # full again at 1.0
+    take(store, "other", 0.0)
+
+    # "drained" is least recently used, but still limited
+    take(store, "new", 1.5)
+
+    assert keys(store) == ["drained", "other", "new"]
+    assert store.evictions == 0
+    assert take(store, "drained", 1.5) == (True, 0.0)
+    assert take(store, "drained", 1.5) == (False, 0.5)
+
+
+def test_least_recently_used_is_evicted_when_every_bucket_is_draining():
+    store = make_store(max_buckets=2)
+    take(store, "a", 0.0)
+    take(store, "b", 0.0)
+
+    take(store, "c", 0.5)
+
+    assert keys(store) == ["b", "c"]
+    assert store.evictions == 1
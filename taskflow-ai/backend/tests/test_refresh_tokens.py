@@ -0,0 +1,59 @@
+"""
+TaskFlow AI - Refresh Token Tests
+
+Following Backend Template Epic 10: Testing
+- Refresh tokens rotate within their session; a used one is rejected
+- Tokens without a session are rejected instead of opening a new one
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.security import create_refresh_token, verify_token
+from app.db.database import create_tables
+
+PASSWORD = "Secret123!"
+
+
+@pytest.fixture
+def client():
+    import main
+
+    create_tables()
+    with TestClient(main.app) as client:
+        yield client
+
+
+def login(client: TestClient, email: str) -> dict:
+    response = client.post(
+        "/api/v1/auth/register",
+        json={"email": email, "password": PASSWORD, "confirm_password": PASSWORD},
+    )
+    assert response.status_code in (200, 201), response.text
+    response = client.post("/api/v1/auth/login", data={"username": email, "password": PASSWORD})
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def refresh(client: TestClient, token: str):
+    return client.post("/api/v1/auth/refresh", json={"refresh_token": token})
+
+
+def test_refresh_rotates_and_rejects_the_used_token(client):
+    first = login(client, "refresh-rotate@example.com")["refresh_token"]
+
+    response = refresh(client, first)
+    assert response.status_code == 200, response.text
+    second = response.json()["refresh_token"]
+
+    assert refresh(client, first).status_code == 401
+    # Reuse of an old token revoked the whole session
+    assert refresh(client, second).status_code == 401
+
+
+def test_refresh_token_without_session_is_rejected(client):
+    user_id = verify_token(login(client, "refresh-no-sid@example.com")["access_token"])["user_id"]
+    legacy = create_refresh_token({"sub": "refresh-no-sid@example.com", "user_id": user_id})
+
+    assert refresh(client, legacy).status_code == 401
+    assert refresh(client, legacy).status_code == 401
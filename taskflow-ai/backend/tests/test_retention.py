@@ -0,0 +1,172 @@
+"""
+TaskFlow AI - Data Retention Sweeper Tests
+
+Following Backend Template Epic 10: Testing
+- Expired login attempts, sessions and reset tokens purged in keyset batches
+- Per-table purge and batch counts in the sweep report
+- A sweep stops at max_runtime and the next one finishes the job
+- login_attempts falls back to batched deletes where it is not partitioned (SQLite)
+- A failing policy does not keep the others from running
+"""
+
+import asyncio
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import delete, func, insert, select
+
+from app.db.database import AsyncSessionLocal, Base, get_engine
+from app.models.user import LoginAttempt, PasswordResetToken, UserSession, login_attempt_partitions
+from app.services.retention import RetentionPolicy, RetentionSweeper, default_policies
+
+NOW = datetime(2026, 6, 1, tzinfo=timezone.utc)
+TABLES = (LoginAttempt, UserSession, PasswordResetToken)
+
+# Rows past retention, rows still kept
+EXPIRED = {"login_attempts": 23, "user_sessions": 12, "password_reset_tokens": 5}
+KEPT = {"login_attempts": 4, "user_sessions": 3, "password_reset_tokens": 2}
+
+
+def row(model, stamp: datetime, i: int) -> dict:
+    if model is LoginAttempt:
+        return {"id": uuid.uuid4(), "email": f"user{i}@example.com", "ip_address": "10.0.0.1",
+                "success": False, "attempted_at": stamp}
+    if model is UserSession:
+        return {"id": uuid.uuid4(), "user_id": uuid.uuid4(), "session_token": uuid.uuid4().hex, "expires_at": stamp}
+    return {"id": uuid.uuid4(), "user_id": uuid.uuid4(), "token_hash": uuid.uuid4().hex, "expires_at": stamp}
+
+
+@pytest.fixture(autouse=True)
+def seeded():
+    """Each table gets EXPIRED rows spread over the hours before its cutoff and KEPT rows after it"""
+    Base.metadata.create_all(bind=get_engine(), tables=[model.__table__ for model in TABLES])
+    cutoffs = {policy.model: policy.cutoff(NOW) for policy in default_policies()}
+
+    async def seed():
+        async with AsyncSessionLocal() as db:
+            for model in TABLES:
+                name = model.__tablename__
+                cutoff = cutoffs[model]
+                rows = [row(model, cutoff - timedelta(hours=i + 1), i) for i in range(EXPIRED[name])]
+                rows += [row(model, cutoff + timedelta(hours=i + 1), i) for i in range(KEPT[name])]
+                await db.execute(delete(model))
+                await db.execute(insert(model), rows)
+            await db.commit()
+
+    asyncio.run(seed())
+
+
+def make_sweeper(
+    batch_size: int = 5, batch_pause: float = 0.0, max_runtime: float = 60.0, policies=None
+) -> RetentionSweeper:
+    return RetentionSweeper(
+        policies=policies if policies is not None else default_policies(),
+        interval=3600.0,
+        batch_size=batch_size,
+        batch_pause=batch_pause,
+        max_runtime=max_runtime,
+    )
+
+
+async def counts() -> dict:
+    async with AsyncSessionLocal() as db:
+        return {model.__tablename__: await db.scalar(select(func.count()).select_from(model)) for model in TABLES}
+
+
+def test_sweep_purges_expired_rows_in_batches():
+    sweeper = make_sweeper(batch_size=5)
+
+    async def scenario():
+        return await sweeper.sweep(now=NOW), await counts()
+
+    report, remaining = asyncio.run(scenario())
+
+    tables = report["tables"]
+    assert {name: tables[name]["purged"] for name in EXPIRED} == EXPIRED
+    # ceil(rows / batch_size); a last full batch is followed by one empty read, not counted
+    assert {name: tables[name]["batches"] for name in EXPIRED} == {
+        "login_attempts": 5, "user_sessions": 3, "password_reset_tokens": 1,
+    }
+    assert all(tables[name]["complete"] for name in EXPIRED)
+    assert report["purged"] == sum(EXPIRED.values())
+    assert remaining == KEPT
+    assert sweeper.purged == EXPIRED
+    assert sweeper.last_error is None
+
+
+def test_second_sweep_finds_nothing():
+    sweeper = make_sweeper()
+
+    async def scenario():
+        await sweeper.sweep(now=NOW)
+        return await sweeper.sweep(now=NOW)
+
+    report = asyncio.run(scenario())
+
+    assert report["purged"] == 0
+    assert all(table["batches"] == 0 and table["complete"] for table in report["tables"].values())
+    assert sweeper.sweeps == 2
+
+
+def test_sweep_stops_at_max_runtime_and_the_next_one_finishes():
+    batch_pause = 0.05
+    sweeper = make_sweeper(batch_size=5, batch_pause=batch_pause, max_runtime=batch_pause * 2.5)
+
+    async def scenario():
+        return await sweeper.sweep(now=NOW), await counts()
+
+    report, remaining = asyncio.run(scenario())
+
+    login_attempts = report["tables"]["login_attempts"]
+    assert not login_attempts["complete"]
+    assert 0 < login_attempts["purged"] < EXPIRED["login_attempts"]
+    assert login_attempts["purged"] == login_attempts["batches"] * 5
+    # The deadline is shared, so the tables after it are not touched
+    sessions = report["tables"]["user_sessions"]
+    assert (sessions["purged"], sessions["batches"], sessions["complete"]) == (0, 0, False)
+    assert remaining["login_attempts"] == EXPIRED["login_attempts"] + KEPT["login_attempts"] - login_attempts["purged"]
+
+    finisher = make_sweeper(batch_size=5, batch_pause=batch_pause, max_runtime=60.0)
+    asyncio.run(finisher.sweep(now=NOW))
+
+    assert asyncio.run(counts()) == KEPT
+
+
+def test_unpartitioned_login_attempts_fall_back_to_batched_deletes():
+    sweeper = make_sweeper(batch_size=5)
+
+    async def scenario():
+        return await login_attempt_partitions.enabled(), await sweeper.sweep(now=NOW)
+
+    enabled, report = asyncio.run(scenario())
+
+    assert not enabled
+    login_attempts = report["tables"]["login_attempts"]
+    assert "partitions_dropped" not in login_attempts
+    assert (login_attempts["purged"], login_attempts["batches"]) == (EXPIRED["login_attempts"], 5)
+
+
+class BrokenPartitions:
+    async def enabled(self) -> bool:
+        raise RuntimeError("catalog unavailable")
+
+
+def test_failing_policy_does_not_stop_the_others():
+    broken = RetentionPolicy(
+        name="broken", model=LoginAttempt, column="attempted_at", retention=timedelta(days=1),
+        partitions=BrokenPartitions(),
+    )
+    sweeper = make_sweeper(policies=[broken] + default_policies())
+
+    report = asyncio.run(sweeper.sweep(now=NOW))
+
+    assert report["tables"]["broken"]["error"] == "catalog unavailable"
+    assert not report["tables"]["broken"]["complete"]
+    assert {name: report["tables"][name]["purged"] for name in EXPIRED} == EXPIRED
+    assert sweeper.last_error == "broken: catalog unavailable"
+
+    # The error clears once every policy succeeds again
+    sweeper.policies = default_policies()
+    asyncio.run(sweeper.sweep(now=NOW))
+    assert sweeper.last_error is None
@@ -0,0 +1,29 @@
+"""
+TaskFlow AI - Startup Import Budget Tests
+
+Following Backend Template Epic 10: Testing
+- import main stays under the startup time budget
+- Heavy optional dependencies and the database engines are not created at import
+"""
+
+import os
+import statistics
+
+from benchmarks.bench_startup import DEFAULT_BUDGET_MS, DEFERRED_ENGINES, DEFERRED_MODULES, probe
+
+# Override on slow CI machines
+BUDGET_MS = float(os.environ.get("STARTUP_BUDGET_MS", DEFAULT_BUDGET_MS))
+RUNS = 3
+
+
+def test_main_import_does_not_load_deferred_modules():
+    _, loaded, _ = probe("main", profile=False)
+
+    deferred = set(DEFERRED_MODULES) | {f"app.db.database.{name}" for name in DEFERRED_ENGINES}
+    assert not deferred & set(loaded), f"loaded at import: {loaded}"
+
+
+def test_main_import_is_under_budget():
+    runs = [probe("main", profile=False)[0] * 1000 for _ in range(RUNS)]
+
+    assert statistics.median(runs) < BUDGET_MS, f"import main took {runs} ms (budget {BUDGET_MS:.0f} ms)"